@@ -0,0 +1,76 @@
+"""
+Benchmark of fused disk marching against the solution of each disk element on its own.
+
+Solves a transport with many disk elements once with its disk elements solved one after another and once with
+``Config.FUSED_DISK_MARCHING``, and reports the wall times, the thermal step solutions and the deviation of the
+outgoing ring temperatures. The gain of fused marching is mostly in skipping the solution loops of the disk elements,
+which evaluate all root hooks of the disk element profiles in each iteration.
+
+Usage::
+
+    python benchmarks/fused_marching.py
+    python benchmarks/fused_marching.py --disk-element-counts 50 200 1000 --repeat 5
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "tests"))
+
+from conftest import create_round_profile  # noqa: E402
+
+
+def solve(disk_element_count: int, fused: bool):
+    from pyroll.core import Transport
+    from pyroll.ring_model_thermal import Config
+
+    old_fused = Config.FUSED_DISK_MARCHING
+    Config.FUSED_DISK_MARCHING = fused
+
+    try:
+        in_profile = create_round_profile()
+        transport = Transport(duration=65, disk_element_count=disk_element_count, environment_temperature=293)
+
+        start = time.perf_counter()
+        transport.solve(in_profile)
+        return time.perf_counter() - start, transport
+    finally:
+        Config.FUSED_DISK_MARCHING = old_fused
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--disk-element-counts", nargs="+", type=int, default=[20, 200])
+    parser.add_argument("--repeat", type=int, default=3, help="runs per case for timing")
+    args = parser.parse_args(argv)
+
+    if args.repeat < 1:
+        parser.error("--repeat must be at least 1")
+
+    for disk_element_count in args.disk_element_counts:
+        results = {}
+
+        for fused in [False, True]:
+            runs = [solve(disk_element_count, fused) for _ in range(args.repeat)]
+            results[fused] = min(w for w, _ in runs), runs[-1][1]
+
+        (separate_time, separate), (fused_time, fused) = results[False], results[True]
+        deviation = np.max(np.abs(fused.out_profile.ring_temperatures - separate.out_profile.ring_temperatures))
+
+        print(
+            f"disks={disk_element_count:<6} separate {separate_time:8.3f} s "
+            f"({separate.thermal_solver_stats.solves:6d} steps)   fused {fused_time:8.3f} s "
+            f"({fused.thermal_solver_stats.solves:6d} steps)   speedup {separate_time / fused_time:6.1f}   "
+            f"deviation {deviation:.3f} K",
+            flush=True,
+        )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
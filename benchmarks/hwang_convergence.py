@@ -0,0 +1,153 @@
+"""
+Accuracy versus cost study of the thermal ring model on the Hwang comparison case.
+
+Solves the sequence of ``tests/test_compare_with_hwang_values.py`` for a grid of ring counts, disk element counts
+and solver backends. For each combination it reports the maximum deviation of the calculated surface and core
+temperatures from the reference curves in ``tests/hwang_data`` together with the wall time. It then prints the
+Pareto frontier of error against wall time and the cheapest combination within the tolerance.
+
+The discretisation error alone, i.e. the deviation from the finest combination of the grid,
+is reported as well and can be used for the frontier by ``--against finest``.
+
+Usage::
+
+    python benchmarks/hwang_convergence.py
+    python benchmarks/hwang_convergence.py --ring-counts 5 10 --disk-element-counts 5 10 20 --solvers banded_newton
+"""
+
+import argparse
+import csv
+import itertools
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from mill_models import TESTS, load_scenario, solve  # noqa: E402
+
+HWANG_DATA = TESTS / "hwang_data"
+
+
+def curves(scenario, sequence):
+    """Time, surface and core temperatures in °C along the disk elements of the solved sequence."""
+    t = np.array(list(scenario.yield_data_from_profiles(sequence, "t")))
+    surface = np.array(list(scenario.yield_data_from_profiles(sequence, "surface_temperature"))) - 273.15
+    core = np.array(list(scenario.yield_data_from_profiles(sequence, "core_temperature"))) - 273.15
+
+    valid = np.diff(t) >= 0
+    return t[1:][valid], surface[1:][valid], core[1:][valid]
+
+
+def reference_curves():
+    surface = pd.read_csv(HWANG_DATA / "surface_temperature_hwang.csv")
+    core = pd.read_csv(HWANG_DATA / "core_temperature_hwang.csv")
+    return (surface.time.values, surface.surface_temperature.values), (core.time.values, core.core_temperature.values)
+
+
+def max_deviation(t, surface, core, reference) -> float:
+    """Maximum absolute deviation in K of the surface and core curves at the times of the reference curves."""
+    (t_surface, surface_reference), (t_core, core_reference) = reference
+    return max(
+        np.max(np.abs(np.interp(t_surface, t, surface) - surface_reference)),
+        np.max(np.abs(np.interp(t_core, t, core) - core_reference)),
+    )
+
+
+def pareto_frontier(results: list, error: str) -> list:
+    """The results not dominated in wall time and error by another one, sorted by wall time."""
+    frontier = []
+
+    for r in sorted(results, key=lambda r: (r["wall_time"], r[error])):
+        if not frontier or r[error] < frontier[-1][error]:
+            frontier.append(r)
+
+    return frontier
+
+
+def main(argv=None) -> int:
+    from pyroll.ring_model_thermal import Config
+    from pyroll.ring_model_thermal.solvers import SOLVERS
+
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--ring-counts", nargs="+", type=int, default=[5, 10, 20, 40])
+    parser.add_argument("--disk-element-counts", nargs="+", type=int, default=[5, 10, 20, 50])
+    parser.add_argument("--solvers", nargs="+", choices=list(SOLVERS), default=list(SOLVERS))
+    parser.add_argument("--tolerance", type=float, default=5, help="admissible error in K")
+    parser.add_argument("--against", choices=["reference", "finest"], default="reference",
+                        help="error used for the frontier: against the Hwang curves or the finest combination")
+    parser.add_argument("--csv", type=Path, help="file to write all results to")
+    args = parser.parse_args(argv)
+
+    scenario = load_scenario("hwang")
+    reference = reference_curves()
+    results = []
+    old_solver = Config.THERMAL_SOLVER
+
+    try:
+        for solver, ring_count, disk_element_count in itertools.product(
+                args.solvers, args.ring_counts, args.disk_element_counts
+        ):
+            Config.THERMAL_SOLVER = solver
+            try:
+                wall_time, sequence = solve(scenario, ring_count, disk_element_count)
+            except RuntimeError as e:
+                print(f"{solver:<16} rings={ring_count:<4} disks={disk_element_count:<4} failed: {e}", flush=True)
+                continue
+
+            t, surface, core = curves(scenario, sequence)
+            results.append(dict(
+                solver=solver, ring_count=ring_count, disk_element_count=disk_element_count, wall_time=wall_time,
+                reference=max_deviation(t, surface, core, reference), curves=(t, surface, core),
+            ))
+            r = results[-1]
+            print(
+                f"{solver:<16} rings={ring_count:<4} disks={disk_element_count:<4} "
+                f"{wall_time:8.3f} s {r['reference']:8.2f} K against reference",
+                flush=True,
+            )
+    finally:
+        Config.THERMAL_SOLVER = old_solver
+
+    if not results:
+        return 1
+
+    finest = max(results, key=lambda r: (r["ring_count"] * r["disk_element_count"], r["wall_time"]))
+    t, surface, core = finest["curves"]
+    for r in results:
+        r["finest"] = max_deviation(*r.pop("curves"), ((t, surface), (t, core)))
+
+    print(
+        f"\nPareto frontier of wall time and error against {args.against} "
+        f"(finest: {finest['solver']}, rings={finest['ring_count']}, disks={finest['disk_element_count']}):"
+    )
+    frontier = pareto_frontier(results, args.against)
+    for r in frontier:
+        print(
+            f"{r['solver']:<16} rings={r['ring_count']:<4} disks={r['disk_element_count']:<4} "
+            f"{r['wall_time']:8.3f} s {r['reference']:8.2f} K against reference {r['finest']:8.2f} K against finest"
+        )
+
+    admissible = [r for r in frontier if r[args.against] <= args.tolerance]
+    if admissible:
+        r = admissible[0]
+        print(
+            f"\nCheapest within ±{args.tolerance} K: {r['solver']}, "
+            f"rings={r['ring_count']}, disks={r['disk_element_count']} ({r['wall_time']:.3f} s)"
+        )
+    else:
+        print(f"\nNo combination within ±{args.tolerance} K.")
+
+    if args.csv:
+        with args.csv.open("w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=list(results[0]))
+            writer.writeheader()
+            writer.writerows(results)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,218 @@
+"""
+Benchmarks of the thermal ring model on the mill models of the test suite.
+
+Solves the finishing block, the Hwang comparison and the IMF semi-continuous 8 mm sequence headless
+for a grid of ring counts and disk element counts and tracks wall time, peak memory and residual evaluations.
+The results can be stored as baseline and later runs are compared against it, flagging regressions,
+so that slow-downs due to updates of PyRolL core or other plugins are noticed.
+
+Usage::
+
+    python benchmarks/mill_models.py --save          # store a baseline
+    python benchmarks/mill_models.py                 # compare against the baseline
+    python benchmarks/mill_models.py --scenarios hwang --ring-counts 10 --disk-element-counts 10 20
+
+The process exits with code 1 if a regression was flagged.
+"""
+
+import argparse
+import importlib.metadata
+import importlib.util
+import itertools
+import json
+import multiprocessing
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+ROOT = Path(__file__).parent.parent
+TESTS = ROOT / "tests"
+DEFAULT_BASELINE = Path(__file__).parent / "baseline.json"
+
+SCENARIOS = {
+    "finishing_block": "test_solve_finishing_block",
+    "hwang": "test_compare_with_hwang_values",
+    "imf_semi_continuous_8_mm": "test_solve_imf_semi_continuous_8_mm",
+}
+"""Benchmark scenarios and the test modules providing ``create_in_profile`` and ``create_sequence``."""
+
+METRICS = ["wall_time", "peak_memory", "function_evaluations"]
+"""Metrics compared against the baseline, larger values are worse for all of them."""
+
+PACKAGES = ["pyroll-core", "pyroll-ring-model", "pyroll-ring-model-thermal"]
+
+
+def load_scenario(name: str):
+    """
+    Load the test module of a scenario.
+    Executing it registers its hook implementations globally, so load only one scenario per process,
+    see :py:func:`run_scenario`.
+    """
+    module_name = SCENARIOS[name]
+    spec = importlib.util.spec_from_file_location(module_name, TESTS / f"{module_name}.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def solve(scenario, ring_count: int, disk_element_count: int):
+    from pyroll.ring_model import Config
+
+    old_ring_count = Config.RING_COUNT
+    Config.RING_COUNT = ring_count
+
+    try:
+        in_profile = scenario.create_in_profile()
+        sequence = scenario.create_sequence(disk_element_count=disk_element_count)
+
+        start = time.perf_counter()
+        sequence.solve(in_profile)
+        return time.perf_counter() - start, sequence
+    finally:
+        Config.RING_COUNT = old_ring_count
+
+
+def run_case(scenario, ring_count: int, disk_element_count: int, repeat: int) -> dict:
+    """Run one case, taking the minimum wall time of ``repeat`` runs and the peak memory of an extra traced run."""
+    if repeat < 1:
+        raise ValueError("At least one run per case is required for timing.")
+
+    wall_times = [solve(scenario, ring_count, disk_element_count)[0] for _ in range(repeat)]
+
+    tracemalloc.start()
+    try:
+        _, sequence = solve(scenario, ring_count, disk_element_count)
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    stats = sequence.thermal_solver_stats
+
+    return dict(
+        wall_time=min(wall_times),
+        peak_memory=peak_memory,
+        function_evaluations=stats.function_evaluations,
+        iterations=stats.iterations,
+        solves=stats.solves,
+        failures=stats.failures,
+    )
+
+
+def run_scenario(name: str, ring_counts: list, disk_element_counts: list, repeat: int) -> dict:
+    """Run all cases of a scenario, meant to be called in a fresh process per scenario,
+    so that the hook implementations of its test module do not affect the other scenarios."""
+    import pyroll.ring_model_thermal
+
+    scenario = load_scenario(name)
+    results = {}
+
+    for ring_count, disk_element_count in itertools.product(ring_counts, disk_element_counts):
+        key = case_key(name, ring_count, disk_element_count)
+        results[key] = r = run_case(scenario, ring_count, disk_element_count, repeat)
+        print(
+            f"{key:<55} {r['wall_time']:9.3f} s {r['peak_memory'] / 2 ** 20:9.1f} MiB "
+            f"{r['function_evaluations']:9d} evaluations {r['failures']:3d} failures",
+            flush=True,
+        )
+
+    return results
+
+
+def versions() -> dict:
+    result = {"python": sys.version.split()[0]}
+    for p in PACKAGES:
+        try:
+            result[p] = importlib.metadata.version(p)
+        except importlib.metadata.PackageNotFoundError:
+            result[p] = None
+    return result
+
+
+def case_key(scenario: str, ring_count: int, disk_element_count: int) -> str:
+    return f"{scenario}[rings={ring_count},disks={disk_element_count}]"
+
+
+def compare(results: dict, baseline: dict, tolerances: dict) -> list:
+    """Return the messages for all metrics exceeding their baseline value by more than the relative tolerance."""
+    regressions = []
+
+    for key, result in results.items():
+        if key not in baseline:
+            continue
+
+        for metric in METRICS:
+            reference = baseline[key][metric]
+            if reference > 0 and result[metric] > reference * (1 + tolerances[metric]):
+                regressions.append(
+                    f"{key} {metric}: {result[metric]:.4g} vs. baseline {reference:.4g} "
+                    f"(+{result[metric] / reference - 1:.0%})"
+                )
+
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--scenarios", nargs="+", choices=list(SCENARIOS), default=list(SCENARIOS))
+    parser.add_argument("--ring-counts", nargs="+", type=int, default=[10, 20])
+    parser.add_argument("--disk-element-counts", nargs="+", type=int, default=[10, 20, 30])
+    parser.add_argument("--repeat", type=int, default=3, help="runs per case for timing")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--save", action="store_true", help="store the results as baseline instead of comparing")
+    parser.add_argument("--time-tolerance", type=float, default=0.2)
+    parser.add_argument("--memory-tolerance", type=float, default=0.1)
+    parser.add_argument("--evaluations-tolerance", type=float, default=0.05)
+    args = parser.parse_args(argv)
+
+    if args.repeat < 1:
+        parser.error("--repeat must be at least 1")
+
+    results = {}
+
+    # one fresh process per scenario, since loading a scenario registers hook implementations globally
+    context = multiprocessing.get_context("spawn")
+
+    for name in args.scenarios:
+        with context.Pool(1) as pool:
+            results.update(pool.apply(
+                run_scenario, (name, args.ring_counts, args.disk_element_counts, args.repeat)
+            ))
+
+    if args.save:
+        baseline = json.loads(args.baseline.read_text()) if args.baseline.exists() else {"results": {}}
+        baseline["versions"] = versions()
+        baseline["results"].update(results)
+        args.baseline.write_text(json.dumps(baseline, indent=2))
+        print(f"Baseline written to {args.baseline}.")
+        return 0
+
+    if not args.baseline.exists():
+        print(f"No baseline found at {args.baseline}, run with --save to create one.")
+        return 0
+
+    baseline = json.loads(args.baseline.read_text())
+    regressions = compare(
+        results, baseline["results"],
+        dict(
+            wall_time=args.time_tolerance,
+            peak_memory=args.memory_tolerance,
+            function_evaluations=args.evaluations_tolerance,
+        ),
+    )
+
+    if baseline.get("versions") != versions():
+        print(f"Baseline versions: {baseline.get('versions')}, current versions: {versions()}")
+
+    for r in regressions:
+        print(f"REGRESSION {r}")
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,10 +1,21 @@
 VERSION = "3.0.2"
 
 from . import profile
+from . import unit
 from . import roll_pass
 from . import transport
 from . import cooling_pipe
+from . import retention
+from . import history
+from . import incremental
 from .config import Config
+from .ensemble import solve_ensemble, EnsembleResult
+from .history import ThermalHistory
+from .export import export_thermal_history, open_thermal_history
+from .parallel import solve_variants, parameter_grid, VariantResults
+from .step_cache import step_cache_info, clear_step_cache
+from .incremental import changed_units, resolve_downstream
+from .sensitivity import temperature_sensitivities, TemperatureSensitivities
 
 from pyroll.core import root_hooks, Unit
 
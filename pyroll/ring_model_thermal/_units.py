@@ -0,0 +1,49 @@
+from typing import Callable, Dict, Iterator, Optional, Tuple
+
+from pyroll.core import Unit, PassSequence, DiskElementUnit
+
+from .kernel import RingSystem
+
+STEP_SYSTEMS: Dict[type, Callable[[Unit, Unit], Tuple[RingSystem, bool]]] = {}
+"""Functions yielding the ring system of a time step of a unit or disk element (first argument)
+within a unit (second argument) and whether the surface temperature of the step is taken from its in profile
+instead of being balanced with its out state, registered per unit type."""
+
+
+def register_step_system(unit_type: type):
+    """Decorator for adding a function to :py:data:`STEP_SYSTEMS`."""
+
+    def dec(func):
+        STEP_SYSTEMS[unit_type] = func
+        return func
+
+    return dec
+
+
+def step_system_factory(parent: Unit) -> Optional[Callable[[Unit, Unit], Tuple[RingSystem, bool]]]:
+    """The function of :py:data:`STEP_SYSTEMS` registered for the type of ``parent`` or its closest base, if any."""
+    for cls in type(parent).__mro__:
+        if cls in STEP_SYSTEMS:
+            return STEP_SYSTEMS[cls]
+
+    return None
+
+
+def yield_leaf_units(unit: Unit) -> Iterator[Unit]:
+    """The units within ``unit`` that are no pass sequences, in process order."""
+    if isinstance(unit, PassSequence):
+        for u in unit.units:
+            yield from yield_leaf_units(u)
+    else:
+        yield unit
+
+
+def yield_steps(unit: Unit) -> Iterator[Tuple[Unit, Unit]]:
+    """The units representing the thermal steps (disk elements or leaf units without disk elements)
+    in process order, together with their leaf unit."""
+    for u in yield_leaf_units(unit):
+        if isinstance(u, DiskElementUnit) and u.disk_elements:
+            for d in u.disk_elements:
+                yield d, u
+        else:
+            yield u, u
@@ -8,3 +8,89 @@ class Config:
 
     ROLL_PASS_ATMOSPHERE_TRANSFER = True
     """Whether to include the heat transfer to atmosphere at free surfaces in roll passes into the calculation."""
+
+    THERMAL_SOLVER = "hybr"
+    """Default backend for the thermal time steps, one of the keys in ``solvers.SOLVERS``:
+    ``"hybr"`` (scipy's hybrid method with dense finite-difference Jacobian),
+    ``"banded_newton"`` (implicit Euler by Newton iteration using the analytic tridiagonal Jacobian),
+    ``"crank_nicolson"`` (trapezoidal rule by Newton iteration),
+    ``"explicit"`` (explicit Euler, sub-cycled to be stable) or
+    ``"exponential"`` (exponential integrator with cached propagators, exact for the linear conduction).
+    Can be overridden per unit by the ``thermal_solver`` hook."""
+
+    THERMAL_SOLVER_ABSOLUTE_TOLERANCE = 1e-6
+    """Default absolute tolerance of the step residual in temperature units (not used by ``"hybr"``)."""
+
+    THERMAL_SOLVER_RELATIVE_TOLERANCE = 1.49012e-08
+    """Default relative tolerance of the thermal step solution."""
+
+    THERMAL_SOLVER_MAX_ITERATIONS = 200
+    """Default maximum count of iterations (Newton iterations, explicit sub-steps or function evaluations per
+    unknown for ``"hybr"``) of the thermal step solution."""
+
+    THERMAL_SOLVER_WARM_START = True
+    """Whether to start the thermal step solution from the last solution of the same unit or,
+    for disk elements, from the solution of the previous disk element scaled by the duration ratio,
+    instead of the explicit Euler increments."""
+
+    FUSED_DISK_MARCHING = False
+    """Whether transports and cooling pipes march all their disk elements in one loop over preassembled arrays
+    instead of solving each disk element on its own. The disk profiles are filled from the result afterward,
+    without running the solution loops of the disk elements, so hooks of other plugins are not evaluated for them.
+    The boundary conditions are taken from the parent unit, so disk specific heat transfer coefficients are ignored."""
+
+    SURFACE_TEMPERATURE_COUPLING = False
+    """Whether to solve the surface temperature as additional unknown of the thermal time steps,
+    with the heat balance at the surface as additional equation.
+    Otherwise, the surface temperature of the last iteration is used as boundary condition of the step.
+    Applies to transports and cooling pipes only, roll passes keep the surface temperature of their in profile
+    as boundary condition in both cases, so that the option changes the solution procedure, not the model."""
+
+    ADAPTIVE_TIME_STEPPING = False
+    """Whether transports and cooling pipes are solved by adaptive sub-steps with error control by step doubling
+    instead of one step per disk element. The temperatures are reported at the disk element boundaries,
+    so the disk element count only determines the output resolution.
+    The boundary conditions are taken from the parent unit as for :py:attr:`FUSED_DISK_MARCHING`."""
+
+    ADAPTIVE_TIME_STEPPING_TOLERANCE = 0.1
+    """Tolerance of the estimated local error of the ring temperatures per adaptive sub-step in K."""
+
+    EXPONENTIAL_PROPAGATOR_CACHE_SIZE = 128
+    """Maximum count of propagator matrices kept by the ``"exponential"`` thermal solver backend."""
+
+    THERMAL_HISTORY = False
+    """Whether to collect the columnar ``thermal_history`` of root units (like pass sequences) right after their
+    solution, before disk element profiles are released according to :py:attr:`DISK_PROFILE_RETENTION`.
+    In both cases the history is reconstructed post hoc by a walk over the solved unit tree, not recorded during
+    the solution, so it is disabled by default to not add that walk to every solution.
+    Otherwise, it is collected when requested, for released disk element profiles from the
+    ``ring_temperature_history`` kept by the ``"history"`` policy only."""
+
+    DISK_PROFILE_RETENTION = "all"
+    """Which profiles are kept after solution of a unit with disk elements:
+    ``"all"`` keeps the profiles of all disk elements,
+    ``"boundaries"`` releases the disk element profiles, keeping only the in and out profiles of the unit itself, and
+    ``"history"`` releases them as well, but keeps the compact ``ring_temperature_history`` of the unit
+    for plotting. Hooks of released profiles are not available anymore."""
+
+    STEP_CACHE = False
+    """Whether to cache the solutions of thermal time steps solved one by one, keyed on the ring geometry, duration,
+    material and boundary parameters of the step, the solver settings and the incoming temperatures.
+    Steps repeated with identical inputs, as in semi-continuous mill studies, then skip the nonlinear solve."""
+
+    STEP_CACHE_SIZE = 4096
+    """Maximum count of step solutions kept by the step cache, the least recently used are evicted."""
+
+    STEP_CACHE_TEMPERATURE_QUANTUM = 0
+    """Resolution in K to which the incoming temperatures are rounded in the keys of the step cache,
+    so that nearly identical temperatures share a cached solution. Zero requires exactly identical temperatures.
+    The cached increments are added to the actual incoming temperatures."""
+
+    STEP_CACHE_PATH = ""
+    """Path of an SQLite database persisting the step cache across runs, empty to keep it in memory only.
+    The database can be shared by several processes at once. Its entries are keyed on the plugin version and the
+    solver version ``step_cache.SOLVER_VERSION`` as well, so that results of other versions are not reused."""
+
+    STEP_CACHE_PERSISTENT_SIZE = 1_000_000
+    """Maximum count of step solutions kept in the database at :py:attr:`STEP_CACHE_PATH`,
+    the least recently used are evicted periodically, see ``step_cache.EVICTION_INTERVAL``."""
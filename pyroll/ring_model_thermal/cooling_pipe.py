@@ -1,9 +1,13 @@
 import numpy as np
-import scipy.optimize as scopt
 
-from typing import Union
+from typing import Union, Tuple, Callable, Dict
 from .config import Config
+from .incremental import register_thermal_inputs
+from .kernel import RingSystem
 from .profile import Profile
+from ._units import register_step_system
+from .solvers import solve_ring_system, fused_march, fill_disk_profiles
+from .surface import register_surface_balance, memoized_surface_temperature
 from pyroll.core import CoolingPipe, Unit, Hook, Transport
 
 
@@ -31,61 +35,110 @@ def heat_transfer_coefficient(self: CoolingPipe.DiskElement):
     return self.cooling_pipe.heat_transfer_coefficient
 
 
-def get_increments(unit: Unit, cooling_pipe: CoolingPipeExt, ring_temperatures) -> np.ndarray:
-    p: Profile = unit.out_profile
+def _heat_flux(
+        heat_transfer_coefficient: float, coolant_temperature: float, radiation_temperature: float,
+        radiation_coefficient: float
+) -> Tuple[Callable, Callable]:
+    """Heat flux density by convection to the coolant and by radiation and its derivative
+    as functions of the surface temperature."""
+
+    def flux(ts):
+        return (
+                heat_transfer_coefficient * (coolant_temperature - ts)
+                + radiation_coefficient * (radiation_temperature ** 4 - ts ** 4)
+        )
 
-    increments = np.zeros_like(ring_temperatures)
+    def derivative(ts):
+        return -4 * radiation_coefficient * ts ** 3 - heat_transfer_coefficient
 
-    cross_section = p.ring_sections[0].area
-    increments[0] = unit.duration / (p.density * p.specific_heat_capacity * cross_section) * (
-            (ring_temperatures[1] - ring_temperatures[0]) * p.ring_contours[1].length
-            / p.rings[1] * p.thermal_conductivity
+    return flux, derivative
+
+
+def _boundary_parameters(cooling_pipe: CoolingPipeExt, unit: Unit, p: Profile) -> Dict[str, float]:
+    """Parameters of the heat flux density entering through the surface."""
+    return dict(
+        heat_transfer_coefficient=unit.heat_transfer_coefficient,
+        coolant_temperature=cooling_pipe.coolant_temperature,
+        radiation_temperature=cooling_pipe.coolant_temperature,
+        radiation_coefficient=Config.RADIATION_COEFFICIENT * p.relative_radiation_coefficient,
     )
 
-    cross_section = p.ring_sections[-1].area
-    increments[-1] = unit.duration / (p.density * p.specific_heat_capacity * cross_section) * (
-            (
-                    unit.heat_transfer_coefficient
-                    * (cooling_pipe.coolant_temperature - p.surface_temperature)
-                    + Config.RADIATION_COEFFICIENT * p.relative_radiation_coefficient
-                    * (cooling_pipe.coolant_temperature ** 4 - p.surface_temperature ** 4)
-            )
-            * p.ring_contours[-1].length
-            - p.thermal_conductivity * (ring_temperatures[-1] - ring_temperatures[-2])
-            / (p.rings[-1] - p.rings[-2])
-            * p.ring_contours[-2].length
 
+def _balance_parameters(cooling_pipe: CoolingPipeExt, p: Profile) -> Dict[str, float]:
+    return dict(
+        heat_transfer_coefficient=cooling_pipe.heat_transfer_coefficient,
+        coolant_temperature=cooling_pipe.coolant_temperature,
+        radiation_temperature=cooling_pipe.environment_temperature,
+        radiation_coefficient=Config.RADIATION_COEFFICIENT * p.relative_radiation_coefficient,
     )
 
-    for i in range(1, len(increments) - 1):
-        cross_section = p.ring_sections[i].area
-        increments[i] = unit.duration / (p.density * p.specific_heat_capacity * cross_section) * (
-                p.thermal_conductivity
-                * (
-                        (ring_temperatures[i + 1] - ring_temperatures[i]) * p.ring_contours[i + 1].length
-                        / (p.rings[i + 1] - p.rings[i])
-                        - (ring_temperatures[i] - ring_temperatures[i - 1]) * p.ring_contours[i].length
-                        / (p.rings[i] - p.rings[i - 1])
-                )
 
-        )
+register_thermal_inputs(CoolingPipe, [
+    "duration", "coolant_temperature", "environment_temperature", "heat_transfer_coefficient", "disk_element_count"
+])
+
 
-    return increments
+@register_surface_balance(CoolingPipe)
+def _surface_balance(cooling_pipe: CoolingPipeExt, p: Profile):
+    return _balance_parameters(cooling_pipe, p), _heat_flux
+
+
+def _ring_system(unit: Unit, cooling_pipe: CoolingPipeExt, p: Profile) -> RingSystem:
+    boundary_parameters = _boundary_parameters(cooling_pipe, unit, p)
+    balance_parameters = _balance_parameters(cooling_pipe, p)
+    surface_heat_flux, surface_heat_flux_derivative = _heat_flux(**boundary_parameters)
+    surface_balance_flux, surface_balance_flux_derivative = _heat_flux(**balance_parameters)
+
+    return RingSystem(
+        duration=unit.duration,
+        density=p.density,
+        specific_heat_capacity=p.specific_heat_capacity,
+        thermal_conductivity=p.thermal_conductivity,
+        geometry=p.ring_geometry,
+        surface_heat_flux=surface_heat_flux,
+        surface_heat_flux_derivative=surface_heat_flux_derivative,
+        surface_balance_flux=surface_balance_flux,
+        surface_balance_flux_derivative=surface_balance_flux_derivative,
+        boundary_parameters=boundary_parameters,
+        balance_parameters=balance_parameters,
+        flux_factory=_heat_flux,
+    )
+
+
+@register_step_system(CoolingPipe)
+def _step_system(unit: Unit, cooling_pipe: CoolingPipeExt) -> Tuple[RingSystem, bool]:
+    return _ring_system(unit, cooling_pipe, unit.out_profile), False
 
 
 def _solve_step(unit, cooling_pipe, in_ring_temperatures):
-    x0 = get_increments(unit, cooling_pipe, in_ring_temperatures)
+    p: Profile = unit.out_profile
+    system = _ring_system(unit, cooling_pipe, p)
 
-    def f(x):
-        out_ring_temperatures = in_ring_temperatures + x
-        return get_increments(unit, cooling_pipe, out_ring_temperatures) - x
+    if Config.SURFACE_TEMPERATURE_COUPLING:
+        surface_temperature = unit.in_profile.surface_temperature
+    else:
+        surface_temperature = p.surface_temperature
 
-    sol = scopt.root(f, x0=x0)
+    ring_temperatures, _ = solve_ring_system(unit, system, in_ring_temperatures, surface_temperature)
+    return ring_temperatures
 
-    if not sol.success:
-        raise RuntimeError(f"Numerical procedure did not succeed: {sol.message}.")
 
-    return in_ring_temperatures + sol.x
+def _fused_march(cooling_pipe: CoolingPipeExt) -> np.ndarray:
+    p: Profile = cooling_pipe.in_profile
+    return fused_march(
+        cooling_pipe, _ring_system(cooling_pipe, cooling_pipe, p), p.ring_temperatures, p.surface_temperature
+    )
+
+
+def _solve_subunits(self: CoolingPipeExt):
+    if self.disk_elements and (Config.FUSED_DISK_MARCHING or Config.ADAPTIVE_TIME_STEPPING):
+        fill_disk_profiles(self, _fused_march(self))
+    else:
+        Unit._solve_subunits(self)
+
+
+# march the disk elements in one go instead of solving them one after another, if enabled
+CoolingPipe._solve_subunits = _solve_subunits
 
 
 @CoolingPipe.OutProfile.ring_temperatures
@@ -93,6 +146,9 @@ def ring_temperatures_disk(self: Union[CoolingPipe.OutProfile, Profile]):
     if not self.cooling_pipe.disk_elements:
         cooling_pipe = self.cooling_pipe
 
+        if Config.ADAPTIVE_TIME_STEPPING:
+            return _fused_march(cooling_pipe)[-1]
+
         return _solve_step(cooling_pipe, cooling_pipe, cooling_pipe.in_profile.ring_temperatures)
 
 
@@ -105,29 +161,7 @@ def ring_temperatures_disk(self: Union[CoolingPipe.DiskElement.OutProfile, Profi
 
 
 def _surface_temperature(self: Union[CoolingPipe.Profile, Profile]):
-    cooling_pipe: CoolingPipeExt = self.cooling_pipe
-
-    def f(ts):
-
-        heat_transfer_term = cooling_pipe.heat_transfer_coefficient * (cooling_pipe.coolant_temperature - ts)
-        radiation_term = Config.RADIATION_COEFFICIENT * self.relative_radiation_coefficient * (cooling_pipe.environment_temperature ** 4 - ts ** 4)
-        conduction_term_to_most_outer_ring = self.thermal_conductivity * (ts - self.ring_temperatures[-1]) / (self.equivalent_radius - self.rings[-1])
-
-
-        return heat_transfer_term + radiation_term - conduction_term_to_most_outer_ring
-
-    def fprime(ts):
-        return (
-                -4 * Config.RADIATION_COEFFICIENT * self.relative_radiation_coefficient
-                * ts ** 3
-                - cooling_pipe.heat_transfer_coefficient
-                - self.thermal_conductivity / (self.equivalent_radius - self.rings[-1])
-        )
-
-    sol = scopt.root_scalar(f=f, fprime=fprime, x0=self.ring_temperatures[-1], method="newton")
-
-    if sol.converged:
-        return sol.root
+    return memoized_surface_temperature(self)
 
 
 @CoolingPipe.Profile.surface_temperature
@@ -0,0 +1,250 @@
+import numpy as np
+
+from dataclasses import dataclass
+from typing import Dict, List, Mapping, Optional, Tuple, Union
+
+from pyroll.core import Unit, DiskElementUnit
+
+from ._units import step_system_factory, yield_steps
+from .kernel import RingSystem
+from .solvers import newton_banded_batched
+
+ParameterKey = Union[str, Tuple[Union[type, str], str]]
+"""Key of per scenario parameters of :py:func:`solve_ensemble`, either a hook name applying to all units having
+that hook, or a pair of a unit type or label and a hook name applying only to units of that type (including
+subclasses, so transports include cooling pipes) or label,
+like ``(Transport, "heat_transfer_coefficient")`` or ``("CP", "coolant_temperature")``."""
+
+
+@dataclass
+class EnsembleResult:
+    """Ring and surface temperatures of all scenarios of an ensemble after each thermal step."""
+
+    units: List[Unit]
+    """The units representing the thermal steps (disk elements or units without disk elements) in order."""
+
+    ring_temperatures: np.ndarray
+    """Ring temperatures of shape ``(len(units) + 1, scenarios, rings)``, starting with the entry state."""
+
+    surface_temperatures: np.ndarray
+    """Surface temperatures of shape ``(len(units) + 1, scenarios)``,
+    starting with the entry state, for which the most outer ring temperatures are taken."""
+
+    success: np.ndarray
+    """Mask of the scenarios that converged in all steps, the temperatures of the others are NaN."""
+
+    iterations: np.ndarray
+    """Total count of Newton iterations spent per scenario."""
+
+    @property
+    def out_ring_temperatures(self) -> np.ndarray:
+        """Ring temperatures of all scenarios after the last step."""
+        return self.ring_temperatures[-1]
+
+    @property
+    def out_surface_temperatures(self) -> np.ndarray:
+        """Surface temperatures of all scenarios after the last step."""
+        return self.surface_temperatures[-1]
+
+    def unit_ring_temperatures(self, unit: Unit) -> np.ndarray:
+        """Ring temperatures of all scenarios after the step of ``unit``
+        (after its last disk element, if it has disk elements)."""
+        if isinstance(unit, DiskElementUnit) and unit.disk_elements:
+            unit = unit.disk_elements[-1]
+        return self.ring_temperatures[self.units.index(unit) + 1]
+
+
+class _ScenarioView:
+    """
+    Attribute view of a unit with some hook values replaced by the values of a subset of the scenarios.
+    Parameters of the roll are given with the prefix ``roll_``.
+    """
+
+    def __init__(self, unit: Unit, parameters: Mapping[str, np.ndarray], index: np.ndarray):
+        self._unit = unit
+        self._parameters = parameters
+        self._index = index
+
+    def __getattr__(self, name):
+        if name in self._parameters:
+            return self._parameters[name][self._index]
+
+        if name == "roll":
+            return _ScenarioView(
+                self._unit.roll,
+                {k[len("roll_"):]: v for k, v in self._parameters.items() if k.startswith("roll_")},
+                self._index,
+            )
+
+        return getattr(self._unit, name)
+
+
+def _solve_ensemble_step(
+        unit: Unit,
+        parent: Unit,
+        parameters: Mapping[str, np.ndarray],
+        ring_temperatures: np.ndarray,
+        surface_temperatures: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    step_system = step_system_factory(parent)
+
+    if step_system is None:
+        return ring_temperatures, surface_temperatures, np.ones(len(ring_temperatures), dtype=bool), 0
+
+    cache = {}
+
+    def model(index) -> Tuple[RingSystem, bool]:
+        key = index.tobytes()
+        if key not in cache:
+            cache.clear()
+            cache[key] = step_system(_ScenarioView(unit, parameters, index), _ScenarioView(parent, parameters, index))
+        return cache[key]
+
+    def system(index) -> RingSystem:
+        return model(index)[0]
+
+    options = dict(
+        absolute_tolerance=unit.thermal_solver_absolute_tolerance,
+        relative_tolerance=unit.thermal_solver_relative_tolerance,
+        max_iterations=unit.thermal_solver_max_iterations,
+    )
+    everyone = np.arange(len(ring_temperatures))
+
+    # as in the sequence solution, where the surface temperature of transports and cooling pipes is balanced
+    # with the out state, coupled or iterated, while roll passes take it from their in profile
+    explicit_surface = model(everyone)[1]
+
+    if not explicit_surface:
+        in_state = np.column_stack([ring_temperatures, surface_temperatures])
+
+        def residual(x, index):
+            r = system(index).coupled_increments(in_state[index] + x)
+            r[:, :-1] -= x[:, :-1]
+            return r
+
+        def jacobian(x, index):
+            j = system(index).coupled_jacobian(in_state[index] + x)
+            j[:, 1, :-1] -= 1
+            return j
+
+        sol = newton_banded_batched(residual, jacobian, x0=np.zeros_like(in_state), scale=in_state, **options)
+        out_ring_temperatures = ring_temperatures + sol.x[:, :-1]
+
+    else:
+        surface_temperatures = system(everyone).surface_temperatures(ring_temperatures[:, -1])
+
+        def residual(x, index):
+            return system(index).increments(ring_temperatures[index] + x, surface_temperatures[index]) - x
+
+        def jacobian(x, index):
+            j = system(index).jacobian()
+            j[1] -= 1
+            return j
+
+        sol = newton_banded_batched(
+            residual, jacobian, x0=np.zeros_like(ring_temperatures), scale=ring_temperatures, **options
+        )
+        out_ring_temperatures = ring_temperatures + sol.x
+
+    out_surface_temperatures = system(everyone).surface_temperatures(out_ring_temperatures[:, -1])
+
+    return out_ring_temperatures, out_surface_temperatures, sol.success, sol.nit
+
+
+def solve_ensemble(
+        sequence: Unit,
+        ring_temperatures: np.ndarray,
+        parameters: Optional[Mapping[ParameterKey, np.ndarray]] = None,
+        unit_parameters: Optional[Mapping[str, Mapping[str, np.ndarray]]] = None,
+) -> EnsembleResult:
+    """
+    Solve the thermal ring model for many scenarios at once, marching all scenarios together through the
+    thermal steps of transports, cooling pipes and roll passes of ``sequence``.
+
+    The sequence must have been solved before for a reference scenario.
+    Its geometry, durations, material properties and deformation heat sources are used for all scenarios,
+    so the scenarios may differ in their temperatures and thermal boundary conditions, but not in their mechanics.
+    The surface temperature is treated as in the sequence solution, balanced with the out state of the steps
+    of transports and cooling pipes and taken from the in profile of the steps of roll passes.
+    Scenarios that did not converge in a step are excluded from all further steps.
+
+    :param sequence: the reference solution (a pass sequence or a single unit)
+    :param ring_temperatures: the entry ring temperatures of shape ``(scenarios, rings)``,
+        or entry temperatures of shape ``(scenarios,)`` for homogeneous profiles
+    :param parameters: per scenario values (arrays of shape ``(scenarios,)`` or scalars) of unit hooks,
+        like ``heat_transfer_coefficient``, ``environment_temperature`` or ``coolant_temperature``,
+        hooks of the rolls are given with prefix ``roll_``, like ``roll_heat_transfer_coefficient``.
+        A plain hook name applies to all units having that hook, so ``heat_transfer_coefficient`` replaces the
+        coefficients of transports, cooling pipes and roll passes at once.
+        Keys may be scoped to a unit type or label, see :py:data:`ParameterKey`,
+        labels taking precedence over types and types over plain hook names
+    :param unit_parameters: per scenario values of unit hooks as ``parameters``, given per unit label,
+        equivalent to keys scoped by label
+    """
+    if sequence.in_profile is None:
+        raise ValueError("The sequence must be solved for a reference scenario before solving an ensemble.")
+
+    rings = len(sequence.in_profile.ring_temperatures)
+    ring_temperatures = np.asarray(ring_temperatures, dtype=float)
+    if ring_temperatures.ndim == 1:
+        ring_temperatures = np.repeat(ring_temperatures[:, np.newaxis], rings, axis=1)
+
+    scenarios = len(ring_temperatures)
+    if ring_temperatures.shape != (scenarios, rings):
+        raise ValueError(f"Expected ring temperatures of shape ({scenarios}, {rings}), got {ring_temperatures.shape}.")
+
+    def expand(values) -> np.ndarray:
+        return np.broadcast_to(np.asarray(values, dtype=float), (scenarios,))
+
+    scoped_parameters = {
+        key if isinstance(key, tuple) else (None, key): expand(values) for key, values in (parameters or {}).items()
+    }
+    for label, values in (unit_parameters or {}).items():
+        scoped_parameters.update({(label, name): expand(v) for name, v in values.items()})
+
+    def parameters_of(unit: Unit) -> Dict[str, np.ndarray]:
+        result = {name: v for (scope, name), v in scoped_parameters.items() if scope is None}
+        result.update({
+            name: v for (scope, name), v in scoped_parameters.items()
+            if isinstance(scope, type) and isinstance(unit, scope)
+        })
+        result.update({
+            name: v for (scope, name), v in scoped_parameters.items() if isinstance(scope, str) and scope == unit.label
+        })
+        return result
+
+    steps = list(yield_steps(sequence))
+    result_ring_temperatures = np.full((len(steps) + 1, scenarios, rings), np.nan)
+    result_surface_temperatures = np.full((len(steps) + 1, scenarios), np.nan)
+    iterations = np.zeros(scenarios, dtype=int)
+    success = np.ones(scenarios, dtype=bool)
+
+    result_ring_temperatures[0] = ring_temperatures
+    result_surface_temperatures[0] = ring_temperatures[:, -1]
+
+    for i, (unit, parent) in enumerate(steps):
+        alive = np.flatnonzero(success)
+        if not len(alive):
+            break
+
+        step_parameters = parameters_of(parent)
+        out_ring_temperatures, out_surface_temperatures, step_success, step_iterations = _solve_ensemble_step(
+            unit, parent,
+            {k: v[alive] for k, v in step_parameters.items()},
+            result_ring_temperatures[i, alive],
+            result_surface_temperatures[i, alive],
+        )
+
+        success[alive] = step_success
+        iterations[alive] += step_iterations
+        alive = alive[step_success]
+        result_ring_temperatures[i + 1, alive] = out_ring_temperatures[step_success]
+        result_surface_temperatures[i + 1, alive] = out_surface_temperatures[step_success]
+
+    return EnsembleResult(
+        units=[unit for unit, _ in steps],
+        ring_temperatures=result_ring_temperatures,
+        surface_temperatures=result_surface_temperatures,
+        success=success,
+        iterations=iterations,
+    )
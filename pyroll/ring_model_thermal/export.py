@@ -0,0 +1,153 @@
+import importlib.util
+import json
+import numpy as np
+
+from pathlib import Path
+from typing import Dict, List, Union
+
+from pyroll.core import Unit
+
+from .history import ThermalHistory
+
+H5PY_INSTALLED = bool(importlib.util.find_spec("h5py"))
+
+COLUMNS = [
+    "unit_index", "t", "x", "core_temperatures", "surface_temperatures", "mean_temperatures", "ring_temperatures"
+]
+"""Columns of :py:class:`ThermalHistory` written by :py:func:`export_thermal_history`."""
+
+
+def _unit_metadata(history: ThermalHistory) -> List[Dict]:
+    starts = np.searchsorted(history.unit_index, np.arange(len(history.units)))
+    stops = np.searchsorted(history.unit_index, np.arange(len(history.units)), side="right")
+
+    return [
+        dict(
+            label=str(u.label),
+            type=type(u).__qualname__,
+            start=int(start),
+            stop=int(stop),
+            disk_element_count=len(u.subunits or []),
+        )
+        for u, start, stop in zip(history.units, starts, stops)
+    ]
+
+
+def _ring_radii(history: ThermalHistory) -> np.ndarray:
+    radii = np.full((len(history.units), history.ring_temperatures.shape[1]), np.nan)
+
+    for i, u in enumerate(history.units):
+        rings = getattr(u.out_profile, "rings", None)
+        if rings is not None:
+            radii[i, :len(rings)] = rings
+
+    return radii
+
+
+def export_thermal_history(
+        source: Union[Unit, ThermalHistory], path: Union[str, Path], file_format: str = "npy"
+) -> Path:
+    """
+    Write the thermal history of a solved unit to files for post-processing without pickling the unit.
+
+    The columns of :py:class:`ThermalHistory` (the ring temperatures as ``points × rings`` matrix)
+    are written together with the ring radii of the out profile of each unit (``units × rings``)
+    and per unit metadata (label, type, range of points and disk element count).
+
+    :param source: the solved unit (like a pass sequence) or its history
+    :param path: a directory for ``"npy"`` format, holding one ``.npy`` file per array and ``units.json``,
+        or a file for ``"hdf5"`` format, holding one chunked dataset per array and the metadata as attribute
+    :param file_format: ``"npy"`` or ``"hdf5"`` (requires ``h5py``)
+    :returns: the written path
+    """
+    history = source if isinstance(source, ThermalHistory) else source.thermal_history
+    path = Path(path)
+
+    arrays = {name: getattr(history, name) for name in COLUMNS}
+    arrays["ring_radii"] = _ring_radii(history)
+    metadata = json.dumps(_unit_metadata(history))
+
+    if file_format == "npy":
+        path.mkdir(parents=True, exist_ok=True)
+        for name, a in arrays.items():
+            np.save(path / f"{name}.npy", a)
+        (path / "units.json").write_text(metadata, encoding="utf-8")
+
+    elif file_format == "hdf5":
+        if not H5PY_INSTALLED:
+            raise ImportError("Export to HDF5 requires the h5py package.")
+
+        import h5py
+
+        with h5py.File(path, "w") as f:
+            for name, a in arrays.items():
+                chunks = (min(len(a), 1024),) + a.shape[1:] if len(a) else None
+                f.create_dataset(name, data=a, chunks=chunks)
+            f.attrs["units"] = metadata
+
+    else:
+        raise ValueError(f"Unknown export format '{file_format}', available are: npy, hdf5.")
+
+    return path
+
+
+class StoredThermalHistory:
+    """
+    Thermal history read from files written by :py:func:`export_thermal_history`.
+
+    The arrays are opened lazily: ``.npy`` files are memory-mapped and HDF5 datasets are returned as
+    :py:class:`h5py.Dataset`, so that only the sliced parts are read from disk.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        """:param path: the directory or HDF5 file written by :py:func:`export_thermal_history`"""
+        self.path = Path(path)
+
+        if self.path.is_dir():
+            self._file = None
+            units = json.loads((self.path / "units.json").read_text(encoding="utf-8"))
+        else:
+            import h5py
+
+            self._file = h5py.File(self.path, "r")
+            units = json.loads(self._file.attrs["units"])
+
+        self.units: List[Dict] = units
+        """Metadata of the units (label, type, range of points ``start:stop`` and disk element count)."""
+
+    def __getattr__(self, name):
+        if name not in COLUMNS and name != "ring_radii":
+            raise AttributeError(name)
+
+        if self._file is not None:
+            return self._file[name]
+
+        return np.load(self.path / f"{name}.npy", mmap_mode="r")
+
+    def __len__(self):
+        return len(self.t)
+
+    def unit_slice(self, label: str) -> slice:
+        """Range of the points of the unit with ``label``."""
+        for u in self.units:
+            if u["label"] == label:
+                return slice(u["start"], u["stop"])
+
+        raise KeyError(f"No unit with label '{label}'.")
+
+    def close(self):
+        """Close the underlying HDF5 file, if any."""
+        if self._file is not None:
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def open_thermal_history(path: Union[str, Path]) -> StoredThermalHistory:
+    """Open a thermal history written by :py:func:`export_thermal_history` lazily,
+    see :py:class:`StoredThermalHistory`."""
+    return StoredThermalHistory(path)
@@ -0,0 +1,161 @@
+import numpy as np
+
+from dataclasses import dataclass
+from typing import List
+
+from pyroll.core import Unit, DiskElementUnit, Hook
+
+from ._units import yield_leaf_units
+from .config import Config
+from .retention import disk_profiles_released, _disk_profile_release
+from .surface import surface_temperatures
+
+
+@dataclass(frozen=True)
+class ThermalHistory:
+    """
+    Columnar record of the thermal state along a solved unit or pass sequence.
+
+    Each unit contributes one point per disk element boundary (its in profile, the boundaries between its
+    disk elements and its out profile), units without disk elements contribute their in and out profile.
+    All columns are read-only arrays with one entry per point.
+    """
+
+    units: List[Unit]
+    """The units the points belong to (the units of nested pass sequences flattened)."""
+
+    unit_index: np.ndarray
+    """Index into :py:attr:`units` per point."""
+
+    t: np.ndarray
+    """Times of the points."""
+
+    x: np.ndarray
+    """Positions of the points, NaN if not available."""
+
+    core_temperatures: np.ndarray
+    """Core temperatures of the points."""
+
+    surface_temperatures: np.ndarray
+    """Surface temperatures of the points."""
+
+    mean_temperatures: np.ndarray
+    """Mean temperatures of the points."""
+
+    ring_temperatures: np.ndarray
+    """Ring temperatures of the points of shape ``(points, rings)``, padded with NaN if ring counts differ."""
+
+    @classmethod
+    def from_unit(cls, unit: Unit) -> "ThermalHistory":
+        """Collect the history of a solved unit in one walk over its unit tree."""
+        units = list(yield_leaf_units(unit))
+        counts = [len(u.disk_elements) + 1 if _has_disks(u) else 2 for u in units]
+        points = sum(counts)
+        rings = max(len(getattr(u.out_profile, "ring_temperatures", [])) for u in units)
+
+        columns = {name: np.full(points, np.nan) for name in ["t", "x", "core", "surface", "mean"]}
+        ring_temperatures = np.full((points, rings), np.nan)
+        unit_index = np.repeat(np.arange(len(units)), counts)
+        profile_points = {}
+
+        start = 0
+        for u, count in zip(units, counts):
+            rows = slice(start, start + count)
+            start += count
+
+            if _has_disks(u) and disk_profiles_released(u):
+                history = getattr(u, "ring_temperature_history", None)
+                if history is None:
+                    continue
+
+                columns["t"][rows] = history.t
+                columns["core"][rows] = history.core_temperatures
+                columns["surface"][rows] = history.surface_temperatures
+                columns["mean"][rows] = history.mean_temperatures(u.out_profile.ring_geometry.areas)
+                ring_temperatures[rows, :history.ring_temperatures.shape[1]] = history.ring_temperatures
+                continue
+
+            profiles = (
+                [u.in_profile] + [d.out_profile for d in u.disk_elements[:-1]] + [u.out_profile]
+                if _has_disks(u) else [u.in_profile, u.out_profile]
+            )
+
+            for i, p in enumerate(profiles, rows.start):
+                profile_points[i] = p
+                columns["t"][i] = getattr(p, "t", np.nan)
+                columns["x"][i] = getattr(p, "x", np.nan)
+                columns["core"][i] = getattr(p, "core_temperature", np.nan)
+                columns["mean"][i] = getattr(p, "temperature", np.nan)
+
+                values = getattr(p, "ring_temperatures", None)
+                if values is not None:
+                    ring_temperatures[i, :len(values)] = values
+
+        if profile_points:
+            columns["surface"][list(profile_points)] = surface_temperatures(list(profile_points.values()))
+
+        for a in [unit_index, ring_temperatures, *columns.values()]:
+            a.setflags(write=False)
+
+        return cls(
+            units=units,
+            unit_index=unit_index,
+            t=columns["t"],
+            x=columns["x"],
+            core_temperatures=columns["core"],
+            surface_temperatures=columns["surface"],
+            mean_temperatures=columns["mean"],
+            ring_temperatures=ring_temperatures,
+        )
+
+    def __len__(self):
+        return len(self.t)
+
+    def unit_mask(self, unit: Unit) -> np.ndarray:
+        """Boolean mask selecting the points of ``unit``."""
+        return self.unit_index == self.units.index(unit)
+
+
+def _has_disks(unit: Unit) -> bool:
+    return isinstance(unit, DiskElementUnit) and bool(unit.disk_elements)
+
+
+@Unit.extension_class
+class UnitHistoryExt(Unit):
+    thermal_history = Hook[ThermalHistory]()
+    """Columnar history of the thermal state along this unit, see :py:class:`ThermalHistory`."""
+
+
+@UnitHistoryExt.thermal_history
+def thermal_history(self: UnitHistoryExt):
+    history = getattr(self, "_thermal_history", None)
+    if history is not None:
+        return history
+
+    if self.out_profile is not None:
+        return ThermalHistory.from_unit(self)
+
+
+class _HistoryRecording:
+    """Post-processor forgetting the :py:class:`ThermalHistory` of an earlier solution of a unit
+    and collecting the one of a solved root unit, if :py:attr:`Config.THERMAL_HISTORY` is enabled."""
+
+    label = "thermal history recording"
+
+    def __init__(self, unit: Unit):
+        self.unit = unit
+
+    def solve(self, out_profile):
+        self.unit.__cache__.pop("thermal_history", None)
+        self.unit._thermal_history = (
+            ThermalHistory.from_unit(self.unit) if Config.THERMAL_HISTORY and self.unit.parent is None else None
+        )
+        return out_profile
+
+
+def _history_recording(unit: Unit) -> _HistoryRecording:
+    return _HistoryRecording(unit)
+
+
+# recording must precede the release of disk element profiles
+Unit.post_processors.insert(Unit.post_processors.index(_disk_profile_release), _history_recording)
@@ -0,0 +1,153 @@
+import numpy as np
+
+from typing import Any, Dict, List, Optional, Sequence
+
+from pyroll.core import Unit, Profile
+
+from ._units import yield_leaf_units
+
+THERMAL_INPUTS: Dict[type, List[str]] = {}
+"""Names of the hooks the thermal solution of a unit depends on besides its incoming profile,
+registered per unit type. Dotted names refer to hooks of attributes, like ``roll.temperature``."""
+
+
+def register_thermal_inputs(unit_type: type, names: Sequence[str]):
+    """Add the hook ``names`` to :py:data:`THERMAL_INPUTS` of ``unit_type``."""
+    THERMAL_INPUTS.setdefault(unit_type, []).extend(names)
+
+
+def _input_names(unit: Unit) -> List[str]:
+    names = []
+    for cls in type(unit).__mro__:
+        names.extend(n for n in THERMAL_INPUTS.get(cls, []) if n not in names)
+    return names
+
+
+def _value(unit: Unit, name: str) -> Any:
+    value = unit
+    for part in name.split("."):
+        value = getattr(value, part, None)
+        if value is None:
+            return None
+    return value
+
+
+def thermal_inputs(unit: Unit) -> Dict[str, Any]:
+    """Current values of the hooks of :py:data:`THERMAL_INPUTS` registered for the type of ``unit``."""
+    return {name: _value(unit, name) for name in _input_names(unit)}
+
+
+def _equal(a, b) -> bool:
+    try:
+        return bool(a == b)
+    except ValueError:
+        return np.array_equal(a, b)
+
+
+def changed_units(root: Unit) -> List[Unit]:
+    """
+    The units within ``root`` whose thermal inputs changed since their last solution, in process order.
+    Units never solved count as changed.
+    """
+    result = []
+
+    for u in yield_leaf_units(root):
+        recorded = getattr(u, "_thermal_inputs", None)
+        current = thermal_inputs(u)
+
+        if recorded is None or recorded.keys() != current.keys() or not all(
+                _equal(recorded[k], v) for k, v in current.items()
+        ):
+            result.append(u)
+
+    return result
+
+
+def _template(profile: Profile) -> Profile:
+    """Copy of the public values of a profile, as returned by :py:meth:`Unit.solve`."""
+    return Profile(**{k: v for k, v in profile.__dict__.items() if not k.startswith("_")})
+
+
+def _run_post_processors(root: Unit):
+    out_profile = _template(root.out_profile)
+
+    for factory in root._yield_post_processors():
+        post_processor = factory(root)
+        if post_processor is not None:
+            out_profile = post_processor.solve(out_profile)
+
+
+def resolve_downstream(root: Unit, start: Optional[Unit] = None) -> List[Unit]:
+    """
+    Solve ``start`` and all units downstream of it within the solved ``root`` unit (like a pass sequence) again,
+    reusing the solution of the upstream units, after the inputs of ``start`` were changed.
+
+    The enclosing pass sequences up to ``root`` are not iterated again,
+    only their root hooks are evaluated anew from the re-solved units.
+
+    :param root: the solved root unit
+    :param start: the first unit to solve again, defaults to the first of :py:func:`changed_units`
+    :returns: the units solved again, empty if nothing changed
+    """
+    if start is None:
+        changed = changed_units(root)
+        if not changed:
+            return []
+        start = changed[0]
+
+    if start is root:
+        root.solve(_template(root.in_profile))
+        return list(yield_leaf_units(root))
+
+    resolved = []
+    unit = start
+    in_profile = None
+
+    while unit is not root:
+        level = unit.parent
+        if level is None:
+            raise ValueError(f"{start} is not a unit within {root}.")
+
+        index = level.subunits.index(unit)
+
+        if in_profile is None:
+            in_profile = level.in_profile if index == 0 else _template(level.subunits[index - 1].out_profile)
+        else:
+            index += 1
+
+        for u in level.subunits[index:]:
+            in_profile = u.solve(in_profile)
+            resolved.extend(yield_leaf_units(u))
+
+        level.get_root_hook_results()
+        level.out_profile.reevaluate_cache()
+        in_profile = _template(level.out_profile)
+        unit = level
+
+    _run_post_processors(root)
+
+    for u in resolved:
+        u._thermal_inputs = thermal_inputs(u)
+
+    return resolved
+
+
+class _InputRecording:
+    """Post-processor recording the thermal inputs of a solved unit for :py:func:`changed_units`."""
+
+    label = "thermal input recording"
+
+    def __init__(self, unit: Unit):
+        self.unit = unit
+
+    def solve(self, out_profile):
+        self.unit._thermal_inputs = thermal_inputs(self.unit)
+        return out_profile
+
+
+def _input_recording(unit: Unit) -> Optional[_InputRecording]:
+    if _input_names(unit):
+        return _InputRecording(unit)
+
+
+Unit.post_processors.append(_input_recording)
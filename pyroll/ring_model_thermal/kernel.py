@@ -0,0 +1,390 @@
+import copy
+
+import numpy as np
+import scipy.optimize as scopt
+
+from typing import Callable, Mapping, Optional, Tuple
+
+from .profile import RingGeometry
+
+
+def ring_increments(
+        ring_temperatures: np.ndarray,
+        duration: float,
+        density: float,
+        specific_heat_capacity: float,
+        thermal_conductivity: float,
+        areas: np.ndarray,
+        contour_lengths: np.ndarray,
+        spacings: np.ndarray,
+        surface_heat_flux: float,
+        source_density: float = 0,
+) -> np.ndarray:
+    """
+    Temperature increments of all rings within one time step of ``duration``.
+
+    The heat flows through the inner ring boundaries are evaluated at once from the ring temperature differences,
+    the heat flow through the outer surface is given by the unit specific ``surface_heat_flux``.
+
+    :param ring_temperatures: ring temperatures from core to surface
+    :param duration: duration of the time step
+    :param density: the density of the material
+    :param specific_heat_capacity: the specific heat capacity of the material
+    :param thermal_conductivity: the thermal conductivity of the material
+    :param areas: section areas of the rings
+    :param contour_lengths: lengths of the ring boundary contours (one more than rings)
+    :param spacings: radial distances between adjacent ring centers (one less than rings)
+    :param surface_heat_flux: heat flux density entering the profile through the surface
+    :param source_density: volumetric heat source density
+    """
+    return _ring_increments(
+        np.asarray(ring_temperatures),
+        factors=duration / (density * specific_heat_capacity * areas),
+        conductances=thermal_conductivity * contour_lengths[1:-1] / spacings,
+        surface_flow=surface_heat_flux * contour_lengths[-1],
+        sources=source_density * areas,
+    )
+
+
+def _ring_increments(
+        ring_temperatures: np.ndarray,
+        factors: np.ndarray,
+        conductances: np.ndarray,
+        surface_flow,
+        sources: np.ndarray,
+        flows: Optional[np.ndarray] = None,
+        out: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    Finite volume kernel of :py:func:`ring_increments` and :py:meth:`RingSystem.increments`
+    with the coefficients preassembled. Leading dimensions of ``ring_temperatures`` are treated as batch.
+
+    :param factors: factors converting heat flows per length into temperature increments of the rings
+    :param conductances: thermal conductances per length between adjacent rings
+    :param surface_flow: heat flow per length entering through the surface
+    :param sources: heat sources per length of the rings
+    :param flows: optional work buffer for the heat flows through the ring boundaries, its first entry must be zero
+    :param out: optional array to write the result into
+    """
+    shape = ring_temperatures.shape[:-1] + (len(factors) + 1,)
+    if flows is None or flows.shape != shape:
+        flows = np.zeros(shape)
+
+    np.subtract(ring_temperatures[..., 1:], ring_temperatures[..., :-1], out=flows[..., 1:-1])
+    flows[..., 1:-1] *= conductances
+    flows[..., -1] = surface_flow
+
+    out = np.subtract(flows[..., 1:], flows[..., :-1], out=out)
+    out += sources
+    out *= factors
+    return out
+
+
+def ring_increments_jacobian(
+        duration: float,
+        density: float,
+        specific_heat_capacity: float,
+        thermal_conductivity: float,
+        areas: np.ndarray,
+        contour_lengths: np.ndarray,
+        spacings: np.ndarray,
+        surface_heat_flux_derivative: float = 0,
+) -> np.ndarray:
+    """
+    Jacobian of :py:func:`ring_increments` with respect to the ring temperatures.
+
+    The conduction between adjacent rings only couples direct neighbours, so the Jacobian is tridiagonal.
+    It is returned in the banded storage of :py:func:`scipy.linalg.solve_banded` with one upper and one lower diagonal.
+
+    :param surface_heat_flux_derivative: derivative of the surface heat flux density with respect to the
+        temperature of the most outer ring
+    :returns: array of shape ``(3, len(areas))``
+    """
+    factors = duration / (density * specific_heat_capacity * areas)
+    conductances = thermal_conductivity * contour_lengths[1:-1] / spacings
+
+    jacobian = np.zeros((3, len(areas)))
+    jacobian[0, 1:] = factors[:-1] * conductances
+    jacobian[2, :-1] = factors[1:] * conductances
+    jacobian[1, :-1] -= factors[:-1] * conductances
+    jacobian[1, 1:] -= factors[1:] * conductances
+    jacobian[1, -1] += factors[-1] * surface_heat_flux_derivative * contour_lengths[-1]
+
+    return jacobian
+
+
+def solve_surface_temperature(
+        outer_ring_temperature: float,
+        surface_conductance: float,
+        surface_balance_flux: Callable[[float], float],
+        surface_balance_flux_derivative: Callable[[float], float],
+        full_output: bool = False,
+) -> Optional[float]:
+    """
+    Solve the heat balance at the surface ``q(ts) = surface_conductance * (ts - outer_ring_temperature)``
+    for the surface temperature ``ts`` by Newton's method.
+
+    :param outer_ring_temperature: temperature of the most outer ring
+    :param surface_conductance: thermal conductivity divided by the distance of the most outer ring to the surface
+    :param surface_balance_flux: heat flux density ``q`` entering through the surface as function of ``ts``
+    :param surface_balance_flux_derivative: derivative of ``surface_balance_flux``
+    :param full_output: whether to return the count of Newton iterations additionally
+    :returns: the surface temperature or None if Newton's method did not converge
+    """
+
+    def f(ts):
+        return surface_balance_flux(ts) - surface_conductance * (ts - outer_ring_temperature)
+
+    def fprime(ts):
+        return surface_balance_flux_derivative(ts) - surface_conductance
+
+    sol = scopt.root_scalar(f=f, fprime=fprime, x0=outer_ring_temperature, method="newton")
+    root = sol.root if sol.converged else None
+
+    if full_output:
+        return root, sol.iterations
+
+    return root
+
+
+def solve_surface_temperatures(
+        outer_ring_temperatures: np.ndarray,
+        surface_conductance: float,
+        surface_balance_flux: Callable[[np.ndarray], np.ndarray],
+        surface_balance_flux_derivative: Callable[[np.ndarray], np.ndarray],
+        relative_tolerance: float = 1.48e-8,
+        max_iterations: int = 50,
+        full_output: bool = False,
+) -> np.ndarray:
+    """
+    Vectorized :py:func:`solve_surface_temperature` for a batch of outer ring temperatures.
+    Newton's method is applied to all entries at once, converged entries are not updated further.
+    The flux functions must accept and return arrays, with parameters either scalar or of the batch shape.
+
+    :param full_output: whether to return the counts of Newton iterations per entry additionally
+    :returns: array of surface temperatures, NaN where Newton's method did not converge
+    """
+    outer_ring_temperatures = np.asarray(outer_ring_temperatures, dtype=float)
+    ts = np.array(outer_ring_temperatures)
+    active = np.ones(ts.shape, dtype=bool)
+    iterations = np.zeros(ts.shape, dtype=int)
+
+    for _ in range(max_iterations):
+        step = (
+                (surface_balance_flux(ts) - surface_conductance * (ts - outer_ring_temperatures))
+                / (surface_balance_flux_derivative(ts) - surface_conductance)
+        )
+        ts = np.where(active, ts - step, ts)
+        iterations += active
+        active &= np.abs(step) > relative_tolerance * np.abs(ts)
+
+        if not np.any(active):
+            break
+
+    ts = np.where(active, np.nan, ts)
+
+    if full_output:
+        return ts, iterations
+
+    return ts
+
+
+def flux_parameter_derivative(
+        flux_factory: Callable[..., Tuple[Callable, Callable]],
+        parameters: Mapping[str, float],
+        name: str,
+        surface_temperature: float,
+) -> float:
+    """
+    Derivative of the heat flux density created by ``flux_factory`` from ``parameters`` at ``surface_temperature``
+    with respect to the parameter ``name`` by central differences, which are exact for the heat transfer coefficients
+    the fluxes depend on linearly. Zero if ``name`` is not among the parameters.
+    """
+    if name not in parameters:
+        return 0
+
+    value = parameters[name]
+    h = 1e-6 * max(abs(value), 1)
+    upper = flux_factory(**{**parameters, name: value + h})[0](surface_temperature)
+    lower = flux_factory(**{**parameters, name: value - h})[0](surface_temperature)
+    return (upper - lower) / (2 * h)
+
+
+class RingSystem:
+    """
+    The ring heat conduction system of one time step with all arrays preassembled and the boundary conditions given
+    as functions of the surface temperature.
+    """
+
+    def __init__(
+            self,
+            duration: float,
+            density: float,
+            specific_heat_capacity: float,
+            thermal_conductivity: float,
+            geometry: RingGeometry,
+            surface_heat_flux: Callable[[float], float],
+            surface_heat_flux_derivative: Callable[[float], float],
+            surface_balance_flux: Optional[Callable[[float], float]] = None,
+            surface_balance_flux_derivative: Optional[Callable[[float], float]] = None,
+            source_density: float = 0,
+            boundary_parameters: Optional[Mapping[str, float]] = None,
+            balance_parameters: Optional[Mapping[str, float]] = None,
+            flux_factory: Optional[Callable[..., Tuple[Callable, Callable]]] = None,
+    ):
+        """
+        :param duration: duration of the time step
+        :param density: the density of the material
+        :param specific_heat_capacity: the specific heat capacity of the material
+        :param thermal_conductivity: the thermal conductivity of the material
+        :param geometry: the ring geometry
+        :param surface_heat_flux: heat flux density entering the most outer ring as function of the surface temperature
+        :param surface_heat_flux_derivative: derivative of ``surface_heat_flux``
+        :param surface_balance_flux: heat flux density used in the surface heat balance determining the surface
+            temperature, defaults to ``surface_heat_flux``
+        :param surface_balance_flux_derivative: derivative of ``surface_balance_flux``
+        :param source_density: volumetric heat source density
+        :param boundary_parameters: the parameters ``surface_heat_flux`` was created from by ``flux_factory``,
+            identifying the boundary condition for caching of step solutions and parameter sensitivities,
+            None if unknown
+        :param balance_parameters: the parameters ``surface_balance_flux`` was created from by ``flux_factory``,
+            defaults to ``boundary_parameters``
+        :param flux_factory: function creating a heat flux density function and its derivative
+            from boundary parameters given as keyword arguments
+        """
+        self.duration = duration
+        self.geometry = geometry
+        self.source_density = source_density
+
+        self.surface_heat_flux = surface_heat_flux
+        self.surface_heat_flux_derivative = surface_heat_flux_derivative
+        self.surface_balance_flux = surface_balance_flux or surface_heat_flux
+        self.surface_balance_flux_derivative = surface_balance_flux_derivative or surface_heat_flux_derivative
+        self.boundary_parameters = boundary_parameters
+        self.balance_parameters = balance_parameters if balance_parameters is not None else boundary_parameters
+        self.flux_factory = flux_factory
+
+        self.factors = duration / (density * specific_heat_capacity * geometry.areas)
+        """Factors converting heat flows per length into temperature increments over the step."""
+
+        self.conductances = thermal_conductivity * geometry.contour_lengths[1:-1] / geometry.spacings
+        """Thermal conductances per length between adjacent rings."""
+
+        self.surface_conductance = thermal_conductivity / geometry.surface_distance
+        """Thermal conductance per area between the most outer ring and the surface."""
+
+        self.sources = source_density * geometry.areas
+        """Volumetric heat sources per length of the rings."""
+
+        self._flows = np.zeros(len(geometry.areas) + 1)
+        """Work buffer of the heat flows through the ring boundaries, the core boundary entry stays zero."""
+
+        self._jacobian = ring_increments_jacobian(
+            duration, density, specific_heat_capacity, thermal_conductivity,
+            geometry.areas, geometry.contour_lengths, geometry.spacings
+        )
+
+    def rescaled(self, duration: float) -> "RingSystem":
+        """Copy of this system for a time step of another duration."""
+        result = copy.copy(self)
+        ratio = duration / self.duration
+        result.duration = duration
+        result.factors = self.factors * ratio
+        result._jacobian = self._jacobian * ratio
+        return result
+
+    def increments(
+            self, ring_temperatures: np.ndarray, surface_temperature: float, out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Ring temperature increments over the step at given (fixed) surface temperature.
+        Leading dimensions of ``ring_temperatures`` and ``surface_temperature`` are treated as batch of scenarios.
+
+        :param out: optional array to write the result into
+        """
+        return _ring_increments(
+            np.asarray(ring_temperatures), self.factors, self.conductances,
+            self.surface_heat_flux(surface_temperature) * self.geometry.contour_lengths[-1], self.sources,
+            flows=self._flows, out=out,
+        )
+
+    def jacobian(self, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Banded Jacobian of :py:meth:`increments` with respect to the ring temperatures.
+
+        :param out: optional array to write the result into
+        """
+        if out is None:
+            return self._jacobian.copy()
+
+        np.copyto(out, self._jacobian)
+        return out
+
+    def surface_balance(self, outer_ring_temperature: float, surface_temperature: float) -> float:
+        """Residual of the heat balance at the surface."""
+        return (
+                self.surface_balance_flux(surface_temperature)
+                - self.surface_conductance * (surface_temperature - outer_ring_temperature)
+        )
+
+    def surface_temperature(self, outer_ring_temperature: float, full_output: bool = False) -> Optional[float]:
+        """Surface temperature fulfilling the heat balance at the surface for given outer ring temperature,
+        see :py:func:`solve_surface_temperature`."""
+        return solve_surface_temperature(
+            outer_ring_temperature, self.surface_conductance,
+            self.surface_balance_flux, self.surface_balance_flux_derivative, full_output=full_output
+        )
+
+    def surface_temperatures(self, outer_ring_temperatures: np.ndarray) -> np.ndarray:
+        """Vectorized :py:meth:`surface_temperature` for a batch of scenarios, see :py:func:`solve_surface_temperatures`."""
+        return solve_surface_temperatures(
+            outer_ring_temperatures, self.surface_conductance,
+            self.surface_balance_flux, self.surface_balance_flux_derivative
+        )
+
+    def coupled_increments(self, state: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Increments of the coupled system with the surface temperature as last entry of ``state``.
+        The last entry of the result is the residual of the surface heat balance instead of an increment.
+        Leading dimensions of ``state`` are treated as batch of scenarios.
+
+        :param out: optional array to write the result into
+        """
+        if out is None:
+            out = np.empty_like(state)
+
+        self.increments(state[..., :-1], state[..., -1], out=out[..., :-1])
+        out[..., -1] = self.surface_balance(state[..., -2], state[..., -1])
+        return out
+
+    def coupled_jacobian(self, state: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Banded Jacobian of :py:meth:`coupled_increments`, of shape ``(..., 3, len(state))``.
+
+        :param out: optional array to write the result into
+        """
+        surface_temperature = state[..., -1]
+        j = np.zeros(np.shape(state)[:-1] + (3, np.shape(state)[-1])) if out is None else out
+        j[..., :, :-1] = self._jacobian
+        j[..., 0, -1] = (
+                self.factors[-1] * self.geometry.contour_lengths[-1]
+                * self.surface_heat_flux_derivative(surface_temperature)
+        )
+        j[..., 1, -1] = self.surface_balance_flux_derivative(surface_temperature) - self.surface_conductance
+        j[..., 2, -1] = 0
+        j[..., 2, -2] = self.surface_conductance
+        return j
+
+    def parameter_derivatives(self, name: str, surface_temperature: float) -> Tuple[float, float]:
+        """
+        Derivatives of :py:attr:`surface_heat_flux` and :py:attr:`surface_balance_flux` at ``surface_temperature``
+        with respect to the boundary parameter ``name``, see :py:func:`flux_parameter_derivative`.
+        Both are zero if ``name`` is not among the parameters.
+
+        :raises ValueError: if the boundary parameters or the flux factory are not known
+        """
+        if self.boundary_parameters is None or self.flux_factory is None:
+            raise ValueError("Parameter derivatives require the boundary parameters and the flux factory.")
+
+        return (
+            flux_parameter_derivative(self.flux_factory, self.boundary_parameters, name, surface_temperature),
+            flux_parameter_derivative(self.flux_factory, self.balance_parameters, name, surface_temperature),
+        )
@@ -0,0 +1,170 @@
+import itertools
+import numpy as np
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from pyroll.core import Profile, Unit
+
+QUANTITIES = ["t", "core_temperatures", "surface_temperatures", "mean_temperatures"]
+"""Columns of the thermal history of each variant written to the shared result array."""
+
+VariantFactory = Callable[..., Tuple[Unit, Profile]]
+"""Function creating the unit (like a pass sequence) and the incoming profile of a variant
+from its parameters given as keyword arguments."""
+
+
+@dataclass
+class VariantResults:
+    """Thermal histories of variants solved by :py:func:`solve_variants`."""
+
+    parameters: List[Dict[str, Any]]
+    """The parameters of the variants."""
+
+    t: np.ndarray
+    """Times of the history points of shape ``(variants, points)``."""
+
+    core_temperatures: np.ndarray
+    """Core temperatures of the history points of shape ``(variants, points)``."""
+
+    surface_temperatures: np.ndarray
+    """Surface temperatures of the history points of shape ``(variants, points)``."""
+
+    mean_temperatures: np.ndarray
+    """Mean temperatures of the history points of shape ``(variants, points)``."""
+
+    point_counts: np.ndarray
+    """Count of history points per variant, entries beyond are NaN."""
+
+    success: np.ndarray
+    """Mask of the variants solved without error."""
+
+    messages: List[Optional[str]]
+    """Error messages of the failed variants, None for the succeeded ones."""
+
+    @property
+    def out_temperatures(self) -> np.ndarray:
+        """Mean temperatures after the last unit of all variants."""
+        return self.mean_temperatures[np.arange(len(self.point_counts)), np.maximum(self.point_counts - 1, 0)]
+
+
+def parameter_grid(parameters: Mapping[str, Sequence]) -> List[Dict[str, Any]]:
+    """All combinations of the given parameter values, as used by :py:func:`solve_variants`."""
+    return [dict(zip(parameters, values)) for values in itertools.product(*parameters.values())]
+
+
+def _solve_variant(factory: VariantFactory, parameters: Mapping[str, Any]) -> np.ndarray:
+    unit, in_profile = factory(**parameters)
+    unit.solve(in_profile)
+    history = unit.thermal_history
+    return np.stack([getattr(history, q) for q in QUANTITIES])
+
+
+def _try_variant(factory: VariantFactory, parameters: Mapping[str, Any]) -> Tuple[Optional[np.ndarray], Optional[str]]:
+    try:
+        return _solve_variant(factory, parameters), None
+    except Exception as e:
+        return None, f"{type(e).__name__}: {e}"
+
+
+def _run_variant(
+        factory: VariantFactory, name: str, shape: Tuple[int, ...], index: int, parameters: Mapping[str, Any]
+) -> Tuple[int, int, Optional[str]]:
+    values, message = _try_variant(factory, parameters)
+    if values is None:
+        return index, 0, message
+
+    memory = shared_memory.SharedMemory(name=name)
+    results = None
+
+    try:
+        results = np.ndarray(shape, dtype=np.float64, buffer=memory.buf)
+        count = min(values.shape[1], shape[2])
+        results[index, :, :count] = values[:, :count]
+    finally:
+        del results
+        memory.close()
+
+    return index, values.shape[1], None
+
+
+def solve_variants(
+        factory: VariantFactory,
+        parameters: Sequence[Mapping[str, Any]],
+        processes: Optional[int] = None,
+        points: Optional[int] = None,
+        chunk_size: int = 1,
+) -> VariantResults:
+    """
+    Solve variants of a unit (like a pass sequence) in a process pool, for example for design of experiments
+    over roll temperatures, transport lengths or heat transfer coefficients.
+
+    The workers write the time, core, surface and mean temperatures of the thermal history of each variant
+    into a result array in shared memory, instead of sending the solved units back to the calling process.
+    Variants failing to solve are recorded in the result instead of raising.
+
+    :param factory: module level function creating the unit and the incoming profile of a variant,
+        must be picklable to be sent to the workers
+    :param parameters: the parameters of the variants, see :py:func:`parameter_grid` to create a grid
+    :param processes: count of worker processes, defaults to the CPU count
+    :param points: count of history points reserved per variant, determined from the first variant solving
+        successfully if not given (the variants up to it are solved one after another), longer histories are truncated
+    :param chunk_size: count of variants sent to a worker at once
+    """
+    parameters = [dict(p) for p in parameters]
+    point_counts = np.zeros(len(parameters), dtype=int)
+    messages: List[Optional[str]] = [None] * len(parameters)
+    first: Dict[int, np.ndarray] = {}
+    start = 0
+
+    with ProcessPoolExecutor(processes) as executor:
+        if points is None:
+            points = 0
+
+            for index, p in enumerate(parameters):
+                values, messages[index] = executor.submit(_try_variant, factory, p).result()
+                start = index + 1
+                if values is not None:
+                    first[index] = values
+                    point_counts[index] = points = values.shape[1]
+                    break
+
+        shape = (len(parameters), len(QUANTITIES), points)
+        values = np.full(shape, np.nan)
+
+        for index, history in first.items():
+            values[index] = history
+
+        # nothing left if all variants failed already in the probe
+        remaining = range(start, len(parameters))
+
+        if remaining:
+            memory = shared_memory.SharedMemory(create=True, size=max(int(np.prod(shape)) * 8, 1))
+            results = None
+
+            try:
+                results = np.ndarray(shape, dtype=np.float64, buffer=memory.buf)
+                results[:] = values
+
+                for index, count, message in executor.map(
+                        _run_variant, itertools.repeat(factory), itertools.repeat(memory.name),
+                        itertools.repeat(shape), remaining, [parameters[i] for i in remaining], chunksize=chunk_size
+                ):
+                    point_counts[index] = count
+                    messages[index] = message
+
+                values = results.copy()
+            finally:
+                del results
+                memory.close()
+                memory.unlink()
+
+    return VariantResults(
+        parameters=parameters,
+        **{q: values[:, i] for i, q in enumerate(QUANTITIES)},
+        point_counts=np.minimum(point_counts, points),
+        success=np.array([m is None for m in messages], dtype=bool),
+        messages=messages,
+    )
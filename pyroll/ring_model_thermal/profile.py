@@ -1,12 +1,93 @@
 import numpy as np
 import scipy.special as sp
+import scipy.sparse as sparse
 
+from dataclasses import dataclass
+from functools import lru_cache
 from scipy import interpolate
 from pyroll.core import Profile, Unit
 from pyroll.core.hooks import Hook
 from pyroll.ring_model import RingProfile
 
 
+@dataclass(frozen=True)
+class RingGeometry:
+    """Read-only record of the ring geometry of a profile as contiguous arrays, as needed by the thermal solvers."""
+
+    areas: np.ndarray
+    """Section areas of the rings from core to surface."""
+
+    contour_lengths: np.ndarray
+    """Lengths of the ring boundary contours from core to surface (one more than rings)."""
+
+    spacings: np.ndarray
+    """Radial distances between adjacent ring centers (one less than rings)."""
+
+    surface_distance: float
+    """Radial distance between the most outer ring center and the surface."""
+
+    @classmethod
+    def from_profile(cls, profile: RingProfile) -> "RingGeometry":
+        """Collect the geometry arrays from the shapely objects of a ring profile."""
+        return cls(
+            areas=_read_only([s.area for s in profile.ring_sections]),
+            contour_lengths=_read_only([c.length for c in profile.ring_contours]),
+            spacings=_read_only(np.diff(profile.rings)),
+            surface_distance=float(profile.equivalent_radius - profile.rings[-1]),
+        )
+
+
+def _read_only(values) -> np.ndarray:
+    a = np.ascontiguousarray(values, dtype=np.float64)
+    a.setflags(write=False)
+    return a
+
+
+def _read_only_view(a: np.ndarray) -> np.ndarray:
+    """Read-only view of an array, for sharing unchanged ring temperatures among profiles without copying."""
+    view = a.view()
+    view.setflags(write=False)
+    return view
+
+
+def _area_coordinates(profile: RingProfile) -> np.ndarray:
+    """Ring boundaries as fractions of the cross-section area enclosed, from 0 at the core to 1 at the surface."""
+    return (profile.ring_boundaries / profile.equivalent_radius) ** 2
+
+
+@lru_cache(maxsize=128)
+def _remap_matrix(in_coordinates: tuple, out_coordinates: tuple) -> sparse.csr_matrix:
+    a = np.array(in_coordinates)
+    b = np.array(out_coordinates)
+
+    overlaps = np.clip(
+        np.minimum(b[1:, np.newaxis], a[np.newaxis, 1:]) - np.maximum(b[:-1, np.newaxis], a[np.newaxis, :-1]),
+        0, None
+    )
+    matrix = sparse.csr_matrix(overlaps / np.diff(b)[:, np.newaxis])
+    matrix.data.setflags(write=False)
+    return matrix
+
+
+def remap_ring_temperatures(in_profile: RingProfile, out_profile: RingProfile, ring_temperatures) -> np.ndarray:
+    """
+    Transfer ring temperatures from the rings of ``in_profile`` to the rings of ``out_profile`` conserving energy.
+
+    The out temperature of each ring is the area weighted mean of the in temperatures over its overlaps
+    with the in rings, where overlaps are measured in fractions of the cross-section area.
+    The sparse overlap matrices are cached per pair of ring discretizations.
+    Since the ring model scales the ring contours with the cross-section,
+    rings of equal count map one to one, which yields a read-only view of ``ring_temperatures``.
+    """
+    a = _area_coordinates(in_profile)
+    b = _area_coordinates(out_profile)
+
+    if len(a) == len(b) and np.allclose(a, b, rtol=0, atol=1e-12):
+        return _read_only_view(np.asarray(ring_temperatures))
+
+    return _remap_matrix(tuple(a), tuple(b)) @ ring_temperatures
+
+
 @Profile.extension_class
 class Profile(RingProfile):
     ring_temperatures = Hook[np.ndarray]()
@@ -15,12 +96,20 @@ class Profile(RingProfile):
     relative_radiation_coefficient = Hook[float]()
     """Heat transfer coefficient by convection to atmosphere."""
 
+    ring_geometry = Hook[RingGeometry]()
+    """Cached ring geometry arrays (areas, contour lengths, spacings) used by the thermal solvers."""
+
 
 @Profile.relative_radiation_coefficient
 def relative_radiation_coefficient(self: Profile):
     return 0.8
 
 
+@Profile.ring_geometry
+def ring_geometry(self: Profile):
+    return RingGeometry.from_profile(self)
+
+
 @Profile.ring_temperatures
 def homogeneous_profile(self: Profile):
     if self.has_set_or_cached("temperature"):
@@ -37,13 +126,13 @@ def approximated_quadratic_profile(self: Profile):
 @Unit.OutProfile.ring_temperatures
 def out_ring_temperatures_from_in(self: Unit.OutProfile):
     if self.unit.in_profile.has_set_or_cached("ring_temperatures"):
-        return np.copy(self.unit.in_profile.ring_temperatures)
+        return remap_ring_temperatures(self.unit.in_profile, self, self.unit.in_profile.ring_temperatures)
 
 
 @Profile.temperature
 def mean_temperature(self: Profile):
-    return np.sum(self.ring_temperatures * [s.area for s in self.ring_sections]) / np.sum(
-        [s.area for s in self.ring_sections])
+    areas = self.ring_geometry.areas
+    return np.sum(self.ring_temperatures * areas) / np.sum(areas)
 
 
 @Profile.surface_temperature
@@ -59,4 +148,4 @@ def core_temperature(self: Profile):
 @Unit.OutProfile.ring_temperatures
 def ring_temperatures_from_disks(self: Unit.OutProfile):
     if self.unit.subunits:
-        return self.unit.subunits[-1].out_profile.ring_temperatures
+        return _read_only_view(self.unit.subunits[-1].out_profile.ring_temperatures)
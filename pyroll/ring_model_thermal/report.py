@@ -1,9 +1,12 @@
+import html
 import shapely
 import numpy as np
 from pyroll.report import hookimpl
 from pyroll.core import Unit, PassSequence, Transport, CoolingPipe, RollPass
 from pyroll.core import DiskElementUnit
 
+from .retention import disk_profiles_released
+
 import matplotlib as mpl
 import matplotlib.pyplot as plt
 import matplotlib.collections as mcol
@@ -83,9 +86,17 @@ def disked_unit_temperature_plot(unit: Unit):
 
         ip = ax.plot(*prepare_data(unit.in_profile), c=colors[0], label="incoming profile")[0]
 
-        for i in range(1, count - 1):
-            u = unit.subunits[i - 1]
-            ax.plot(*prepare_data(u.out_profile), c=colors[i])
+        if not disk_profiles_released(unit):
+            for i in range(1, count - 1):
+                u = unit.subunits[i - 1]
+                ax.plot(*prepare_data(u.out_profile), c=colors[i])
+
+        elif getattr(unit, "ring_temperature_history", None) is not None:
+            radii, _ = prepare_data(unit.out_profile)
+            history = unit.ring_temperature_history
+
+            for i in range(1, count - 1):
+                ax.plot(radii, np.append(history.ring_temperatures[i], history.surface_temperatures[i]), c=colors[i])
 
         op = ax.plot(*prepare_data(unit.out_profile), c=colors[-1], label="outgoing profile")[0]
 
@@ -110,17 +121,12 @@ def pass_sequence_temperature_plot(unit: Unit):
         fig: plt.Figure = plt.figure()
         ax: plt.Axes = fig.subplots()
 
-        def yield_data(u: Unit, name):
-            yield getattr(u.in_profile, name, None)
-            if u.subunits:
-                for su in u.subunits:
-                    yield from yield_data(su, name)
-            yield getattr(u.out_profile, name, None)
+        history = unit.thermal_history
 
-        t = np.array(list(yield_data(unit, "t")))
-        core = np.array(list(yield_data(unit, "core_temperature")))
-        surface = np.array(list(yield_data(unit, "surface_temperature")))
-        mean = np.array(list(yield_data(unit, "temperature")))
+        t = history.t
+        core = history.core_temperatures
+        surface = history.surface_temperatures
+        mean = history.mean_temperatures
 
         ax.plot(t, core, label="core")
         ax.plot(t, surface, label="surface")
@@ -135,6 +141,47 @@ def pass_sequence_temperature_plot(unit: Unit):
         return fig
 
 
+@hookimpl(specname="unit_display")
+def thermal_solver_stats_display(unit: Unit, level: int):
+    if isinstance(unit, PassSequence):
+        rows = "\n".join(
+            f"""
+            <tr>
+                <td>{"Total" if u is unit else html.escape(str(u.label))}</td>
+                <td>{stats.solves:d}</td>
+                <td>{stats.failures:d}</td>
+                <td>{stats.iterations:d}</td>
+                <td>{stats.function_evaluations:d}</td>
+                <td>{stats.residual_norm:.2e}</td>
+                <td>{stats.surface_iterations:d}</td>
+                <td>{stats.wall_time * 1e3:.1f}</td>
+            </tr>
+            """
+            for u in [*unit.units, unit] for stats in [u.thermal_solver_stats]
+        )
+
+        return f"""
+        <h{level + 1} class='mt-4'>Thermal Solver Statistics</h{level + 1}>
+        <table class="table table-sm table-light">
+            <thead>
+            <tr>
+                <th>Unit</th>
+                <th>Solves</th>
+                <th>Failures</th>
+                <th>Iterations</th>
+                <th>Residual Evaluations</th>
+                <th>Residual Norm</th>
+                <th>Surface Iterations</th>
+                <th>Wall Time [ms]</th>
+            </tr>
+            </thead>
+            <tbody>
+            {rows}
+            </tbody>
+        </table>
+        """
+
+
 # from https://matplotlib.org/stable/gallery/text_labels_and_annotations/legend_demo.html#sphx-glr-gallery-text-labels-and-annotations-legend-demo-py
 from matplotlib.legend_handler import HandlerLineCollection
 from matplotlib.lines import Line2D
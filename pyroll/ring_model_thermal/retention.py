@@ -0,0 +1,127 @@
+import numpy as np
+
+from dataclasses import dataclass
+from typing import Optional
+
+from pyroll.core import Unit, DiskElementUnit, Hook
+
+from .config import Config
+from .profile import _read_only
+
+
+@dataclass(frozen=True)
+class RingTemperatureHistory:
+    """Compact record of the temperatures at the disk element boundaries of a unit, from entry to exit."""
+
+    t: np.ndarray
+    """Times of the disk element boundaries of shape ``(disks + 1,)``."""
+
+    ring_temperatures: np.ndarray
+    """Ring temperatures at the disk element boundaries of shape ``(disks + 1, rings)``."""
+
+    surface_temperatures: np.ndarray
+    """Surface temperatures at the disk element boundaries of shape ``(disks + 1,)``."""
+
+    @classmethod
+    def from_disk_elements(cls, unit: DiskElementUnit) -> "RingTemperatureHistory":
+        """Collect the history from the profiles of the disk elements of a solved unit."""
+        profiles = [unit.disk_elements[0].in_profile] + [d.out_profile for d in unit.disk_elements]
+
+        return cls(
+            t=_read_only([getattr(p, "t", np.nan) for p in profiles]),
+            ring_temperatures=_read_only([p.ring_temperatures for p in profiles]),
+            surface_temperatures=_read_only([p.surface_temperature for p in profiles]),
+        )
+
+    @property
+    def core_temperatures(self) -> np.ndarray:
+        """Core temperatures at the disk element boundaries."""
+        return self.ring_temperatures[:, 0]
+
+    def mean_temperatures(self, areas: np.ndarray) -> np.ndarray:
+        """Mean temperatures at the disk element boundaries, weighted by the given ring ``areas``."""
+        return self.ring_temperatures @ areas / np.sum(areas)
+
+
+@DiskElementUnit.extension_class
+class DiskElementUnitExt(DiskElementUnit):
+    ring_temperature_history = Hook[RingTemperatureHistory]()
+    """Temperatures at the disk element boundaries, available from the disk element profiles or,
+    if these were released, as kept by :py:attr:`Config.DISK_PROFILE_RETENTION`."""
+
+
+@DiskElementUnitExt.ring_temperature_history
+def ring_temperature_history(self: DiskElementUnitExt):
+    if self.disk_elements and not disk_profiles_released(self):
+        return RingTemperatureHistory.from_disk_elements(self)
+
+    return getattr(self, "_ring_temperature_history", None)
+
+
+def disk_profiles_released(unit: DiskElementUnit) -> bool:
+    """Whether the disk element profiles of ``unit`` were released after solution."""
+    return any(d.out_profile is None for d in unit.disk_elements)
+
+
+def release_disk_profiles(unit: DiskElementUnit, keep_history: bool) -> Optional[RingTemperatureHistory]:
+    """
+    Release the in and out profiles of all disk elements of a solved unit, so that they can be garbage collected.
+    The profiles are created anew if the unit is solved again.
+    The stored thermal solutions of the disk elements are reduced to the increments needed for warm starts.
+
+    :param keep_history: whether to keep the :py:class:`RingTemperatureHistory` on the unit
+    :returns: the kept history or None
+    """
+    history = RingTemperatureHistory.from_disk_elements(unit) if keep_history else None
+    unit._ring_temperature_history = history
+
+    for d in unit.disk_elements:
+        d.in_profile = None
+        d.out_profile = None
+
+        solution = getattr(d, "_thermal_solution", None)
+        if solution is not None:
+            d._thermal_solution = type(solution)(x=solution.x)
+
+    return history
+
+
+def _yield_disk_element_units(unit: Unit):
+    if isinstance(unit, DiskElementUnit) and unit.disk_elements:
+        yield unit
+
+    for u in unit.subunits or []:
+        yield from _yield_disk_element_units(u)
+
+
+class _DiskProfileRelease:
+    """
+    Post-processor applying :py:attr:`Config.DISK_PROFILE_RETENTION` to all units with disk elements
+    within a solved root unit.
+    Running only after the root unit is solved, the disk element profiles remain available as starting point
+    for the solution iterations of enclosing units, so that the results do not depend on the policy.
+    """
+
+    label = "disk profile release"
+
+    def __init__(self, unit: Unit):
+        self.unit = unit
+
+    def solve(self, out_profile):
+        for u in _yield_disk_element_units(self.unit):
+            release_disk_profiles(u, keep_history=Config.DISK_PROFILE_RETENTION == "history")
+        return out_profile
+
+
+def _disk_profile_release(unit: Unit) -> Optional[_DiskProfileRelease]:
+    if Config.DISK_PROFILE_RETENTION not in ["all", "boundaries", "history"]:
+        raise ValueError(
+            f"Unknown disk profile retention policy '{Config.DISK_PROFILE_RETENTION}', "
+            f"available are: all, boundaries, history."
+        )
+
+    if Config.DISK_PROFILE_RETENTION != "all" and unit.parent is None:
+        return _DiskProfileRelease(unit)
+
+
+Unit.post_processors.append(_disk_profile_release)
@@ -1,9 +1,12 @@
-import numpy as np
-import scipy.optimize as scopt
 
-from typing import Union
+from typing import Union, Tuple, Callable, Dict
 from .config import Config
+from .incremental import register_thermal_inputs
+from .kernel import RingSystem
 from .profile import Profile
+from ._units import register_step_system
+from .solvers import solve_ring_system
+from .surface import register_surface_balance, memoized_surface_temperature
 from pyroll.core import SymmetricRollPass, RollPass, Hook, DeformationUnit, root_hooks
 
 
@@ -45,88 +48,120 @@ def heat_transfer_coefficient(self: SymmetricRollPass):
     return 150
 
 
-def get_increments(unit: DeformationUnit, roll_pass: SymmetricRollPassExt, ring_temperatures) -> np.ndarray:
-    p: Profile = unit.in_profile
-
-    increments = np.zeros_like(ring_temperatures)
-
-    deformation_resistance = (
-        unit.deformation_resistance
-        if unit.has_value("deformation_resistance")
-        else (unit.in_profile.flow_stress + 2 * unit.out_profile.flow_stress) / 3
-    )
-
-    source_density = roll_pass.deformation_heat_efficiency * deformation_resistance * unit.strain_rate
-
-    cross_section = p.ring_sections[0].area
-    increments[0] = unit.duration / (p.density * p.specific_heat_capacity * cross_section) * (
-            (ring_temperatures[1] - ring_temperatures[0]) * p.ring_contours[1].length
-            / p.rings[1] * p.thermal_conductivity
-            + source_density * cross_section
-    )
-
+def _free_surface_ratio(unit: DeformationUnit) -> float:
     try:
-        free_surface_ratio = unit.free_surface_area / unit.surface_area
+        return unit.free_surface_area / unit.surface_area
     except AttributeError:
-        free_surface_ratio = 0
+        return 0
 
-    cross_section = p.ring_sections[-1].area
 
-    roll_contact_transfer = (
-            roll_pass.roll.heat_transfer_coefficient * (roll_pass.roll.temperature - p.surface_temperature)
-            * p.ring_contours[-1].length * (1 - free_surface_ratio)
-    )
+def _heat_flux(
+        roll_heat_transfer_coefficient: float, roll_temperature: float, free_surface_ratio: float,
+        heat_transfer_coefficient: float, environment_temperature: float, radiation_coefficient: float,
+        contour_length: float = 1,
+) -> Tuple[Callable, Callable]:
+    """Heat flux density by roll contact and by convection and radiation to atmosphere at the free surface
+    and its derivative as functions of the surface temperature, multiplied by ``contour_length``."""
+    contact_ratio = 1 - free_surface_ratio
 
-    if Config.ROLL_PASS_ATMOSPHERE_TRANSFER:
+    def flux(ts):
+        roll_contact_transfer = roll_heat_transfer_coefficient * (roll_temperature - ts) * contact_ratio
         atmosphere_transfer = (
                 (
-                        roll_pass.heat_transfer_coefficient
-                        * (roll_pass.environment_temperature - p.surface_temperature)
-                        + Config.RADIATION_COEFFICIENT * p.relative_radiation_coefficient
-                        * (roll_pass.environment_temperature ** 4 - p.surface_temperature ** 4)
+                        heat_transfer_coefficient * (environment_temperature - ts)
+                        + radiation_coefficient * (environment_temperature ** 4 - ts ** 4)
                 )
-                * p.ring_contours[-1].length * free_surface_ratio
+                * free_surface_ratio
+        )
+        return (roll_contact_transfer + atmosphere_transfer) * contour_length
+
+    def derivative(ts):
+        return (
+                - roll_heat_transfer_coefficient * contact_ratio
+                - (heat_transfer_coefficient + 4 * radiation_coefficient * ts ** 3) * free_surface_ratio
+        ) * contour_length
+
+    return flux, derivative
+
+
+def _boundary_parameters(roll_pass: SymmetricRollPassExt, p: Profile, free_surface_ratio: float) -> Dict[str, float]:
+    if Config.ROLL_PASS_ATMOSPHERE_TRANSFER:
+        atmosphere = dict(
+            heat_transfer_coefficient=roll_pass.heat_transfer_coefficient,
+            environment_temperature=roll_pass.environment_temperature,
+            radiation_coefficient=Config.RADIATION_COEFFICIENT * p.relative_radiation_coefficient,
         )
     else:
-        atmosphere_transfer = 0
-
-    increments[-1] = unit.duration / (p.density * p.specific_heat_capacity * cross_section) * (
-            roll_contact_transfer + atmosphere_transfer
-            - p.thermal_conductivity * (ring_temperatures[-1] - ring_temperatures[-2])
-            / (p.rings[-1] - p.rings[-2])
-            * p.ring_contours[-2].length
-            + source_density * cross_section
+        atmosphere = dict(heat_transfer_coefficient=0, environment_temperature=0, radiation_coefficient=0)
+
+    return dict(
+        roll_heat_transfer_coefficient=roll_pass.roll.heat_transfer_coefficient,
+        roll_temperature=roll_pass.roll.temperature,
+        free_surface_ratio=free_surface_ratio,
+        **atmosphere,
     )
 
-    for i in range(1, len(increments) - 1):
-        cross_section = p.ring_sections[i].area
-        increments[i] = unit.duration / (p.density * p.specific_heat_capacity * cross_section) * (
-                p.thermal_conductivity
-                * (
-                        (ring_temperatures[i + 1] - ring_temperatures[i]) * p.ring_contours[i + 1].length
-                        / (p.rings[i + 1] - p.rings[i])
-                        - (ring_temperatures[i] - ring_temperatures[i - 1]) * p.ring_contours[i].length
-                        / (p.rings[i] - p.rings[i - 1])
-                )
-                + source_density * cross_section
-        )
 
-    return increments
+def _balance_parameters(roll_pass: SymmetricRollPassExt, p: Profile) -> Dict[str, float]:
+    """The free surface ratio of the whole roll pass is used, also for its disk elements."""
+    return _boundary_parameters(roll_pass, p, _free_surface_ratio(roll_pass)) | dict(
+        contour_length=p.ring_geometry.contour_lengths[-1]
+    )
 
 
-def _solve_step(unit, roll_pass, in_ring_temperatures):
-    x0 = get_increments(unit, roll_pass, in_ring_temperatures)
+register_thermal_inputs(SymmetricRollPass, [
+    "duration", "environment_temperature", "heat_transfer_coefficient", "deformation_heat_efficiency",
+    "roll.temperature", "roll.heat_transfer_coefficient", "disk_element_count",
+])
+
 
-    def f(x):
-        out_ring_temperatures = in_ring_temperatures + x
-        return get_increments(unit, roll_pass, out_ring_temperatures) - x
+@register_surface_balance(SymmetricRollPass)
+def _surface_balance(roll_pass: SymmetricRollPassExt, p: Profile):
+    return _balance_parameters(roll_pass, p), _heat_flux
 
-    sol = scopt.root(f, x0=x0)
 
-    if not sol.success:
-        raise RuntimeError(f"Numerical procedure did not succeed: {sol.message}.")
+def _ring_system(unit: DeformationUnit, roll_pass: SymmetricRollPassExt, p: Profile) -> RingSystem:
+    deformation_resistance = (
+        unit.deformation_resistance
+        if unit.has_value("deformation_resistance")
+        else (unit.in_profile.flow_stress + 2 * unit.out_profile.flow_stress) / 3
+    )
+
+    source_density = roll_pass.deformation_heat_efficiency * deformation_resistance * unit.strain_rate
+    boundary_parameters = _boundary_parameters(roll_pass, p, _free_surface_ratio(unit))
+    balance_parameters = _balance_parameters(roll_pass, p)
+    surface_heat_flux, surface_heat_flux_derivative = _heat_flux(**boundary_parameters)
+    surface_balance_flux, surface_balance_flux_derivative = _heat_flux(**balance_parameters)
+
+    return RingSystem(
+        duration=unit.duration,
+        density=p.density,
+        specific_heat_capacity=p.specific_heat_capacity,
+        thermal_conductivity=p.thermal_conductivity,
+        geometry=p.ring_geometry,
+        surface_heat_flux=surface_heat_flux,
+        surface_heat_flux_derivative=surface_heat_flux_derivative,
+        surface_balance_flux=surface_balance_flux,
+        surface_balance_flux_derivative=surface_balance_flux_derivative,
+        source_density=source_density,
+        boundary_parameters=boundary_parameters,
+        balance_parameters=balance_parameters,
+        flux_factory=_heat_flux,
+    )
+
+
+@register_step_system(SymmetricRollPass)
+def _step_system(unit: DeformationUnit, roll_pass: SymmetricRollPassExt) -> Tuple[RingSystem, bool]:
+    return _ring_system(unit, roll_pass, unit.in_profile), True
+
 
-    return in_ring_temperatures + sol.x
+def _solve_step(unit, roll_pass, in_ring_temperatures):
+    p: Profile = unit.in_profile
+    # the surface temperature of the in profile is the boundary condition of roll passes, also with coupling
+    ring_temperatures, _ = solve_ring_system(
+        unit, _ring_system(unit, roll_pass, p), in_ring_temperatures, p.surface_temperature, coupled=False
+    )
+    return ring_temperatures
 
 
 @SymmetricRollPass.OutProfile.ring_temperatures
@@ -146,54 +181,7 @@ def ring_temperatures_disk(self: Union[RollPass.DiskElement.OutProfile, Profile]
 
 
 def _surface_temperature(self: Union[RollPass.Profile, Profile]):
-    roll_pass: SymmetricRollPassExt = self.roll_pass
-
-    try:
-        free_surface_ratio = roll_pass.free_surface_area / roll_pass.surface_area
-    except AttributeError:
-        free_surface_ratio = 0
-
-    def f(ts):
-        roll_contact_transfer = (
-                roll_pass.roll.heat_transfer_coefficient * (roll_pass.roll.temperature - ts)
-                * self.ring_contours[-1].length * (1 - free_surface_ratio)
-        )
-
-        if Config.ROLL_PASS_ATMOSPHERE_TRANSFER:
-            atmosphere_transfer = (
-                    (
-                            roll_pass.heat_transfer_coefficient
-                            * (roll_pass.environment_temperature - ts)
-                            + Config.RADIATION_COEFFICIENT * self.relative_radiation_coefficient
-                            * (roll_pass.environment_temperature ** 4 - ts ** 4)
-                    )
-                    * self.ring_contours[-1].length * free_surface_ratio
-            )
-        else:
-            atmosphere_transfer = 0
-
-        return (
-                roll_contact_transfer + atmosphere_transfer
-                - self.thermal_conductivity
-                * (ts - self.ring_temperatures[-1])
-                / (self.equivalent_radius - self.rings[-1])
-        )
-
-    def fprime(ts):
-        return (
-                - roll_pass.roll.heat_transfer_coefficient * (1 - free_surface_ratio)
-                - ((
-                           roll_pass.heat_transfer_coefficient
-                           + 4 * Config.RADIATION_COEFFICIENT * self.relative_radiation_coefficient
-                           * ts ** 3
-                   ) * free_surface_ratio if Config.ROLL_PASS_ATMOSPHERE_TRANSFER else 0)
-                - self.thermal_conductivity / (self.equivalent_radius - self.rings[-1])
-        )
-
-    sol = scopt.root_scalar(f=f, fprime=fprime, x0=self.ring_temperatures[-1], method="newton")
-
-    if sol.converged:
-        return sol.root
+    return memoized_surface_temperature(self)
 
 
 @SymmetricRollPass.Profile.surface_temperature
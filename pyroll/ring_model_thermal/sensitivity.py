@@ -0,0 +1,179 @@
+import numpy as np
+import scipy.linalg as sclin
+
+from dataclasses import dataclass
+from typing import Any, List, Optional, Sequence, Tuple
+
+from pyroll.core import Unit, DiskElementUnit
+
+from ._units import step_system_factory, yield_steps
+from .kernel import RingSystem, flux_parameter_derivative
+from .profile import Profile, remap_ring_temperatures
+from .surface import _surface_balance
+
+Parameter = Tuple[Any, str]
+"""A parameter given as pair of its owner (a unit or a roll) and the name of its hook,
+like ``(cooling_pipe, "heat_transfer_coefficient")`` or ``(roll_pass.roll, "heat_transfer_coefficient")``."""
+
+@dataclass(frozen=True)
+class TemperatureSensitivities:
+    """Derivatives of the outlet temperatures of a solved unit with respect to a set of parameters."""
+
+    parameters: List[Parameter]
+    """The parameters, in the order of the rows."""
+
+    ring_temperatures: np.ndarray
+    """Derivatives of the outlet ring temperatures of shape ``(parameters, rings)``."""
+
+    core_temperature: np.ndarray
+    """Derivatives of the outlet core temperature per parameter."""
+
+    surface_temperature: np.ndarray
+    """Derivatives of the outlet surface temperature per parameter."""
+
+    mean_temperature: np.ndarray
+    """Derivatives of the outlet mean temperature per parameter."""
+
+
+def _boundary_names(parent: Unit, parameters: Sequence[Parameter]) -> List[Optional[str]]:
+    """Names of the boundary parameters of the steps of ``parent`` corresponding to ``parameters``."""
+    roll = getattr(parent, "roll", None)
+
+    return [
+        name if owner is parent else f"roll_{name}" if roll is not None and owner is roll else None
+        for owner, name in parameters
+    ]
+
+
+def _surface_sensitivity(
+        profile: Profile, sensitivities: np.ndarray, parameters: Sequence[Parameter]
+) -> np.ndarray:
+    """Derivatives of the surface temperature of ``profile`` given the derivatives of its ring temperatures,
+    from the heat balance at the surface registered for its unit, if any, otherwise of the outer ring temperature."""
+    balance = _surface_balance(profile)
+    if balance is None:
+        return sensitivities[:, -1]
+
+    balance_parameters, flux_factory = balance
+    unit = profile.unit.parent if isinstance(profile.unit, DiskElementUnit.DiskElement) else profile.unit
+    names = _boundary_names(unit, parameters)
+
+    surface_temperature = profile.surface_temperature
+    conductance = profile.thermal_conductivity / profile.ring_geometry.surface_distance
+    derivative = flux_factory(**balance_parameters)[1](surface_temperature) - conductance
+    parameter_derivatives = np.array([
+        flux_parameter_derivative(flux_factory, balance_parameters, n, surface_temperature) if n else 0
+        for n in names
+    ])
+
+    return -(conductance * sensitivities[:, -1] + parameter_derivatives) / derivative
+
+
+def _step_sensitivities(
+        unit: Unit, system: RingSystem, explicit_surface: bool, names: Sequence[Optional[str]],
+        in_sensitivities: np.ndarray,
+) -> np.ndarray:
+    """
+    Propagate the derivatives of the ring temperatures through the implicit step of ``unit``
+    by one banded linear solve with the step Jacobian for all parameters at once.
+    """
+    out_ring_temperatures = unit.out_profile.ring_temperatures
+    surface_factor = system.factors[-1] * system.geometry.contour_lengths[-1]
+    rings = len(out_ring_temperatures)
+
+    if explicit_surface:
+        # surface temperature fixed during the step at the value balanced with the in state
+        in_ring_temperatures = unit.in_profile.ring_temperatures
+        surface_temperature = system.surface_temperature(in_ring_temperatures[-1])
+        derivatives = np.array([
+            system.parameter_derivatives(n, surface_temperature) if n else (0, 0) for n in names
+        ]).reshape(len(names), 2)
+
+        surface_sensitivities = -(
+                system.surface_conductance * in_sensitivities[:, -1] + derivatives[:, 1]
+        ) / (system.surface_balance_flux_derivative(surface_temperature) - system.surface_conductance)
+
+        rhs = -in_sensitivities.copy()
+        rhs[:, -1] -= surface_factor * (
+                derivatives[:, 0] + system.surface_heat_flux_derivative(surface_temperature) * surface_sensitivities
+        )
+
+        jacobian = system.jacobian()
+        jacobian[1] -= 1
+        return sclin.solve_banded((1, 1), jacobian, rhs.T, overwrite_ab=True).T
+
+    # surface temperature balanced with the out state, as solved by coupling or by the lagged iteration
+    surface_temperature = system.surface_temperature(out_ring_temperatures[-1])
+    derivatives = np.array([
+        system.parameter_derivatives(n, surface_temperature) if n else (0, 0) for n in names
+    ]).reshape(len(names), 2)
+
+    rhs = np.zeros((len(names), rings + 1))
+    rhs[:, :rings] = -in_sensitivities
+    rhs[:, rings - 1] -= surface_factor * derivatives[:, 0]
+    rhs[:, rings] = -derivatives[:, 1]
+
+    jacobian = system.coupled_jacobian(np.append(out_ring_temperatures, surface_temperature))
+    jacobian[1, :rings] -= 1
+    return sclin.solve_banded((1, 1), jacobian, rhs.T, overwrite_ab=True).T[:, :rings]
+
+
+def temperature_sensitivities(unit: Unit, parameters: Sequence[Parameter]) -> TemperatureSensitivities:
+    """
+    Derivatives of the outlet temperatures of a solved unit (like a pass sequence)
+    with respect to boundary parameters, like heat transfer coefficients of transports, cooling pipes and rolls.
+
+    The derivatives of the ring temperatures are propagated forward through the converged time steps of the solution,
+    each by one banded linear solve with the step Jacobian for all parameters at once,
+    instead of solving the whole unit again per parameter as with finite differences.
+    A parameter affects the steps of its owner, or of the roll passes using it for roll parameters.
+    Material properties and deformation heat are held fixed, disk element values are assumed to follow their unit.
+    With :py:attr:`Config.ADAPTIVE_TIME_STEPPING`, the derivatives are those of one step per disk element.
+
+    :param unit: the solved unit, the disk element profiles must be retained,
+        see :py:attr:`Config.DISK_PROFILE_RETENTION`
+    :param parameters: the parameters as pairs of owner and hook name, see :py:data:`Parameter`
+    :raises ValueError: if the disk element profiles were released or if a parameter is not a boundary parameter
+        of any step within ``unit``
+    """
+    parameters = list(parameters)
+    sensitivities = None
+    last_profile = None
+    used = np.zeros(len(parameters), dtype=bool)
+
+    for step, parent in yield_steps(unit):
+        if step.in_profile is None or step.out_profile is None:
+            raise ValueError(f"Sensitivities require the profiles of {step}, which were released after solution.")
+
+        if sensitivities is None:
+            sensitivities = np.zeros((len(parameters), len(step.in_profile.ring_temperatures)))
+
+        factory = step_system_factory(parent)
+        system = factory(step, parent) if factory is not None else None
+
+        if system is None:
+            sensitivities = np.asarray(remap_ring_temperatures(step.in_profile, step.out_profile, sensitivities.T)).T
+        else:
+            step_system, explicit_surface = system
+            names = _boundary_names(parent, parameters)
+            used |= [
+                n is not None and (n in step_system.boundary_parameters or n in step_system.balance_parameters)
+                for n in names
+            ]
+            sensitivities = _step_sensitivities(step, step_system, explicit_surface, names, sensitivities)
+
+        last_profile = step.out_profile
+
+    if not np.all(used):
+        unknown = ", ".join(f"{name} of {owner}" for (owner, name), u in zip(parameters, used) if not u)
+        raise ValueError(f"No boundary parameters of the thermal steps within {unit}: {unknown}.")
+
+    areas = last_profile.ring_geometry.areas
+
+    return TemperatureSensitivities(
+        parameters=parameters,
+        ring_temperatures=sensitivities,
+        core_temperature=sensitivities[:, 0],
+        surface_temperature=_surface_sensitivity(unit.out_profile, sensitivities, parameters),
+        mean_temperature=sensitivities @ areas / np.sum(areas),
+    )
@@ -0,0 +1,778 @@
+import time
+
+from collections import OrderedDict
+from typing import Callable, Dict, Optional, Tuple
+
+import numpy as np
+import scipy.linalg as sclin
+import scipy.optimize as scopt
+
+from pyroll.core import Unit, DiskElementUnit, root_hooks
+
+from .config import Config
+from .kernel import RingSystem
+from .step_cache import step_key, cached_step, cache_step
+from .unit import own_thermal_solver_stats
+
+
+class StepProblem:
+    """
+    Represents the implicit time step ``y_out = y_in + increments(y_out)`` of the thermal state of a unit.
+    The state holds the ring temperatures and optionally trailing algebraic unknowns (like the surface temperature),
+    for which ``increments`` yields the residual of their defining equation instead of an increment.
+    The unknowns of the step are the increments of the state ``x = y_out - y_in``.
+    """
+
+    def __init__(
+            self,
+            in_state: np.ndarray,
+            increments: Callable[..., np.ndarray],
+            jacobian: Callable[..., np.ndarray],
+            algebraic: int = 0,
+            buffered: bool = False,
+    ):
+        """
+        :param in_state: the state at the beginning of the step
+        :param increments: function yielding the increments of the state over the whole step duration
+        :param jacobian: function yielding the Jacobian of ``increments`` in banded storage
+            with one upper and one lower diagonal
+        :param algebraic: count of trailing algebraic unknowns in the state
+        :param buffered: whether ``increments`` and ``jacobian`` accept an ``out`` keyword argument to write their
+            result into, so that :py:meth:`residual` and :py:meth:`residual_jacobian` use preallocated work buffers
+        """
+        self.in_state = in_state
+        self.increments = increments
+        self.jacobian = jacobian
+        self.algebraic = algebraic
+        self.buffered = buffered
+
+        self._state = np.empty(np.shape(in_state))
+        self._residual = np.empty(np.shape(in_state)) if buffered else None
+        self._jacobian = np.empty((3, len(in_state))) if buffered else None
+
+    @property
+    def differential(self) -> slice:
+        """Slice selecting the differential (time-stepped) part of the state."""
+        return slice(0, len(self.in_state) - self.algebraic)
+
+    def residual(self, x: np.ndarray) -> np.ndarray:
+        """
+        Residual of the implicit Euler step for the increments ``x``.
+        If :py:attr:`buffered`, the result is a work buffer overwritten by the next call.
+        """
+        state = np.add(self.in_state, x, out=self._state)
+        r = self.increments(state, out=self._residual) if self.buffered else self.increments(state)
+        r[self.differential] -= x[self.differential]
+        return r
+
+    def residual_jacobian(self, x: np.ndarray) -> np.ndarray:
+        """
+        Banded Jacobian of :py:meth:`residual`.
+        If :py:attr:`buffered`, the result is a work buffer overwritten by the next call.
+        """
+        state = np.add(self.in_state, x, out=self._state)
+        j = self.jacobian(state, out=self._jacobian) if self.buffered else self.jacobian(state)
+        j[1, self.differential] -= 1
+        return j
+
+    def solve_algebraic(self, state: np.ndarray, max_iterations: int = 50) -> np.ndarray:
+        """Solve the algebraic part of ``state`` in place for fixed differential part by Newton's method."""
+        for _ in range(max_iterations if self.algebraic else 0):
+            r = self.increments(state)[self.differential.stop:]
+            state[self.differential.stop:] -= r / self.jacobian(state)[1, self.differential.stop:]
+
+            if np.all(np.abs(r) <= 1e-9 * np.abs(state[self.differential.stop:])):
+                break
+
+        return state
+
+
+SOLVERS: Dict[str, Callable[..., scopt.OptimizeResult]] = {}
+"""Registry of the available thermal solver backends by name."""
+
+
+def register_solver(name: str):
+    """
+    Decorator for adding a solver backend to :py:data:`SOLVERS`.
+
+    A backend is called with the :py:class:`StepProblem`, the initial guess ``x0`` of the increments and the
+    keyword arguments ``absolute_tolerance``, ``relative_tolerance`` and ``max_iterations``.
+    It must return a :py:class:`scipy.optimize.OptimizeResult` containing the increments as ``x``.
+    """
+
+    def dec(func):
+        SOLVERS[name] = func
+        return func
+
+    return dec
+
+
+def newton_banded(
+        residual: Callable[[np.ndarray], np.ndarray],
+        jacobian: Callable[[np.ndarray], np.ndarray],
+        x0: np.ndarray,
+        scale: np.ndarray,
+        absolute_tolerance: float = 1e-6,
+        relative_tolerance: float = 1e-9,
+        max_iterations: int = 50,
+) -> scopt.OptimizeResult:
+    """
+    Newton iteration for systems with tridiagonal Jacobian, solving each linear system in O(N).
+
+    :param residual: the residual function to find the root of
+    :param jacobian: the Jacobian of ``residual`` in banded storage with one upper and one lower diagonal,
+        the returned array is overwritten during the solution of the linear system
+    :param x0: the initial guess
+    :param scale: magnitude of the solution quantity used for the relative tolerance
+    :param absolute_tolerance: absolute tolerance of the residual
+    :param relative_tolerance: tolerance of the residual relative to ``scale``
+    :param max_iterations: maximum count of Newton iterations
+    """
+    x = np.array(x0, dtype=float)
+    tolerance = absolute_tolerance + relative_tolerance * np.abs(scale)
+
+    for i in range(max_iterations + 1):
+        f = residual(x)
+
+        if np.all(np.abs(f) <= tolerance):
+            return scopt.OptimizeResult(
+                x=x, fun=f, success=True, message="The solution converged.", nit=i, nfev=i + 1, njev=i
+            )
+
+        if i == max_iterations:
+            break
+
+        x -= sclin.solve_banded((1, 1), jacobian(x), f, overwrite_ab=True, check_finite=False)
+
+    return scopt.OptimizeResult(
+        x=x, fun=f, success=False, message=f"Maximum count of {max_iterations} iterations exceeded.",
+        nit=max_iterations, nfev=max_iterations + 1, njev=max_iterations
+    )
+
+
+def solve_banded_batched(jacobians: np.ndarray, rhs: np.ndarray) -> np.ndarray:
+    """
+    Solve a batch of tridiagonal systems by the Thomas algorithm, vectorized over the batch.
+    The systems must be diagonally dominant, as no pivoting is done.
+
+    :param jacobians: matrices in banded storage of shape ``(batch, 3, N)`` or ``(3, N)`` if shared by all systems
+    :param rhs: right hand sides of shape ``(batch, N)``
+    """
+    jacobians = np.broadcast_to(jacobians, rhs.shape[:-1] + (3, rhs.shape[-1]))
+    upper = jacobians[:, 0]
+    diagonal = jacobians[:, 1]
+    lower = jacobians[:, 2]
+
+    c = np.empty_like(rhs, dtype=float)
+    d = np.empty_like(rhs, dtype=float)
+    c[:, 0] = upper[:, 1] / diagonal[:, 0] if rhs.shape[-1] > 1 else 0
+    d[:, 0] = rhs[:, 0] / diagonal[:, 0]
+
+    for i in range(1, rhs.shape[-1]):
+        denominator = diagonal[:, i] - lower[:, i - 1] * c[:, i - 1]
+        c[:, i] = upper[:, i + 1] / denominator if i + 1 < rhs.shape[-1] else 0
+        d[:, i] = (rhs[:, i] - lower[:, i - 1] * d[:, i - 1]) / denominator
+
+    x = d
+    for i in range(rhs.shape[-1] - 2, -1, -1):
+        x[:, i] -= c[:, i] * x[:, i + 1]
+
+    return x
+
+
+def newton_banded_batched(
+        residual: Callable[[np.ndarray, np.ndarray], np.ndarray],
+        jacobian: Callable[[np.ndarray, np.ndarray], np.ndarray],
+        x0: np.ndarray,
+        scale: np.ndarray,
+        absolute_tolerance: float = 1e-6,
+        relative_tolerance: float = 1e-9,
+        max_iterations: int = 50,
+) -> scopt.OptimizeResult:
+    """
+    :py:func:`newton_banded` for a batch of independent systems of equal size.
+
+    Each system is checked for convergence separately and dropped from the iteration once converged,
+    so that the residual and Jacobian are only evaluated for the still active systems.
+
+    :param residual: function of the active unknowns ``x[index]`` and the active ``index``
+        returning the residuals of shape ``(len(index), N)``
+    :param jacobian: function of the active unknowns and ``index`` returning the banded Jacobians
+        of shape ``(len(index), 3, N)``
+    :param x0: initial guesses of shape ``(batch, N)``
+    :param scale: magnitude of the solution quantities used for the relative tolerance, shape ``(batch, N)``
+    :returns: result with the unknowns ``x``, per system ``success`` masks and iteration counts ``nit``
+    """
+    x = np.array(x0, dtype=float)
+    tolerance = absolute_tolerance + relative_tolerance * np.abs(np.broadcast_to(scale, x.shape))
+    iterations = np.zeros(len(x), dtype=int)
+    active = np.arange(len(x))
+    nfev = 0
+
+    for i in range(max_iterations + 1):
+        f = residual(x[active], active)
+        nfev += len(active)
+
+        converged = np.all(np.abs(f) <= tolerance[active], axis=-1)
+        active = active[~converged]
+        f = f[~converged]
+
+        if not len(active) or i == max_iterations:
+            break
+
+        x[active] -= solve_banded_batched(jacobian(x[active], active), f)
+        iterations[active] += 1
+
+    success = np.ones(len(x), dtype=bool)
+    success[active] = False
+
+    return scopt.OptimizeResult(
+        x=x, success=success, nit=iterations, nfev=nfev,
+        message="The solution converged." if np.all(success) else
+        f"Maximum count of {max_iterations} iterations exceeded for {len(active)} systems."
+    )
+
+
+@register_solver("hybr")
+def hybr(problem: StepProblem, x0: np.ndarray, relative_tolerance: float, max_iterations: int, **kwargs):
+    """
+    Powell's hybrid method of scipy with dense finite-difference Jacobian.
+    The residuals of algebraic unknowns (like the heat balance at the surface) are divided by their derivative
+    at ``x0``, so that all residuals are in temperature units. Otherwise, the heat flux residuals outweigh the
+    temperature residuals by orders of magnitude and the method stalls on small steps.
+    """
+    scale = np.ones(len(x0))
+    if problem.algebraic:
+        algebraic = slice(problem.differential.stop, None)
+        scale[algebraic] = 1 / np.abs(problem.residual_jacobian(x0)[1, algebraic])
+
+    return scopt.root(
+        lambda x: problem.residual(x) * scale, x0=x0, method="hybr",
+        options=dict(xtol=relative_tolerance, maxfev=max_iterations * (len(x0) + 1))
+    )
+
+
+@register_solver("banded_newton")
+def banded_newton(problem: StepProblem, x0: np.ndarray, **kwargs):
+    """Newton iteration on the implicit Euler step using the analytic tridiagonal Jacobian."""
+    return newton_banded(problem.residual, problem.residual_jacobian, x0=x0, scale=problem.in_state, **kwargs)
+
+
+@register_solver("crank_nicolson")
+def crank_nicolson(problem: StepProblem, x0: np.ndarray, **kwargs):
+    """Newton iteration on the second order accurate trapezoidal (Crank-Nicolson) step."""
+    differential = problem.differential
+    in_increments = problem.increments(problem.solve_algebraic(np.array(problem.in_state, dtype=float)))[differential]
+
+    def f(x):
+        r = problem.increments(problem.in_state + x)
+        r[differential] = 0.5 * (in_increments + r[differential]) - x[differential]
+        return r
+
+    def jac(x):
+        n = differential.stop
+        j = problem.jacobian(problem.in_state + x)
+        j[0, 1:n + 1] *= 0.5  # only the differential rows are averaged
+        j[1, :n] *= 0.5
+        j[2, :n - 1] *= 0.5
+        j[1, :n] -= 1
+        return j
+
+    sol = newton_banded(f, jac, x0=x0, scale=problem.in_state, **kwargs)
+    sol.nfev += 1
+    return sol
+
+
+@register_solver("explicit")
+def explicit(problem: StepProblem, max_iterations: int, **kwargs):
+    """
+    Explicit Euler scheme sub-cycled within the step.
+    The count of sub-steps is chosen from the Gershgorin bound of the Jacobian, so that the scheme is stable.
+    Fails if more than ``max_iterations`` sub-steps would be needed.
+    """
+    differential = problem.differential
+    state = problem.solve_algebraic(np.array(problem.in_state, dtype=float))
+    j = problem.jacobian(state)[:, differential]
+    spectral_bound = np.max(np.abs(j[1]) + np.abs(np.append(j[0, 1:], 0)) + np.abs(np.append(0, j[2, :-1])))
+    count = max(1, int(np.ceil(spectral_bound / 2)))
+
+    if count > max_iterations:
+        return scopt.OptimizeResult(
+            x=np.zeros_like(state), success=False, nit=0, nfev=1,
+            message=f"Stability requires {count} explicit sub-steps, more than the maximum of {max_iterations}."
+        )
+
+    for _ in range(count):
+        state[differential] += problem.increments(state)[differential] / count
+        problem.solve_algebraic(state)
+
+    return scopt.OptimizeResult(
+        x=state - problem.in_state, success=True, nit=count, nfev=count,
+        message=f"Finished {count} explicit sub-steps."
+    )
+
+
+_PROPAGATORS: "OrderedDict[bytes, np.ndarray]" = OrderedDict()
+
+
+def _phi1(values: np.ndarray) -> np.ndarray:
+    """``(exp(z) - 1) / z`` evaluated without cancellation near zero."""
+    small = np.abs(values) < 1e-8
+    return np.where(small, 1 + values / 2, np.expm1(values) / np.where(small, 1, values))
+
+
+def phi1_propagator(jacobian: np.ndarray) -> Optional[np.ndarray]:
+    """
+    Dense matrix ``phi1(J) = J^-1 (exp(J) - I)`` of a tridiagonal matrix ``J`` given in banded storage.
+
+    The products of opposite off-diagonal entries must be positive, as for heat conduction,
+    so that ``J`` is similar to a symmetric matrix by a diagonal scaling, whose eigen-decomposition is used.
+    The results are cached by the matrix entries,
+    holding at most :py:attr:`Config.EXPONENTIAL_PROPAGATOR_CACHE_SIZE` recently used propagators.
+
+    :returns: the propagator or None if ``J`` is not symmetrizable
+    """
+    key = jacobian.tobytes()
+    propagator = _PROPAGATORS.get(key)
+
+    if propagator is not None:
+        _PROPAGATORS.move_to_end(key)
+        return propagator
+
+    upper = jacobian[0, 1:]
+    lower = jacobian[2, :-1]
+    products = upper * lower
+
+    if np.any(products <= 0):
+        return None
+
+    # D J D^-1 is symmetric for d[i + 1] = d[i] * sqrt(upper[i] / lower[i])
+    scaling = np.exp(np.concatenate([[0], np.cumsum(0.5 * np.log(upper / lower))]))
+    eigenvalues, eigenvectors = sclin.eigh_tridiagonal(jacobian[1], np.sign(upper) * np.sqrt(products))
+
+    propagator = (eigenvectors * _phi1(eigenvalues)) @ eigenvectors.T
+    propagator *= scaling[np.newaxis, :] / scaling[:, np.newaxis]
+    propagator.setflags(write=False)
+
+    _PROPAGATORS[key] = propagator
+    while len(_PROPAGATORS) > Config.EXPONENTIAL_PROPAGATOR_CACHE_SIZE:
+        _PROPAGATORS.popitem(last=False)
+
+    return propagator
+
+
+@register_solver("exponential")
+def exponential(problem: StepProblem, **kwargs):
+    """
+    Exponential Rosenbrock-Euler step ``y_out = y_in + phi1(J) F(y_in)`` with the increments ``F``
+    and their Jacobian ``J`` at the entry state, see :py:func:`phi1_propagator`.
+    Exact for increments linear in the ring temperatures, as with the lagged surface temperature,
+    otherwise the radiation boundary term is linearised at the entry state.
+    An algebraic surface temperature is eliminated by the Schur complement of its linearised balance equation
+    and finally corrected to fulfill the nonlinear one for the outgoing ring temperatures.
+    """
+    if problem.algebraic > 1:
+        return scopt.OptimizeResult(
+            x=np.zeros_like(problem.in_state), success=False, nit=0, nfev=0,
+            message="The exponential integrator supports at most one algebraic unknown."
+        )
+
+    state = np.array(problem.in_state, dtype=float)
+    f = problem.increments(state)
+    j = problem.jacobian(state)
+    n = problem.differential.stop
+
+    reduced_jacobian = np.array(j[:, :n])
+    reduced_increments = f[:n]
+
+    if problem.algebraic:
+        coupling_in = j[0, n]  # derivative of the most outer ring increment by the surface temperature
+        coupling_out = j[2, n - 1]  # derivative of the surface balance by the most outer ring temperature
+        diagonal = j[1, n]
+
+        reduced_jacobian[2, n - 1] = 0
+        reduced_jacobian[1, n - 1] -= coupling_in * coupling_out / diagonal
+        reduced_increments[n - 1] -= coupling_in * f[n] / diagonal
+
+    propagator = phi1_propagator(reduced_jacobian)
+
+    if propagator is None:
+        return scopt.OptimizeResult(
+            x=np.zeros_like(state), success=False, nit=0, nfev=1,
+            message="The Jacobian is not similar to a symmetric matrix."
+        )
+
+    x = np.empty_like(state)
+    x[:n] = propagator @ reduced_increments
+
+    if problem.algebraic:
+        x[n] = -(f[n] + coupling_out * x[n - 1]) / diagonal
+        x = problem.solve_algebraic(state + x) - state
+
+    return scopt.OptimizeResult(x=x, success=True, nit=1, nfev=1, message="Finished exponential step.")
+
+
+def _initial_guess(unit: Unit, problem: StepProblem, duration: Optional[float] = None) -> np.ndarray:
+    """
+    Initial guess of the step increments.
+    Uses the last solution of the unit itself (from a previous iteration of the solution loop
+    or a previous sub-step, scaled by the duration ratio if both durations are known),
+    else the solution of the previous disk element scaled by the duration ratio,
+    else the explicit Euler increments.
+    """
+    if Config.THERMAL_SOLVER_WARM_START:
+        last = getattr(unit, "_thermal_solution", None)
+        if last is not None and len(last.x) == len(problem.in_state):
+            last_duration = last.get("duration")
+            if duration is not None and last_duration:
+                return last.x * (duration / last_duration)
+
+            return np.copy(last.x)
+
+        if isinstance(unit, DiskElementUnit.DiskElement):
+            try:
+                prev = unit.prev
+            except IndexError:
+                prev = None
+
+            last = getattr(prev, "_thermal_solution", None)
+            if last is not None and len(last.x) == len(problem.in_state):
+                return last.x * (unit.duration / prev.duration)
+
+    x0 = problem.increments(problem.in_state)
+    x0[problem.differential.stop:] = 0
+    return x0
+
+
+def solve_step(
+        unit: Unit,
+        in_state: np.ndarray,
+        increments: Callable[[np.ndarray], np.ndarray],
+        jacobian: Callable[[np.ndarray], np.ndarray],
+        algebraic: int = 0,
+        buffered: bool = False,
+        duration: Optional[float] = None,
+) -> scopt.OptimizeResult:
+    """
+    Solve the implicit time step ``y_out = y_in + increments(y_out)`` for the increments of the state,
+    see :py:class:`StepProblem`.
+
+    The backend and its settings are taken from the ``thermal_solver*`` hooks of ``unit``.
+    The solution is stored on the unit to warm-start subsequent solutions, see :py:attr:`Config.THERMAL_SOLVER_WARM_START`.
+
+    :param unit: the unit the step belongs to
+    :param in_state: state (ring temperatures) at the beginning of the step
+    :param increments: function yielding the increments for a given state
+    :param jacobian: function yielding the banded Jacobian of ``increments``
+    :param algebraic: count of trailing algebraic unknowns in the state
+    :param buffered: whether ``increments`` and ``jacobian`` accept an ``out`` argument, see :py:class:`StepProblem`
+    :param duration: duration of the step, only needed if steps of different durations are solved for the same unit,
+        to scale the warm start from the last solution of the unit by the duration ratio
+    :returns: the solver result, the increments are available as ``x``
+    """
+    problem = StepProblem(in_state, increments, jacobian, algebraic, buffered)
+
+    try:
+        solver = SOLVERS[unit.thermal_solver]
+    except KeyError:
+        raise ValueError(
+            f"Unknown thermal solver '{unit.thermal_solver}', available are: {', '.join(SOLVERS)}."
+        ) from None
+
+    start = time.perf_counter()
+    sol = solver(
+        problem,
+        x0=_initial_guess(unit, problem, duration),
+        absolute_tolerance=unit.thermal_solver_absolute_tolerance,
+        relative_tolerance=unit.thermal_solver_relative_tolerance,
+        max_iterations=unit.thermal_solver_max_iterations,
+    )
+
+    stats = own_thermal_solver_stats(unit)
+    stats.wall_time += time.perf_counter() - start
+    stats.solves += 1
+    stats.iterations += sol.get("nit", sol.nfev)
+    stats.function_evaluations += sol.nfev
+
+    if "fun" in sol:
+        stats.residual_norm = max(stats.residual_norm, float(np.max(np.abs(sol.fun))))
+
+    if not sol.success:
+        stats.failures += 1
+        raise RuntimeError(f"Numerical procedure did not succeed: {sol.message}.")
+
+    sol.duration = duration
+    unit._thermal_solution = sol
+    return sol
+
+
+def solve_ring_system(
+        unit: Unit,
+        system: RingSystem,
+        in_ring_temperatures: np.ndarray,
+        surface_temperature: float,
+        coupled: Optional[bool] = None,
+) -> Tuple[np.ndarray, float]:
+    """
+    Solve one time step of a ring system.
+
+    If ``coupled``, the surface temperature is solved as additional
+    unknown together with the ring temperatures, starting from ``surface_temperature``.
+    Otherwise, the surface temperature is kept fixed at ``surface_temperature`` during the step
+    and is returned unchanged.
+
+    If :py:attr:`Config.STEP_CACHE` is enabled, the increments are taken from the step cache if available,
+    see :py:mod:`step_cache`.
+
+    :param coupled: whether to solve the surface temperature coupled,
+        defaults to :py:attr:`Config.SURFACE_TEMPERATURE_COUPLING`
+    :returns: the outgoing ring temperatures and the surface temperature
+    """
+    if coupled is None:
+        coupled = Config.SURFACE_TEMPERATURE_COUPLING
+
+    in_state = np.append(in_ring_temperatures, surface_temperature) if coupled else in_ring_temperatures
+
+    key = (
+        step_key(unit, system, np.append(in_ring_temperatures, surface_temperature), coupled)
+        if Config.STEP_CACHE else None
+    )
+    increments = cached_step(key) if key is not None else None
+
+    if increments is not None:
+        unit._thermal_solution = scopt.OptimizeResult(x=increments.copy(), success=True, nit=0, nfev=0)
+    else:
+        if coupled:
+            sol = solve_step(
+                unit, in_state, system.coupled_increments, system.coupled_jacobian, algebraic=1, buffered=True
+            )
+        else:
+            sol = solve_step(
+                unit, in_state,
+                increments=lambda t, out=None: system.increments(t, surface_temperature, out=out),
+                jacobian=lambda t, out=None: system.jacobian(out=out),
+                buffered=True,
+            )
+        increments = sol.x
+
+        if key is not None:
+            cache_step(key, increments)
+
+    out_state = in_state + increments
+
+    if coupled:
+        return out_state[:-1], out_state[-1]
+    return out_state, surface_temperature
+
+
+def march_disks(
+        unit: DiskElementUnit,
+        system: RingSystem,
+        in_ring_temperatures: np.ndarray,
+        in_surface_temperature: float,
+) -> np.ndarray:
+    """
+    March the ring temperatures through all disk elements of a unit in one loop,
+    without resolving the profile hooks of the disk elements.
+
+    Without :py:attr:`Config.SURFACE_TEMPERATURE_COUPLING`, the surface temperature is iterated together with the
+    ring temperatures within each step until it changes less than the ``iteration_precision`` of the unit,
+    like the solution loop of a disk element would do.
+
+    :param unit: the unit to march through
+    :param system: the ring system of the unit, rescaled to the durations of the disk elements
+    :param in_ring_temperatures: ring temperatures at the entry of the unit
+    :param in_surface_temperature: surface temperature at the entry of the unit
+    :returns: array of the outgoing ring temperatures of all disk elements of shape ``(disk count, ring count)``
+    """
+    disks = unit.disk_elements
+    result = np.empty((len(disks), len(in_ring_temperatures)))
+
+    temperatures = in_ring_temperatures
+    ts = in_surface_temperature
+
+    for i, disk in enumerate(disks):
+        disk_system = system.rescaled(disk.duration)
+
+        if Config.SURFACE_TEMPERATURE_COUPLING:
+            out_temperatures, ts = solve_ring_system(disk, disk_system, temperatures, ts)
+
+        else:
+            for _ in range(unit.max_iteration_count):
+                out_temperatures, _ = solve_ring_system(disk, disk_system, temperatures, ts)
+                new_ts, surface_iterations = disk_system.surface_temperature(out_temperatures[-1], full_output=True)
+                own_thermal_solver_stats(disk).surface_iterations += surface_iterations
+                converged = abs(new_ts - ts) <= abs(ts) * unit.iteration_precision
+                ts = new_ts
+
+                if converged:
+                    break
+
+        result[i] = out_temperatures
+        temperatures = out_temperatures
+
+    return result
+
+
+def march_adaptive(
+        unit: DiskElementUnit,
+        system: RingSystem,
+        in_ring_temperatures: np.ndarray,
+        in_surface_temperature: float,
+        tolerance: float,
+        initial_step_fraction: float = 1e-3,
+) -> np.ndarray:
+    """
+    March the ring temperatures through the duration of a unit with adaptively chosen sub-steps.
+
+    The local error of each sub-step is estimated by step doubling, comparing one implicit Euler step
+    with two steps of half size. The step is accepted if the estimate is within ``tolerance``, continuing
+    with the Richardson extrapolation of both, which is second order accurate and still L-stable.
+    The next step size is adapted to the error estimate.
+    Sub-steps are truncated at the disk element boundaries, where the temperatures are reported.
+    The surface temperature is solved coupled to the ring temperatures in each sub-step.
+
+    :param unit: the unit to march through
+    :param system: the ring system of the unit, rescaled to the sub-step durations
+    :param in_ring_temperatures: ring temperatures at the entry of the unit
+    :param in_surface_temperature: surface temperature at the entry of the unit
+    :param tolerance: tolerance of the estimated local error of the ring temperatures
+    :param initial_step_fraction: size of the first sub-step relative to the duration of the unit
+    :returns: array of the ring temperatures at the disk element boundaries of shape ``(disk count, ring count)``,
+        or of shape ``(1, ring count)`` if the unit has no disk elements
+    """
+    disks = unit.disk_elements
+    boundaries = np.cumsum([d.duration for d in disks]) if disks else np.array([unit.duration])
+    result = np.empty((len(boundaries), len(in_ring_temperatures)))
+
+    state = np.append(in_ring_temperatures, in_surface_temperature)
+    elapsed = 0
+    step_size = boundaries[-1] * initial_step_fraction
+    min_step_size = boundaries[-1] * 1e-9
+
+    for i, boundary in enumerate(boundaries):
+        owner = disks[i] if disks else unit
+
+        def step(s, h):
+            step_system = system.rescaled(h)
+            sol = solve_step(
+                owner, s, step_system.coupled_increments, step_system.coupled_jacobian, algebraic=1, buffered=True,
+                duration=h,
+            )
+            return s + sol.x
+
+        while elapsed < boundary:
+            last = step_size >= boundary - elapsed
+            h = boundary - elapsed if last else step_size
+
+            full = step(state, h)
+            half = step(step(state, h / 2), h / 2)
+            error = np.max(np.abs(half[:-1] - full[:-1]))
+
+            accepted = error <= tolerance or h <= min_step_size
+            if accepted:
+                state = 2 * half - full
+                elapsed = boundary if last else elapsed + h
+
+            new_step_size = h * min(5, max(0.2, 0.9 * np.sqrt(tolerance / max(error, 1e-300))))
+            # do not let the truncation at a boundary shrink the following steps
+            step_size = max(new_step_size, step_size) if last and accepted else new_step_size
+
+        result[i] = state[:-1]
+
+    return result
+
+
+def fused_march(
+        unit: DiskElementUnit,
+        system: RingSystem,
+        in_ring_temperatures: np.ndarray,
+        in_surface_temperature: float,
+) -> np.ndarray:
+    """
+    The ring temperatures at the disk element boundaries of ``unit`` by :py:func:`march_adaptive`
+    if :py:attr:`Config.ADAPTIVE_TIME_STEPPING` is enabled, otherwise by :py:func:`march_disks`.
+
+    The result is kept on the unit for the hooks of the following disk elements,
+    keyed on everything the march depends on: the step inputs identified by :py:func:`step_key`
+    (material, geometry, boundary parameters and solver settings), the exact incoming temperatures,
+    the disk element durations and the marching settings.
+    The result is read-only, since its rows are set as ring temperatures of the disk element profiles,
+    see :py:func:`fill_disk_profiles`.
+    """
+    disks = unit.disk_elements
+    step_inputs = step_key(unit, system, np.empty(0), Config.SURFACE_TEMPERATURE_COUPLING)
+    key = None if step_inputs is None else (
+        step_inputs,
+        np.asarray(in_ring_temperatures, dtype=float).tobytes(),
+        float(in_surface_temperature),
+        np.array([d.duration for d in disks], dtype=float).tobytes(),
+        bool(Config.THERMAL_SOLVER_WARM_START),
+        bool(Config.ADAPTIVE_TIME_STEPPING),
+        float(Config.ADAPTIVE_TIME_STEPPING_TOLERANCE),
+        float(unit.iteration_precision),
+        int(unit.max_iteration_count),
+    )
+
+    cached = getattr(unit, "_fused_march", None)
+    if key is not None and cached is not None and cached[0] == key:
+        return cached[1]
+
+    if Config.ADAPTIVE_TIME_STEPPING:
+        result = march_adaptive(
+            unit, system, in_ring_temperatures, in_surface_temperature, Config.ADAPTIVE_TIME_STEPPING_TOLERANCE
+        )
+    else:
+        result = march_disks(unit, system, in_ring_temperatures, in_surface_temperature)
+
+    result.setflags(write=False)
+    unit._fused_march = key, result
+    return result
+
+
+FILLED_PROFILE_HOOKS = ["t", "temperature", "core_temperature", "surface_temperature"]
+"""Hooks of the disk element out profiles that :py:func:`fill_disk_profiles` does not copy from the preceding
+profile, since they follow from the filled ring temperatures and the disk element duration."""
+
+
+def fill_disk_profiles(unit: DiskElementUnit, ring_temperatures: np.ndarray):
+    """
+    Create the in and out profiles of the disk elements of ``unit`` with the outgoing ring temperatures of a fused
+    march explicitly set, instead of solving the disk elements one after another,
+    which saves the evaluation of all root hooks in each iteration of the solution loop of each disk element.
+
+    Like in the solution of a disk element, the profiles are created as copies of the preceding profile.
+    The time is set from the disk element duration and the hooks of :py:data:`FILLED_PROFILE_HOOKS`
+    are evaluated from the ring temperatures on request. The values of the other root hooks are taken from
+    the preceding profile, as the solution loop does for root hooks without implementation for disk elements,
+    so hooks of other plugins are not evaluated for the disk elements.
+
+    :param unit: the unit with initialized disk elements
+    :param ring_temperatures: the outgoing ring temperatures of all disk elements of shape
+        ``(disk count, ring count)``, as returned by :py:func:`fused_march`
+    """
+    last = unit.in_profile
+    root_hook_names = None
+
+    for disk, temperatures in zip(unit.disk_elements, ring_temperatures):
+        disk.in_profile = in_profile = disk.InProfile(disk, last)
+        disk.out_profile = out_profile = disk.OutProfile(disk, last)
+
+        if root_hook_names is None:
+            root_hook_names = [
+                h.name for h in root_hooks
+                if isinstance(out_profile, h.owner) and h.name not in FILLED_PROFILE_HOOKS + ["ring_temperatures"]
+            ]
+
+        for name in FILLED_PROFILE_HOOKS:
+            out_profile.__dict__.pop(name, None)
+
+        for name in root_hook_names:
+            if name not in out_profile.__dict__:
+                value = getattr(in_profile, name, None)
+                if value is not None:
+                    setattr(out_profile, name, value)
+
+        out_profile.ring_temperatures = temperatures
+        out_profile.t = in_profile.t + disk.duration
+        last = out_profile
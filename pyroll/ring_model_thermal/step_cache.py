@@ -0,0 +1,297 @@
+import atexit
+import hashlib
+import os
+import sqlite3
+import time
+import numpy as np
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+
+from pyroll.core import Unit
+
+from .config import Config
+from .kernel import RingSystem
+
+
+@dataclass
+class StepCacheInfo:
+    """Counters of the step cache."""
+
+    hits: int = 0
+    """Count of step solutions taken from the cache."""
+
+    misses: int = 0
+    """Count of step solutions not found in the cache and solved."""
+
+    evictions: int = 0
+    """Count of step solutions removed from the cache due to :py:attr:`Config.STEP_CACHE_SIZE`
+    or :py:attr:`Config.STEP_CACHE_PERSISTENT_SIZE`."""
+
+    persistent_hits: int = 0
+    """Count of the hits not found in memory but in the database at :py:attr:`Config.STEP_CACHE_PATH`."""
+
+    size: int = 0
+    """Current count of cached step solutions."""
+
+
+SOLVER_VERSION = 2
+"""Version of the thermal step solution included in the step keys, to be incremented with every change of the
+solvers or ring systems altering the results of steps, so that results of earlier versions are not reused."""
+
+SCHEMA_VERSION = 1
+"""Version of the table layout of the database at :py:attr:`Config.STEP_CACHE_PATH`,
+databases of other versions are cleared on opening."""
+
+EVICTION_INTERVAL = 1024
+"""Count of insertions into the database after which the entries beyond
+:py:attr:`Config.STEP_CACHE_PERSISTENT_SIZE` are evicted, so the size is exceeded by at most this count."""
+
+USAGE_FLUSH_INTERVAL = 1024
+"""Count of hits in the database after which their usage times are written back,
+they are written with the next insertion or on exit of the process as well."""
+
+_STEPS: "OrderedDict[bytes, np.ndarray]" = OrderedDict()
+_INFO = StepCacheInfo()
+
+
+def _quantized(values: np.ndarray) -> bytes:
+    values = np.asarray(values, dtype=float)
+    quantum = Config.STEP_CACHE_TEMPERATURE_QUANTUM
+
+    if quantum > 0:
+        return np.round(values / quantum).astype(np.int64).tobytes()
+    return values.tobytes()
+
+
+def step_key(unit: Unit, system: RingSystem, in_state: np.ndarray, coupled: bool) -> Optional[bytes]:
+    """
+    Hash of the inputs determining the solution of a time step of ``system``,
+    with ``in_state`` holding the incoming ring temperatures and the surface temperature.
+    The hash is stable across runs and includes the plugin version and the :py:data:`SOLVER_VERSION`.
+
+    :returns: the key or None if the boundary conditions of the system are not identified by its parameters
+    """
+    if system.boundary_parameters is None:
+        return None
+
+    from . import VERSION
+
+    h = hashlib.blake2b(digest_size=20)
+    h.update(repr((
+        VERSION,
+        SOLVER_VERSION,
+        str(unit.thermal_solver),
+        float(unit.thermal_solver_absolute_tolerance),
+        float(unit.thermal_solver_relative_tolerance),
+        int(unit.thermal_solver_max_iterations),
+        bool(coupled),
+        float(system.surface_conductance),
+        sorted((k, float(v)) for k, v in system.boundary_parameters.items()),
+        sorted((k, float(v)) for k, v in system.balance_parameters.items()),
+    )).encode())
+
+    for a in [system.factors, system.conductances, system.sources, system.geometry.contour_lengths[-1:]]:
+        h.update(np.ascontiguousarray(a, dtype=float).tobytes())
+
+    h.update(_quantized(in_state))
+    return h.digest()
+
+
+class _Database:
+    """
+    SQLite database persisting step solutions, opened once per process and path.
+
+    The usage times of hits are buffered and written back in batches, to not serialize concurrent readers
+    by a write transaction per hit. The least recently used entries are evicted every :py:data:`EVICTION_INTERVAL`
+    insertions instead of counting the entries on each.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.pid = os.getpid()
+        self.connection = sqlite3.connect(path, timeout=60, isolation_level=None)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+
+        with self.connection:
+            self.connection.execute("BEGIN IMMEDIATE")
+            if self.connection.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+                self.connection.execute("DROP TABLE IF EXISTS steps")
+                self.connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS steps "
+                "(key BLOB PRIMARY KEY, increments BLOB NOT NULL, used INTEGER NOT NULL)"
+            )
+            self.connection.execute("CREATE INDEX IF NOT EXISTS steps_used ON steps (used)")
+
+        self.used = {}
+        """Buffered usage times of hits per key."""
+
+        self.insertions = 0
+        """Count of insertions since the last eviction."""
+
+        atexit.register(self.close)
+
+    def get(self, key: bytes) -> Optional[np.ndarray]:
+        row = self.connection.execute("SELECT increments FROM steps WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+
+        self.used[key] = time.time_ns()
+        if len(self.used) >= USAGE_FLUSH_INTERVAL:
+            with self.connection:
+                self.connection.execute("BEGIN IMMEDIATE")
+                self._flush()
+
+        return np.frombuffer(row[0], dtype=float)
+
+    def _flush(self):
+        if self.used:
+            self.connection.executemany(
+                "UPDATE steps SET used = ? WHERE key = ?", [(t, k) for k, t in self.used.items()]
+            )
+            self.used.clear()
+
+    def put(self, key: bytes, increments: np.ndarray) -> int:
+        """Store the increments and evict the least recently used entries beyond the size limit if due.
+
+        :returns: count of evicted entries"""
+        excess = 0
+
+        with self.connection:
+            self.connection.execute("BEGIN IMMEDIATE")
+            self._flush()
+            self.connection.execute(
+                "INSERT OR REPLACE INTO steps VALUES (?, ?, ?)", (key, increments.tobytes(), time.time_ns())
+            )
+            self.insertions += 1
+
+            if self.insertions >= EVICTION_INTERVAL:
+                self.insertions = 0
+                excess = (
+                        self.connection.execute("SELECT COUNT(*) FROM steps").fetchone()[0]
+                        - Config.STEP_CACHE_PERSISTENT_SIZE
+                )
+                if excess > 0:
+                    self.connection.execute(
+                        "DELETE FROM steps WHERE key IN (SELECT key FROM steps ORDER BY used LIMIT ?)", (excess,)
+                    )
+
+        return max(excess, 0)
+
+    def clear(self):
+        self.used.clear()
+        self.connection.execute("DELETE FROM steps")
+
+    def close(self):
+        """Write back the buffered usage times and close the connection."""
+        if self.connection is None:
+            return
+
+        atexit.unregister(self.close)
+
+        if self.pid == os.getpid():
+            try:
+                with self.connection:
+                    self.connection.execute("BEGIN IMMEDIATE")
+                    self._flush()
+            except sqlite3.Error:
+                pass
+
+            self.connection.close()
+
+        self.connection = None
+
+
+_DATABASE: Optional[_Database] = None
+
+
+def _database() -> Optional[_Database]:
+    """The database at :py:attr:`Config.STEP_CACHE_PATH`, reopened in forked processes, if the path changed
+    or if it was closed."""
+    global _DATABASE
+    path = str(Config.STEP_CACHE_PATH)
+
+    if not path:
+        return None
+
+    if (
+            _DATABASE is None or _DATABASE.connection is None
+            or _DATABASE.path != path or _DATABASE.pid != os.getpid()
+    ):
+        if _DATABASE is not None and _DATABASE.pid == os.getpid():
+            _DATABASE.close()
+
+        _DATABASE = _Database(path)
+
+    return _DATABASE
+
+
+def cached_step(key: bytes) -> Optional[np.ndarray]:
+    """
+    The cached increments of the step with ``key`` or None, counting a hit or miss.
+    Steps not found in memory are looked up in the database at :py:attr:`Config.STEP_CACHE_PATH`, if given.
+    """
+    increments = _STEPS.get(key)
+
+    if increments is not None:
+        _STEPS.move_to_end(key)
+        _INFO.hits += 1
+        return increments
+
+    database = _database()
+    increments = database.get(key) if database is not None else None
+
+    if increments is None:
+        _INFO.misses += 1
+        return None
+
+    _INFO.hits += 1
+    _INFO.persistent_hits += 1
+    _remember(key, increments)
+    return increments
+
+
+def _remember(key: bytes, increments: np.ndarray):
+    increments.setflags(write=False)
+    _STEPS[key] = increments
+
+    while len(_STEPS) > Config.STEP_CACHE_SIZE:
+        _STEPS.popitem(last=False)
+        _INFO.evictions += 1
+
+
+def cache_step(key: bytes, increments: np.ndarray):
+    """Store the increments of the step with ``key`` in memory and in the database at :py:attr:`Config.STEP_CACHE_PATH`,
+    evicting the least recently used steps if the cache is full."""
+    increments = np.array(increments, dtype=float)
+    _remember(key, increments)
+
+    database = _database()
+    if database is not None:
+        _INFO.evictions += database.put(key, increments)
+
+
+def step_cache_info() -> StepCacheInfo:
+    """The current counters of the step cache."""
+    return StepCacheInfo(
+        hits=_INFO.hits, misses=_INFO.misses, evictions=_INFO.evictions, size=len(_STEPS),
+        persistent_hits=_INFO.persistent_hits,
+    )
+
+
+def clear_step_cache(persistent: bool = False):
+    """
+    Remove all cached step solutions from memory and reset the counters.
+
+    :param persistent: whether to clear the database at :py:attr:`Config.STEP_CACHE_PATH` as well
+    """
+    _STEPS.clear()
+    _INFO.hits = _INFO.misses = _INFO.evictions = _INFO.persistent_hits = 0
+
+    database = _database() if persistent else None
+    if database is not None:
+        database.clear()
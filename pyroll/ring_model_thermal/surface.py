@@ -0,0 +1,121 @@
+import numpy as np
+
+from typing import Callable, Dict, Optional, Sequence, Tuple
+
+from pyroll.core import Unit, DiskElementUnit
+
+from .kernel import solve_surface_temperature, solve_surface_temperatures
+from .profile import Profile
+from .unit import own_thermal_solver_stats
+
+FluxFactory = Callable[..., Tuple[Callable, Callable]]
+"""Function creating the surface heat flux density and its derivative as functions of the surface temperature
+from boundary parameters given as keyword arguments, which may also be arrays."""
+
+SURFACE_BALANCES: Dict[type, Callable[[Unit, Profile], Tuple[Dict[str, float], FluxFactory]]] = {}
+"""Functions yielding the boundary parameters and the flux factory of the surface heat balance
+of a profile, registered per unit type."""
+
+
+def register_surface_balance(unit_type: type):
+    """Decorator for adding a function to :py:data:`SURFACE_BALANCES`."""
+
+    def dec(func):
+        SURFACE_BALANCES[unit_type] = func
+        return func
+
+    return dec
+
+
+def _surface_balance(profile: Profile) -> Optional[Tuple[Dict[str, float], FluxFactory]]:
+    unit = profile.unit
+    if isinstance(unit, DiskElementUnit.DiskElement):
+        unit = unit.parent
+
+    for cls in type(unit).__mro__:
+        if cls in SURFACE_BALANCES:
+            return SURFACE_BALANCES[cls](unit, profile)
+
+    return None
+
+
+def _key(profile: Profile, parameters: Dict[str, float], factory: FluxFactory) -> tuple:
+    return (
+        factory,
+        profile.ring_temperatures[-1],
+        profile.thermal_conductivity / profile.ring_geometry.surface_distance,
+        *parameters.values(),
+    )
+
+
+def _memo(profile: Profile, key: tuple) -> Tuple[bool, Optional[float]]:
+    memo = profile.__dict__.get("_surface_temperature_memo")
+    if memo is not None and memo[0] == key:
+        return True, memo[1]
+    return False, None
+
+
+def memoized_surface_temperature(profile: Profile) -> Optional[float]:
+    """
+    Surface temperature of a profile fulfilling the heat balance at the surface registered for its unit.
+
+    The result is memoized on the profile, keyed on the most outer ring temperature, the surface conductance
+    and the boundary parameters, so that repeated evaluations do not repeat Newton's method.
+
+    :returns: the surface temperature or None if Newton's method did not converge
+    """
+    parameters, factory = _surface_balance(profile)
+    key = _key(profile, parameters, factory)
+    found, value = _memo(profile, key)
+
+    if not found:
+        value, iterations = solve_surface_temperature(key[1], key[2], *factory(**parameters), full_output=True)
+        profile.__dict__["_surface_temperature_memo"] = key, value
+        own_thermal_solver_stats(profile.unit).surface_iterations += iterations
+
+    return value
+
+
+def surface_temperatures(profiles: Sequence[Profile]) -> np.ndarray:
+    """
+    Surface temperatures of many profiles, like the profiles of all disk elements of a unit.
+
+    The heat balances of profiles sharing the same flux factory are solved at once by vectorized Newton iteration.
+    Memoized results are reused and new ones are memoized, as in :py:func:`memoized_surface_temperature`.
+    Profiles with a set surface temperature (as after solution of their unit)
+    and profiles of units without a registered surface balance yield their ``surface_temperature`` hook value.
+
+    :returns: array of the surface temperatures, NaN where Newton's method did not converge
+    """
+    result = np.full(len(profiles), np.nan)
+    pending: Dict[FluxFactory, list] = {}
+
+    for i, p in enumerate(profiles):
+        balance = None if p.has_set("surface_temperature") else _surface_balance(p)
+
+        if balance is None:
+            result[i] = getattr(p, "surface_temperature", np.nan)
+            continue
+
+        parameters, factory = balance
+        key = _key(p, parameters, factory)
+        found, value = _memo(p, key)
+
+        if found:
+            result[i] = np.nan if value is None else value
+        else:
+            pending.setdefault(factory, []).append((i, p, key, parameters))
+
+    for factory, entries in pending.items():
+        indices, profiles_, keys, parameters = zip(*entries)
+        stacked = {name: np.array([e[name] for e in parameters]) for name in parameters[0]}
+        values, iterations = solve_surface_temperatures(
+            np.array([k[1] for k in keys]), np.array([k[2] for k in keys]), *factory(**stacked), full_output=True
+        )
+
+        for i, p, key, value, count in zip(indices, profiles_, keys, values, iterations):
+            result[i] = value
+            p.__dict__["_surface_temperature_memo"] = key, None if np.isnan(value) else float(value)
+            own_thermal_solver_stats(p.unit).surface_iterations += int(count)
+
+    return result
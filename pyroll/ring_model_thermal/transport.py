@@ -1,9 +1,13 @@
 import numpy as np
-import scipy.optimize as scopt
 
-from typing import Union
+from typing import Union, Tuple, Callable, Dict
 from .config import Config
+from .incremental import register_thermal_inputs
+from .kernel import RingSystem
 from .profile import Profile
+from ._units import register_step_system
+from .solvers import solve_ring_system, fused_march, fill_disk_profiles
+from .surface import register_surface_balance, memoized_surface_temperature
 from pyroll.core import Transport, Unit, Hook, root_hooks
 
 
@@ -29,64 +33,93 @@ def heat_transfer_coefficient(self: Transport.DiskElement):
     return self.transport.heat_transfer_coefficient
 
 
-def get_increments(unit: Unit, transport: TransportExt, ring_temperatures) -> np.ndarray:
-    p: Profile = unit.out_profile
+def _heat_flux(
+        heat_transfer_coefficient: float, environment_temperature: float, radiation_coefficient: float
+) -> Tuple[Callable, Callable]:
+    """Heat flux density by convection and radiation to the environment and its derivative
+    as functions of the surface temperature."""
 
-    increments = np.zeros_like(ring_temperatures)
+    def flux(ts):
+        return (
+                heat_transfer_coefficient * (environment_temperature - ts)
+                + radiation_coefficient * (environment_temperature ** 4 - ts ** 4)
+        )
 
-    source_density = 0  # TODO source density term in W / m^3
+    def derivative(ts):
+        return -4 * radiation_coefficient * ts ** 3 - heat_transfer_coefficient
+
+    return flux, derivative
 
-    cross_section = p.ring_sections[0].area
-    increments[0] = unit.duration / (p.density * p.specific_heat_capacity * cross_section) * (
-            (ring_temperatures[1] - ring_temperatures[0]) * p.ring_contours[1].length
-            / p.rings[1] * p.thermal_conductivity
-            + source_density * cross_section
+
+def _boundary_parameters(transport: TransportExt, p: Profile) -> Dict[str, float]:
+    return dict(
+        heat_transfer_coefficient=transport.heat_transfer_coefficient,
+        environment_temperature=transport.environment_temperature,
+        radiation_coefficient=Config.RADIATION_COEFFICIENT * p.relative_radiation_coefficient,
     )
 
-    cross_section = p.ring_sections[-1].area
-    increments[-1] = unit.duration / (p.density * p.specific_heat_capacity * cross_section) * (
-            (
-                    transport.heat_transfer_coefficient
-                    * (transport.environment_temperature - p.surface_temperature)
-                    + Config.RADIATION_COEFFICIENT * p.relative_radiation_coefficient
-                    * (transport.environment_temperature ** 4 - p.surface_temperature ** 4)
-            )
-            * p.ring_contours[-1].length
-            - p.thermal_conductivity * (ring_temperatures[-1] - ring_temperatures[-2])
-            / (p.rings[-1] - p.rings[-2])
-            * p.ring_contours[-2].length
-            + source_density * cross_section
+
+register_thermal_inputs(Transport, [
+    "duration", "environment_temperature", "heat_transfer_coefficient", "disk_element_count"
+])
+
+
+@register_surface_balance(Transport)
+def _surface_balance(transport: TransportExt, p: Profile):
+    return _boundary_parameters(transport, p), _heat_flux
+
+
+def _ring_system(unit: Unit, transport: TransportExt, p: Profile) -> RingSystem:
+    source_density = 0  # TODO source density term in W / m^3
+    boundary_parameters = _boundary_parameters(transport, p)
+    surface_heat_flux, surface_heat_flux_derivative = _heat_flux(**boundary_parameters)
+
+    return RingSystem(
+        duration=unit.duration,
+        density=p.density,
+        specific_heat_capacity=p.specific_heat_capacity,
+        thermal_conductivity=p.thermal_conductivity,
+        geometry=p.ring_geometry,
+        surface_heat_flux=surface_heat_flux,
+        surface_heat_flux_derivative=surface_heat_flux_derivative,
+        source_density=source_density,
+        boundary_parameters=boundary_parameters,
+        flux_factory=_heat_flux,
     )
 
-    for i in range(1, len(increments) - 1):
-        cross_section = p.ring_sections[i].area
-        increments[i] = unit.duration / (p.density * p.specific_heat_capacity * cross_section) * (
-                p.thermal_conductivity
-                * (
-                        (ring_temperatures[i + 1] - ring_temperatures[i]) * p.ring_contours[i + 1].length
-                        / (p.rings[i + 1] - p.rings[i])
-                        - (ring_temperatures[i] - ring_temperatures[i - 1]) * p.ring_contours[i].length
-                        / (p.rings[i] - p.rings[i - 1])
-                )
-                + source_density * cross_section
-        )
 
-    return increments
+@register_step_system(Transport)
+def _step_system(unit: Unit, transport: TransportExt) -> Tuple[RingSystem, bool]:
+    return _ring_system(unit, transport, unit.out_profile), False
 
 
 def _solve_step(unit, transport, in_ring_temperatures):
-    x0 = get_increments(unit, transport, in_ring_temperatures)
+    p: Profile = unit.out_profile
+    system = _ring_system(unit, transport, p)
+
+    if Config.SURFACE_TEMPERATURE_COUPLING:
+        surface_temperature = unit.in_profile.surface_temperature
+    else:
+        surface_temperature = p.surface_temperature
+
+    ring_temperatures, _ = solve_ring_system(unit, system, in_ring_temperatures, surface_temperature)
+    return ring_temperatures
+
 
-    def f(x):
-        out_ring_temperatures = in_ring_temperatures + x
-        return get_increments(unit, transport, out_ring_temperatures) - x
+def _fused_march(transport: TransportExt) -> np.ndarray:
+    p: Profile = transport.in_profile
+    return fused_march(transport, _ring_system(transport, transport, p), p.ring_temperatures, p.surface_temperature)
 
-    sol = scopt.root(f, x0=x0)
 
-    if not sol.success:
-        raise RuntimeError(f"Numerical procedure did not succeed: {sol.message}.")
+def _solve_subunits(self: TransportExt):
+    if self.disk_elements and (Config.FUSED_DISK_MARCHING or Config.ADAPTIVE_TIME_STEPPING):
+        fill_disk_profiles(self, _fused_march(self))
+    else:
+        Unit._solve_subunits(self)
 
-    return in_ring_temperatures + sol.x
+
+# march the disk elements in one go instead of solving them one after another, if enabled
+Transport._solve_subunits = _solve_subunits
 
 
 @Transport.OutProfile.ring_temperatures
@@ -94,6 +127,9 @@ def ring_temperatures_disk(self: Union[Transport.OutProfile, Profile]):
     if not self.transport.disk_elements:
         transport = self.transport
 
+        if Config.ADAPTIVE_TIME_STEPPING:
+            return _fused_march(transport)[-1]
+
         return _solve_step(transport, transport, transport.in_profile.ring_temperatures)
 
 
@@ -106,31 +142,7 @@ def ring_temperatures_disk(self: Union[Transport.DiskElement.OutProfile, Profile
 
 
 def _surface_temperature(self: Union[Transport.Profile, Profile]):
-    transport: TransportExt = self.transport
-
-    def f(ts):
-        return (
-                transport.heat_transfer_coefficient
-                * (transport.environment_temperature - ts)
-                + Config.RADIATION_COEFFICIENT * self.relative_radiation_coefficient
-                * (transport.environment_temperature ** 4 - ts ** 4)
-                - self.thermal_conductivity
-                * (ts - self.ring_temperatures[-1])
-                / (self.equivalent_radius - self.rings[-1])
-        )
-
-    def fprime(ts):
-        return (
-                -4 * Config.RADIATION_COEFFICIENT * self.relative_radiation_coefficient
-                * ts ** 3
-                - transport.heat_transfer_coefficient
-                - self.thermal_conductivity / (self.equivalent_radius - self.rings[-1])
-        )
-
-    sol = scopt.root_scalar(f=f, fprime=fprime, x0=self.ring_temperatures[-1], method="newton")
-
-    if sol.converged:
-        return sol.root
+    return memoized_surface_temperature(self)
 
 
 @Transport.Profile.surface_temperature
@@ -143,5 +155,24 @@ def disk_surface_temperature(self: Union[Transport.Profile, Profile]):
     return _surface_temperature(self)
 
 
+SHARED_GEOMETRY_HOOKS = ["equivalent_radius", "rings", "ring_boundaries", "ring_contours", "ring_sections", "ring_geometry"]
+"""Profile hooks describing the ring geometry, which are shared among the profiles of a transport."""
+
+
+def _shared_geometry(name: str):
+    def hookfunc(self: Union[Transport.Profile, Transport.DiskElement.Profile, Profile]):
+        source = self.transport.in_profile
+        if self is not source and self.cross_section is source.cross_section:
+            return getattr(source, name)
+
+    hookfunc.__name__ = f"shared_{name}"
+    hookfunc.__doc__ = f"Take ``{name}`` from the in profile of the transport, since the cross-section is unchanged."
+    return hookfunc
+
+
+for _name in SHARED_GEOMETRY_HOOKS:
+    getattr(Transport.Profile, _name)(_shared_geometry(_name))
+    getattr(Transport.DiskElement.Profile, _name)(_shared_geometry(_name))
+
 root_hooks.add(Transport.Profile.core_temperature)
 root_hooks.add(Transport.Profile.surface_temperature)
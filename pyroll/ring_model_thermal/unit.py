@@ -0,0 +1,112 @@
+import dataclasses
+
+from dataclasses import dataclass
+from pyroll.core import Unit, Hook
+
+from .config import Config
+
+
+@dataclass
+class ThermalSolverStats:
+    """Statistics of the thermal solutions of a unit, accumulated over all solutions of the thermal steps."""
+
+    solves: int = 0
+    """Count of thermal step solutions."""
+
+    failures: int = 0
+    """Count of thermal step solutions that did not succeed."""
+
+    iterations: int = 0
+    """Count of nonlinear iterations. Counts function evaluations for backends not reporting iterations."""
+
+    function_evaluations: int = 0
+    """Count of residual evaluations."""
+
+    residual_norm: float = 0
+    """Largest maximum norm of the final residual over all thermal step solutions."""
+
+    surface_iterations: int = 0
+    """Count of Newton iterations spent in solving the surface heat balance."""
+
+    wall_time: float = 0
+    """Wall-clock time spent in the thermal step solutions in seconds."""
+
+    def __add__(self, other: "ThermalSolverStats") -> "ThermalSolverStats":
+        return ThermalSolverStats(**{
+            f.name: (max if f.name == "residual_norm" else sum)((getattr(self, f.name), getattr(other, f.name)))
+            for f in dataclasses.fields(self)
+        })
+
+
+def own_thermal_solver_stats(unit: Unit) -> ThermalSolverStats:
+    """The statistics record of ``unit`` itself (excluding its subunits), to be updated by the solvers."""
+    stats = getattr(unit, "_thermal_solver_stats", None)
+
+    if stats is None:
+        stats = ThermalSolverStats()
+        unit._thermal_solver_stats = stats
+
+    return stats
+
+
+@Unit.extension_class
+class UnitExt(Unit):
+    thermal_solver = Hook[str]()
+    """Name of the solver backend used for the thermal time steps of this unit."""
+
+    thermal_solver_absolute_tolerance = Hook[float]()
+    """Absolute tolerance of the thermal step residual."""
+
+    thermal_solver_relative_tolerance = Hook[float]()
+    """Relative tolerance of the thermal step solution."""
+
+    thermal_solver_max_iterations = Hook[int]()
+    """Maximum count of iterations of the thermal step solution."""
+
+    thermal_solver_iterations = Hook[int]()
+    """Total count of iterations spent in the thermal step solutions of this unit and its disk elements.
+    Counts function evaluations for the ``"hybr"`` backend."""
+
+    thermal_solver_stats = Hook[ThermalSolverStats]()
+    """Statistics of the thermal solutions of this unit and its subunits, see :py:class:`ThermalSolverStats`."""
+
+
+@UnitExt.thermal_solver
+def thermal_solver(self: UnitExt):
+    if self.parent is not None:
+        return self.parent.thermal_solver
+    return Config.THERMAL_SOLVER
+
+
+@UnitExt.thermal_solver_absolute_tolerance
+def thermal_solver_absolute_tolerance(self: UnitExt):
+    if self.parent is not None:
+        return self.parent.thermal_solver_absolute_tolerance
+    return Config.THERMAL_SOLVER_ABSOLUTE_TOLERANCE
+
+
+@UnitExt.thermal_solver_relative_tolerance
+def thermal_solver_relative_tolerance(self: UnitExt):
+    if self.parent is not None:
+        return self.parent.thermal_solver_relative_tolerance
+    return Config.THERMAL_SOLVER_RELATIVE_TOLERANCE
+
+
+@UnitExt.thermal_solver_max_iterations
+def thermal_solver_max_iterations(self: UnitExt):
+    if self.parent is not None:
+        return self.parent.thermal_solver_max_iterations
+    return Config.THERMAL_SOLVER_MAX_ITERATIONS
+
+
+@UnitExt.thermal_solver_iterations
+def thermal_solver_iterations(self: UnitExt):
+    stats = self.thermal_solver_stats
+
+    if stats.solves:
+        return stats.iterations
+
+
+@UnitExt.thermal_solver_stats
+def thermal_solver_stats(self: UnitExt):
+    return sum((u.thermal_solver_stats for u in self.subunits), dataclasses.replace(own_thermal_solver_stats(self)))
@@ -0,0 +1,36 @@
+import pytest
+
+from pyroll.core import Profile, Transport
+
+
+def create_round_profile(**kwargs) -> Profile:
+    """
+    Round steel profile of 30 mm diameter at 1200 °C with explicitly set ring temperatures, as incoming profile
+    of the test units. Module level, so it can be used by factories sent to worker processes as well.
+
+    :param kwargs: hook values replacing or adding to the defaults
+    """
+    import pyroll.ring_model_thermal
+
+    in_profile = Profile.round(**(
+            dict(
+                diameter=30e-3, temperature=1200 + 273.15, density=7.5e3, specific_heat_capacity=690,
+                thermal_conductivity=28, material="steel",
+            ) | kwargs
+    ))
+    in_profile.ring_temperatures = in_profile.ring_temperatures
+    return in_profile
+
+
+@pytest.fixture
+def solve_transport():
+    """Factory solving a transport to an environment at 20 °C for the profile of :py:func:`create_round_profile`."""
+
+    def solve(duration=10, disk_element_count=5, **kwargs) -> Transport:
+        transport = Transport(
+            duration=duration, disk_element_count=disk_element_count, environment_temperature=293, **kwargs
+        )
+        transport.solve(create_round_profile())
+        return transport
+
+    return solve
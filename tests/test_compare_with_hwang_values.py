@@ -24,12 +24,7 @@ def yield_data_from_profiles(u: pr.Unit, name):
                         yield getattr(ssu.in_profile, name, None)
                         yield getattr(ssu.out_profile, name, None)
 
-def test_solve_hwang(tmp_path: Path, caplog, monkeypatch):
-    caplog.set_level(logging.INFO, logger="pyroll")
-
-    from pyroll.ring_model import Config
-
-    monkeypatch.setattr(Config, "RING_COUNT", 20)
+def create_in_profile():
     in_profile = pr.Profile.round(
         radius=25e-3,
         material=["C20", "steel"],
@@ -42,12 +37,15 @@ def test_solve_hwang(tmp_path: Path, caplog, monkeypatch):
     )
 
     in_profile.ring_temperatures = in_profile.ring_temperatures
+    return in_profile
+
 
-    sequence = pr.PassSequence([
+def create_sequence(disk_element_count=50):
+    return pr.PassSequence([
         pr.Transport(
             duration=65,
             heat_transfer_coefficient=30,
-            disk_element_count=50
+            disk_element_count=disk_element_count
         ),
         pr.RollPass(
             label="Oval",
@@ -64,15 +62,25 @@ def test_solve_hwang(tmp_path: Path, caplog, monkeypatch):
                 heat_transfer_coefficient=24000
             ),
             gap=5e-3,
-            disk_element_count=50
+            disk_element_count=disk_element_count
         ),
         pr.Transport(
             duration=15,
             heat_transfer_coefficient=30,
-            disk_element_count=50
+            disk_element_count=disk_element_count
         ),
     ])
 
+
+def test_solve_hwang(tmp_path: Path, caplog, monkeypatch):
+    caplog.set_level(logging.INFO, logger="pyroll")
+
+    from pyroll.ring_model import Config
+
+    monkeypatch.setattr(Config, "RING_COUNT", 20)
+    in_profile = create_in_profile()
+    sequence = create_sequence()
+
     sequence.solve(in_profile)
 
     time = np.array(list(yield_data_from_profiles(sequence, "t")))
@@ -103,4 +111,31 @@ def test_solve_hwang(tmp_path: Path, caplog, monkeypatch):
     ax.plot(core_temperature_time, core_temperature_measured, color="C1", ls="--",
             label="Core Temperature (Hwang et al.)")
     ax.legend()
-    fig.show()
\ No newline at end of file
+    fig.show()
+
+def test_solve_hwang_adaptive(monkeypatch):
+    from pyroll.ring_model import Config
+    from pyroll.ring_model_thermal import Config as ThermalConfig
+
+    monkeypatch.setattr(Config, "RING_COUNT", 20)
+
+    def solve(transport_disk_element_count):
+        sequence = create_sequence(disk_element_count=10)
+        for u in sequence:
+            if isinstance(u, pr.Transport):
+                u.disk_element_count = transport_disk_element_count
+        sequence.solve(create_in_profile())
+        return sequence
+
+    fine = solve(200)
+    coarse = solve(5)
+
+    # with the default thermal solver backend
+    monkeypatch.setattr(ThermalConfig, "ADAPTIVE_TIME_STEPPING", True)
+    adaptive = solve(5)
+
+    for f, c, a in zip(fine, coarse, adaptive):
+        error = np.max(np.abs(a.out_profile.ring_temperatures - f.out_profile.ring_temperatures))
+        coarse_error = np.max(np.abs(c.out_profile.ring_temperatures - f.out_profile.ring_temperatures))
+        assert error < 0.5
+        assert error < coarse_error / 4
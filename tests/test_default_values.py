@@ -27,3 +27,13 @@ def test_transport_default_htc():
 def test_cooling_pipe_default_htc():
     u = CoolingPipe()
     assert np.isclose(u.heat_transfer_coefficient, 15)
+
+
+def test_thermal_solver_defaults():
+    from pyroll.ring_model_thermal import Config
+
+    u = Transport(disk_element_count=2, thermal_solver="banded_newton")
+    assert u.thermal_solver == "banded_newton"
+    assert u.DiskElement(u, 0).thermal_solver == "banded_newton"
+    assert u.thermal_solver_max_iterations == Config.THERMAL_SOLVER_MAX_ITERATIONS
+    assert CoolingPipe().thermal_solver == Config.THERMAL_SOLVER
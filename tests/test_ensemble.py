@@ -0,0 +1,100 @@
+import numpy as np
+import pytest
+
+from pyroll.core import Profile, Roll, RollPass, Transport, CircularOvalGroove, PassSequence, CoolingPipe
+
+
+@RollPass.DiskElement.strain_rate
+def strain_rate(self: RollPass.DiskElement):
+    return self.roll_pass.strain_rate
+
+
+def solve_sequence(temperature):
+    import pyroll.ring_model_thermal
+
+    in_profile = Profile.round(
+        diameter=30e-3,
+        temperature=temperature,
+        strain=0,
+        material=["C45", "steel"],
+        flow_stress=100e6,
+        density=7.5e3,
+        specific_heat_capacity=690,
+        thermal_conductivity=28,
+    )
+
+    sequence = PassSequence(
+        [
+            RollPass(
+                label="Oval I",
+                roll=Roll(
+                    groove=CircularOvalGroove(depth=8e-3, r1=6e-3, r2=40e-3),
+                    nominal_radius=160e-3,
+                    rotational_frequency=1,
+                    temperature=293,
+                ),
+                gap=2e-3,
+                disk_element_count=3,
+            ),
+            Transport(label="T", duration=5, environment_temperature=293, disk_element_count=5),
+            CoolingPipe(label="CP", length=1.73, coolant_temperature=35 + 273.15),
+        ]
+    )
+
+    sequence.solve(in_profile)
+    return sequence
+
+
+@pytest.mark.parametrize("coupling", [False, True])
+def test_ensemble_matches_sequential_solution(monkeypatch, coupling):
+    from pyroll.ring_model_thermal import Config
+    from pyroll.ring_model_thermal.ensemble import solve_ensemble
+
+    monkeypatch.setattr(Config, "SURFACE_TEMPERATURE_COUPLING", coupling)
+
+    temperatures = np.array([1100, 1200, 1300]) + 273.15
+    reference = solve_sequence(temperatures[1])
+    result = solve_ensemble(reference, temperatures)
+
+    assert result.success.all()
+    assert result.ring_temperatures.shape == (1 + 3 + 5 + 1, 3, len(reference.in_profile.rings))
+
+    for unit in reference:
+        assert np.allclose(result.unit_ring_temperatures(unit)[1], unit.out_profile.ring_temperatures, atol=0.1)
+
+    assert np.all(np.diff(result.out_ring_temperatures, axis=0) > 0)
+
+
+def test_ensemble_parameters():
+    from pyroll.ring_model_thermal.ensemble import solve_ensemble
+
+    reference = solve_sequence(1200 + 273.15)
+    result = solve_ensemble(
+        reference, np.full(3, 1200 + 273.15),
+        parameters=dict(roll_temperature=[293, 293, 393]),
+        unit_parameters=dict(T=dict(heat_transfer_coefficient=[10, 15, 100])),
+    )
+
+    assert np.allclose(result.out_ring_temperatures[1], reference.out_profile.ring_temperatures, atol=0.1)
+    assert np.all(np.diff(result.unit_ring_temperatures(reference[1])[:2, -1]) < 0)
+    assert result.unit_ring_temperatures(reference[0])[2, -1] > result.unit_ring_temperatures(reference[0])[1, -1]
+
+
+def test_ensemble_scoped_parameters():
+    from pyroll.ring_model_thermal.ensemble import solve_ensemble
+
+    reference = solve_sequence(1200 + 273.15)
+    temperatures = np.full(2, 1200 + 273.15)
+    transport, cooling_pipe = reference[1], reference[2]
+
+    # unscoped parameters replace the hook of all units, including the roll pass and the cooling pipe
+    unscoped = solve_ensemble(reference, temperatures, parameters=dict(heat_transfer_coefficient=[15, 100]))
+    labeled = solve_ensemble(reference, temperatures, parameters={("T", "heat_transfer_coefficient"): [15, 100]})
+    typed = solve_ensemble(reference, temperatures, parameters={(CoolingPipe, "heat_transfer_coefficient"): [15, 4000]})
+
+    assert np.allclose(labeled.out_ring_temperatures[0], reference.out_profile.ring_temperatures, atol=0.1)
+    assert not np.allclose(labeled.out_ring_temperatures[1], unscoped.out_ring_temperatures[1], atol=0.1)
+
+    assert np.allclose(typed.unit_ring_temperatures(transport), transport.out_profile.ring_temperatures, atol=0.1)
+    assert np.allclose(typed.out_ring_temperatures[0], reference.out_profile.ring_temperatures, atol=0.1)
+    assert typed.out_ring_temperatures[1, -1] < typed.out_ring_temperatures[0, -1] - 100
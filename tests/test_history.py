@@ -0,0 +1,94 @@
+import numpy as np
+import pytest
+
+from pyroll.core import Transport, PassSequence
+
+from conftest import create_round_profile
+
+
+def solve_sequence():
+    sequence = PassSequence([
+        Transport(label="A", duration=10, disk_element_count=5, environment_temperature=293),
+        Transport(label="B", duration=2, environment_temperature=293),
+    ])
+    sequence.solve(create_round_profile())
+    return sequence
+
+
+def test_thermal_history():
+    sequence = solve_sequence()
+    history = sequence.thermal_history
+    a, b = sequence
+
+    assert history is sequence.thermal_history
+    assert history.units == [a, b]
+    assert len(history) == 6 + 2
+    assert np.array_equal(history.unit_index, [0] * 6 + [1] * 2)
+
+    profiles = [a.in_profile] + [d.out_profile for d in a.disk_elements] + [b.in_profile, b.out_profile]
+    assert np.allclose(history.t, [p.t for p in profiles])
+    assert np.allclose(history.ring_temperatures, [p.ring_temperatures for p in profiles])
+    assert np.allclose(history.core_temperatures, [p.core_temperature for p in profiles])
+    assert np.allclose(history.surface_temperatures, [p.surface_temperature for p in profiles])
+    assert np.allclose(history.mean_temperatures, [p.temperature for p in profiles])
+    assert np.array_equal(history.t[history.unit_mask(b)], [b.in_profile.t, b.out_profile.t])
+
+    # forgotten when solved again
+    sequence.solve(create_round_profile())
+    assert sequence.thermal_history is not history
+
+
+def test_thermal_history_with_released_profiles(monkeypatch):
+    from pyroll.ring_model_thermal import Config
+
+    expected = solve_sequence().thermal_history
+
+    monkeypatch.setattr(Config, "DISK_PROFILE_RETENTION", "history")
+    history = solve_sequence().thermal_history
+
+    assert np.allclose(history.ring_temperatures, expected.ring_temperatures)
+    assert np.allclose(history.surface_temperatures, expected.surface_temperatures)
+
+
+def test_thermal_history_recorded_before_release(monkeypatch):
+    from pyroll.ring_model_thermal import Config
+
+    expected = solve_sequence().thermal_history
+
+    # collected after solution before the disk element profiles are released
+    monkeypatch.setattr(Config, "DISK_PROFILE_RETENTION", "boundaries")
+    assert np.all(np.isnan(solve_sequence().thermal_history.ring_temperatures[1:5]))
+
+    monkeypatch.setattr(Config, "THERMAL_HISTORY", True)
+    sequence = solve_sequence()
+    assert sequence._thermal_history is not None
+    assert np.allclose(sequence.thermal_history.ring_temperatures, expected.ring_temperatures)
+
+
+def test_export_npy(tmp_path):
+    from pyroll.ring_model_thermal.export import export_thermal_history, open_thermal_history
+
+    sequence = solve_sequence()
+    history = sequence.thermal_history
+    path = export_thermal_history(sequence, tmp_path / "history")
+
+    with open_thermal_history(path) as stored:
+        assert isinstance(stored.ring_temperatures, np.memmap)
+        assert len(stored) == len(history)
+        assert np.array_equal(stored.ring_temperatures, history.ring_temperatures)
+        assert np.array_equal(stored.unit_index, history.unit_index)
+        assert np.allclose(stored.ring_radii[1], sequence[1].out_profile.rings)
+        assert [u["label"] for u in stored.units] == ["A", "B"]
+        assert np.array_equal(stored.t[stored.unit_slice("B")], history.t[history.unit_mask(sequence[1])])
+
+
+def test_export_hdf5(tmp_path):
+    pytest.importorskip("h5py")
+    from pyroll.ring_model_thermal.export import export_thermal_history, open_thermal_history
+
+    sequence = solve_sequence()
+    path = export_thermal_history(sequence, tmp_path / "history.h5", file_format="hdf5")
+
+    with open_thermal_history(path) as stored:
+        assert np.array_equal(stored.ring_temperatures[2:4], sequence.thermal_history.ring_temperatures[2:4])
+        assert [u["label"] for u in stored.units] == ["A", "B"]
@@ -0,0 +1,45 @@
+import numpy as np
+
+from pyroll.core import Transport, PassSequence
+
+from conftest import create_round_profile
+
+
+def create_sequence():
+    sequence = PassSequence([
+        Transport(label="A", duration=5, disk_element_count=5, environment_temperature=293),
+        PassSequence([
+            Transport(label="B", duration=1, disk_element_count=5, environment_temperature=293),
+            Transport(label="C", duration=5, disk_element_count=5, environment_temperature=293),
+        ]),
+        Transport(label="D", duration=5, disk_element_count=5, environment_temperature=293),
+    ])
+    return sequence, create_round_profile()
+
+
+def test_resolve_downstream():
+    from pyroll.ring_model_thermal import changed_units, resolve_downstream
+
+    sequence, in_profile = create_sequence()
+    sequence.solve(in_profile)
+    a, (b, c), d = sequence
+    upstream_out_profile = a.out_profile
+
+    assert changed_units(sequence) == []
+    assert resolve_downstream(sequence) == []
+
+    b.heat_transfer_coefficient = 500
+    assert changed_units(sequence) == [b]
+    assert resolve_downstream(sequence) == [b, c, d]
+    assert changed_units(sequence) == []
+    assert a.out_profile is upstream_out_profile
+
+    expected, in_profile = create_sequence()
+    expected[1][0].heat_transfer_coefficient = 500
+    expected.solve(in_profile)
+
+    for u, e in zip([b, c, d], [expected[1][0], expected[1][1], expected[2]]):
+        assert np.allclose(u.out_profile.ring_temperatures, e.out_profile.ring_temperatures, atol=1e-2)
+
+    assert np.allclose(sequence.thermal_history.t, expected.thermal_history.t)
+    assert np.allclose(sequence.thermal_history.core_temperatures, expected.thermal_history.core_temperatures, atol=1e-2)
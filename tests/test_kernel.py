@@ -0,0 +1,56 @@
+import numpy as np
+
+from pyroll.ring_model_thermal.kernel import ring_increments
+
+rings = np.linspace(0, 10e-3, 11)
+boundaries = np.append(np.append(0, (rings[1:] + rings[:-1]) / 2), 10.5e-3)
+areas = np.pi * np.diff(boundaries ** 2)
+contour_lengths = 2 * np.pi * boundaries
+
+
+def increments(ring_temperatures, surface_heat_flux=0, source_density=0):
+    return ring_increments(
+        ring_temperatures,
+        duration=0.1,
+        density=7.5e3,
+        specific_heat_capacity=690,
+        thermal_conductivity=28,
+        areas=areas,
+        contour_lengths=contour_lengths,
+        spacings=np.diff(rings),
+        surface_heat_flux=surface_heat_flux,
+        source_density=source_density,
+    )
+
+
+def test_homogeneous_profile_stays():
+    assert np.allclose(increments(np.full_like(rings, 1000.0)), 0)
+
+
+def test_internal_conduction_conserves_energy():
+    ring_temperatures = 1000 + 200 * np.linspace(0, 1, len(rings)) ** 2
+    assert np.isclose(np.sum(increments(ring_temperatures) * areas), 0, atol=1e-12)
+
+
+def test_surface_heat_flux_balance():
+    inc = increments(np.full_like(rings, 1000.0), surface_heat_flux=-1e5, source_density=1e8)
+    energy = 7.5e3 * 690 * np.sum(inc * areas)
+    assert np.isclose(energy, 0.1 * (-1e5 * contour_lengths[-1] + 1e8 * np.sum(areas)))
+
+
+def test_ring_system_uses_same_kernel():
+    from pyroll.ring_model_thermal.kernel import RingSystem
+    from pyroll.ring_model_thermal.profile import RingGeometry
+
+    geometry = RingGeometry(
+        areas=areas, contour_lengths=contour_lengths, spacings=np.diff(rings), surface_distance=0.5e-3
+    )
+    system = RingSystem(
+        duration=0.1, density=7.5e3, specific_heat_capacity=690, thermal_conductivity=28, geometry=geometry,
+        surface_heat_flux=lambda ts: -1e5, surface_heat_flux_derivative=lambda ts: 0, source_density=1e8,
+    )
+    ring_temperatures = 1000 + 200 * np.linspace(0, 1, len(rings)) ** 2
+    expected = increments(ring_temperatures, surface_heat_flux=-1e5, source_density=1e8)
+
+    assert np.allclose(system.increments(ring_temperatures, 1000), expected)
+    assert np.allclose(system.increments(np.stack([ring_temperatures] * 3), np.full(3, 1000)), expected)
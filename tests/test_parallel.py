@@ -0,0 +1,86 @@
+import numpy as np
+
+from pyroll.core import Transport, PassSequence
+
+from conftest import create_round_profile
+
+
+def create_variant(duration, environment_temperature):
+    sequence = PassSequence([
+        Transport(label="A", duration=duration, disk_element_count=5, environment_temperature=environment_temperature),
+        Transport(label="B", duration=2, environment_temperature=environment_temperature),
+    ])
+    return sequence, create_round_profile()
+
+
+def test_solve_variants():
+    from pyroll.ring_model_thermal import solve_variants, parameter_grid
+
+    parameters = parameter_grid(dict(duration=[5, 10], environment_temperature=[293, 573]))
+    results = solve_variants(create_variant, parameters, processes=2)
+
+    assert len(parameters) == 4
+    assert results.parameters == parameters
+    assert np.all(results.success)
+    assert np.all(results.point_counts == 8)
+    assert results.core_temperatures.shape == (4, 8)
+
+    for i, p in enumerate(parameters):
+        sequence, in_profile = create_variant(**p)
+        sequence.solve(in_profile)
+        history = sequence.thermal_history
+
+        assert np.allclose(results.t[i], history.t)
+        assert np.allclose(results.surface_temperatures[i], history.surface_temperatures)
+        assert np.isclose(results.out_temperatures[i], sequence.out_profile.temperature)
+
+    # longer transport and colder environment cool more
+    assert results.out_temperatures[0] > results.out_temperatures[2]
+    assert results.out_temperatures[1] > results.out_temperatures[0]
+
+
+def test_solve_variants_failure():
+    from pyroll.ring_model_thermal import solve_variants
+
+    results = solve_variants(create_variant, [dict(duration=5, environment_temperature=293), dict(duration=-1)],
+                             processes=1)
+
+    assert list(results.success) == [True, False]
+    assert results.messages[1].startswith("TypeError")
+    assert np.all(np.isnan(results.mean_temperatures[1]))
+
+
+def test_solve_variants_first_failure():
+    from pyroll.ring_model_thermal import solve_variants
+
+    results = solve_variants(create_variant, [dict(duration=-1), dict(duration=5, environment_temperature=293)],
+                             processes=1)
+
+    assert list(results.success) == [False, True]
+    assert results.messages[0].startswith("TypeError")
+    assert list(results.point_counts) == [0, 8]
+    assert np.all(np.isnan(results.mean_temperatures[0]))
+    assert np.all(np.isfinite(results.mean_temperatures[1]))
+
+    results = solve_variants(create_variant, [dict(duration=-1)], processes=1)
+
+    assert list(results.success) == [False]
+    assert results.core_temperatures.shape == (1, 0)
+
+
+def failing_variant(path, index):
+    with open(path, "a") as f:
+        f.write(f"{index}\n")
+    raise ValueError("failed")
+
+
+def test_solve_variants_all_failing(tmp_path):
+    from pyroll.ring_model_thermal import solve_variants
+
+    path = tmp_path / "calls.txt"
+    results = solve_variants(failing_variant, [dict(path=path, index=i) for i in range(3)], processes=1)
+
+    assert not np.any(results.success)
+    assert all(m == "ValueError: failed" for m in results.messages)
+    # each variant solved only once
+    assert path.read_text().split() == ["0", "1", "2"]
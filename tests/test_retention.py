@@ -0,0 +1,25 @@
+import numpy as np
+import pytest
+
+
+@pytest.mark.parametrize("policy", ["boundaries", "history"])
+def test_disk_profile_retention(solve_transport, monkeypatch, policy):
+    from pyroll.ring_model_thermal import Config
+
+    reference = solve_transport()
+    expected = reference.ring_temperature_history
+
+    monkeypatch.setattr(Config, "DISK_PROFILE_RETENTION", policy)
+    transport = solve_transport()
+
+    assert all(d.in_profile is None and d.out_profile is None for d in transport.disk_elements)
+    assert np.allclose(transport.out_profile.ring_temperatures, reference.out_profile.ring_temperatures)
+
+    if policy == "history":
+        history = transport.ring_temperature_history
+        assert history.ring_temperatures.shape == (6, len(transport.out_profile.rings))
+        assert np.allclose(history.ring_temperatures, expected.ring_temperatures)
+        assert np.allclose(history.surface_temperatures, expected.surface_temperatures)
+        assert np.allclose(history.t, expected.t)
+    else:
+        assert not hasattr(transport, "ring_temperature_history")
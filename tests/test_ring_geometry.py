@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+
+import pyroll.ring_model_thermal
+from pyroll.core import Profile
+
+
+def test_ring_geometry():
+    p = Profile.round(diameter=30e-3, temperature=1200 + 273.15)
+    geometry = p.ring_geometry
+
+    assert geometry is p.ring_geometry
+    assert np.isclose(np.sum(geometry.areas), p.cross_section.area, rtol=1e-3)
+    assert len(geometry.contour_lengths) == len(geometry.areas) + 1
+    assert len(geometry.spacings) == len(geometry.areas) - 1
+    assert np.isclose(geometry.surface_distance, p.equivalent_radius - p.rings[-1])
+
+    with pytest.raises(ValueError):
+        geometry.areas[0] = 0
+
+
+def test_remap_ring_temperatures(monkeypatch):
+    from pyroll.ring_model import Config
+    from pyroll.ring_model_thermal.profile import remap_ring_temperatures, _area_coordinates
+
+    round_profile = Profile.round(diameter=30e-3, temperature=1200 + 273.15)
+    oval_profile = Profile.box(height=20e-3, width=40e-3, temperature=1200 + 273.15)
+    temperatures = 1200 + np.linspace(0, 1, len(round_profile.rings)) ** 2 * 100
+
+    shared = remap_ring_temperatures(round_profile, oval_profile, temperatures)
+    assert np.shares_memory(shared, temperatures)
+    assert not shared.flags.writeable
+
+    monkeypatch.setattr(Config, "RING_COUNT", 5)
+    coarse_profile = Profile.box(height=20e-3, width=40e-3, temperature=1200 + 273.15)
+    remapped = remap_ring_temperatures(round_profile, coarse_profile, temperatures)
+
+    assert len(remapped) == 5
+    assert np.isclose(
+        np.sum(remapped * np.diff(_area_coordinates(coarse_profile))),
+        np.sum(temperatures * np.diff(_area_coordinates(round_profile))),
+    )
+    assert np.all(np.diff(remapped) > 0)
+    assert np.allclose(remap_ring_temperatures(round_profile, coarse_profile, np.full_like(temperatures, 1000)), 1000)
+
+
+def test_transport_disks_share_geometry(solve_transport):
+    transport = solve_transport(disk_element_count=3)
+
+    for d in transport.disk_elements:
+        for p in [d.in_profile, d.out_profile]:
+            assert p.ring_geometry is transport.in_profile.ring_geometry
+            assert p.ring_sections is transport.in_profile.ring_sections
+
+    assert transport.out_profile.ring_contours is transport.in_profile.ring_contours
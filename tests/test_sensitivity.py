@@ -0,0 +1,92 @@
+import numpy as np
+import pytest
+
+from pyroll.core import Transport, PassSequence, RollPass, Roll, CircularOvalGroove, CoolingPipe
+
+from conftest import create_round_profile
+
+
+def solve_sequence(heat_transfer_coefficient=15, environment_temperature=293):
+    sequence = PassSequence([
+        Transport(label="A", duration=5, disk_element_count=5, environment_temperature=293,
+                  heat_transfer_coefficient=heat_transfer_coefficient, iteration_precision=1e-9),
+        Transport(label="B", duration=5, disk_element_count=5, environment_temperature=environment_temperature,
+                  heat_transfer_coefficient=500, iteration_precision=1e-9),
+    ], iteration_precision=1e-9)
+    sequence.solve(create_round_profile())
+    return sequence
+
+
+def outlet_temperatures(sequence):
+    p = sequence.out_profile
+    return np.array([p.core_temperature, p.surface_temperature, p.temperature])
+
+
+@pytest.mark.parametrize("coupling", [False, True])
+def test_sensitivities_match_finite_differences(monkeypatch, coupling):
+    from pyroll.ring_model_thermal import Config, temperature_sensitivities
+
+    monkeypatch.setattr(Config, "SURFACE_TEMPERATURE_COUPLING", coupling)
+    sequence = solve_sequence()
+    a, b = sequence
+
+    sensitivities = temperature_sensitivities(sequence, [(a, "heat_transfer_coefficient"), (b, "environment_temperature")])
+    assert sensitivities.ring_temperatures.shape == (2, len(sequence.out_profile.ring_temperatures))
+
+    with pytest.raises(ValueError, match="duration"):
+        temperature_sensitivities(sequence, [(b, "duration")])
+
+    base = outlet_temperatures(sequence)
+    for i, kwargs, h in [(0, dict(heat_transfer_coefficient=15.5), 0.5), (1, dict(environment_temperature=303), 10)]:
+        expected = (outlet_temperatures(solve_sequence(**kwargs)) - base) / h
+        actual = [
+            sensitivities.core_temperature[i], sensitivities.surface_temperature[i], sensitivities.mean_temperature[i]
+        ]
+        assert np.allclose(actual, expected, rtol=1e-2)
+
+
+def solve_rolling_sequence(roll_heat_transfer_coefficient=6000, cooling_heat_transfer_coefficient=4000):
+    sequence = PassSequence([
+        RollPass(
+            label="Oval I",
+            roll=Roll(
+                groove=CircularOvalGroove(depth=8e-3, r1=6e-3, r2=40e-3),
+                nominal_radius=160e-3,
+                rotational_frequency=1,
+                temperature=293,
+                heat_transfer_coefficient=roll_heat_transfer_coefficient,
+            ),
+            gap=2e-3,
+        ),
+        Transport(label="T", duration=2, disk_element_count=3, environment_temperature=293, iteration_precision=1e-9),
+        # without disk elements, whose heat transfer coefficient may be overridden by other test modules
+        CoolingPipe(label="CP", length=1.73, coolant_temperature=35 + 273.15,
+                    heat_transfer_coefficient=cooling_heat_transfer_coefficient, iteration_precision=1e-9),
+    ], iteration_precision=1e-9)
+    sequence.solve(create_round_profile(strain=0, material=["C45", "steel"], flow_stress=100e6))
+    return sequence
+
+
+@pytest.mark.parametrize("coupling", [False, True])
+def test_roll_and_cooling_pipe_sensitivities_match_finite_differences(monkeypatch, coupling):
+    from pyroll.ring_model_thermal import Config, temperature_sensitivities
+
+    monkeypatch.setattr(Config, "SURFACE_TEMPERATURE_COUPLING", coupling)
+    sequence = solve_rolling_sequence()
+    roll_pass, _, cooling_pipe = sequence
+
+    sensitivities = temperature_sensitivities(
+        sequence, [(roll_pass.roll, "heat_transfer_coefficient"), (cooling_pipe, "heat_transfer_coefficient")]
+    )
+
+    base = outlet_temperatures(sequence)
+    for i, kwargs, h in [
+        (0, dict(roll_heat_transfer_coefficient=6100), 100),
+        (1, dict(cooling_heat_transfer_coefficient=4010), 10),
+    ]:
+        expected = (outlet_temperatures(solve_rolling_sequence(**kwargs)) - base) / h
+        actual = [
+            sensitivities.core_temperature[i], sensitivities.surface_temperature[i], sensitivities.mean_temperature[i]
+        ]
+        assert np.all(np.array(actual) < 0)
+        assert np.allclose(actual, expected, rtol=1e-2)
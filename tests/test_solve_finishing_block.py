@@ -24,14 +24,8 @@ def yield_data_from_profiles(u: Unit, name):
                         yield getattr(ssu.in_profile, name, None)
                         yield getattr(ssu.out_profile, name, None)
 
-def test_solve(tmp_path: Path, caplog, monkeypatch):
-    caplog.set_level(logging.INFO, logger="pyroll")
-
-    from pyroll.ring_model import Config
-
-    monkeypatch.setattr(Config, "RING_COUNT", 20)
-
-    in_profile = Profile.round(
+def create_in_profile():
+    return Profile.round(
         diameter=17e-3,
         temperature=1050 + 273.15,
         strain=0,
@@ -43,7 +37,9 @@ def test_solve(tmp_path: Path, caplog, monkeypatch):
         global_position=0
     )
 
-    sequence = PassSequence([RollPass(
+
+def create_sequence(disk_element_count=20):
+    return PassSequence([RollPass(
         label="1",
         orientation="h",
         roll=Roll(
@@ -58,7 +54,7 @@ def test_solve(tmp_path: Path, caplog, monkeypatch):
         ),
         gap=1.8e-3,
         coulomb_friction_coefficient=0.4,
-        disk_element_count=20,
+        disk_element_count=disk_element_count,
     ),
         Transport(
             label="1 => 2",
@@ -80,7 +76,7 @@ def test_solve(tmp_path: Path, caplog, monkeypatch):
             ),
             gap=1.55e-3,
             coulomb_friction_coefficient=0.4,
-            disk_element_count=20
+            disk_element_count=disk_element_count
         ),
         Transport(
             label="2 => 3",
@@ -101,7 +97,7 @@ def test_solve(tmp_path: Path, caplog, monkeypatch):
             ),
             gap=1.4e-3,
             coulomb_friction_coefficient=0.4,
-            disk_element_count=20
+            disk_element_count=disk_element_count
         ),
         Transport(
             label="3 => 4",
@@ -123,7 +119,7 @@ def test_solve(tmp_path: Path, caplog, monkeypatch):
             ),
             gap=1.5e-3,
             coulomb_friction_coefficient=0.4,
-            disk_element_count=20
+            disk_element_count=disk_element_count
         ),
         Transport(
             label="4 => 5",
@@ -144,7 +140,7 @@ def test_solve(tmp_path: Path, caplog, monkeypatch):
             ),
             gap=1.45e-3,
             coulomb_friction_coefficient=0.4,
-            disk_element_count=20
+            disk_element_count=disk_element_count
         ),
         Transport(
             label="5 => 6",
@@ -166,7 +162,7 @@ def test_solve(tmp_path: Path, caplog, monkeypatch):
             ),
             gap=1.5e-3,
             coulomb_friction_coefficient=0.4,
-            disk_element_count=20
+            disk_element_count=disk_element_count
         ),
         Transport(
             label="6 => 7",
@@ -187,7 +183,7 @@ def test_solve(tmp_path: Path, caplog, monkeypatch):
             ),
             gap=1.4e-3,
             coulomb_friction_coefficient=0.4,
-            disk_element_count=20
+            disk_element_count=disk_element_count
         ),
         Transport(
             label="7 => 8",
@@ -209,7 +205,7 @@ def test_solve(tmp_path: Path, caplog, monkeypatch):
             ),
             gap=1.2e-3,
             coulomb_friction_coefficient=0.4,
-            disk_element_count=20
+            disk_element_count=disk_element_count
         ),
         Transport(
             label="8 => 9",
@@ -230,7 +226,7 @@ def test_solve(tmp_path: Path, caplog, monkeypatch):
             ),
             gap=1.25e-3,
             coulomb_friction_coefficient=0.4,
-            disk_element_count=20
+            disk_element_count=disk_element_count
         ),
         Transport(
             label="9 => 10",
@@ -252,11 +248,22 @@ def test_solve(tmp_path: Path, caplog, monkeypatch):
             ),
             gap=1e-3,
             coulomb_friction_coefficient=0.4,
-            disk_element_count=20
+            disk_element_count=disk_element_count
         )
 
     ])
 
+
+def test_solve(tmp_path: Path, caplog, monkeypatch):
+    caplog.set_level(logging.INFO, logger="pyroll")
+
+    from pyroll.ring_model import Config
+
+    monkeypatch.setattr(Config, "RING_COUNT", 20)
+
+    in_profile = create_in_profile()
+    sequence = create_sequence()
+
     try:
         sequence.solve(in_profile)
     finally:
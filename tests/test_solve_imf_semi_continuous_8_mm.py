@@ -13,15 +13,8 @@ def strain_rate(self: RollPass.DiskElement):
     return self.roll_pass.strain_rate
 
 
-def test_solve_imf_semi_continuous_8_mm(tmp_path: Path, caplog, monkeypatch):
-    caplog.set_level(logging.INFO, logger="pyroll")
-
-    import pyroll.ring_model_thermal
-    from pyroll.ring_model import Config
-
-    monkeypatch.setattr(Config, "RING_COUNT", 20)
-
-    in_profile = Profile.round(
+def create_in_profile():
+    return Profile.round(
         radius=24e-3,
         temperature=1200 + 273.15,
         strain=0,
@@ -32,7 +25,9 @@ def test_solve_imf_semi_continuous_8_mm(tmp_path: Path, caplog, monkeypatch):
         thermal_conductivity=23
     )
 
-    sequence = PassSequence([
+
+def create_sequence(disk_element_count=30):
+    return PassSequence([
         RollPass(
             label="K 02/001 - 1",
             roll=Roll(
@@ -49,12 +44,12 @@ def test_solve_imf_semi_continuous_8_mm(tmp_path: Path, caplog, monkeypatch):
             velocity=1,
             gap=13.5e-3,
             coulomb_friction_coefficient=0.4,
-            disk_element_count=30,
+            disk_element_count=disk_element_count,
         ),
         Transport(
             label="I -> II",
             duration=6.4,
-            disk_element_count=30,
+            disk_element_count=disk_element_count,
         ),
         RollPass(
             label="K 05/001 - 2",
@@ -70,12 +65,12 @@ def test_solve_imf_semi_continuous_8_mm(tmp_path: Path, caplog, monkeypatch):
             velocity=1,
             gap=1.5e-3,
             coulomb_friction_coefficient=0.4,
-            disk_element_count=30,
+            disk_element_count=disk_element_count,
         ),
         Transport(
             label="II -> III",
             duration=3.6,
-            disk_element_count=30,
+            disk_element_count=disk_element_count,
         ),
         RollPass(
             label="K 02/001 - 3",
@@ -93,12 +88,12 @@ def test_solve_imf_semi_continuous_8_mm(tmp_path: Path, caplog, monkeypatch):
             velocity=2,
             gap=1.5e-3,
             coulomb_friction_coefficient=0.4,
-            disk_element_count=30,
+            disk_element_count=disk_element_count,
         ),
         Transport(
             label="III -> IV",
             duration=3.4,
-            disk_element_count=30,
+            disk_element_count=disk_element_count,
         ),
         RollPass(
             label="K 05/002 - 4",
@@ -114,12 +109,12 @@ def test_solve_imf_semi_continuous_8_mm(tmp_path: Path, caplog, monkeypatch):
             velocity=2,
             gap=1e-3,
             coulomb_friction_coefficient=0.4,
-            disk_element_count=30,
+            disk_element_count=disk_element_count,
         ),
         Transport(
             label="IV -> V",
             duration=5.2,
-            disk_element_count=30,
+            disk_element_count=disk_element_count,
         ),
         RollPass(
             label="K 03/001 - 5",
@@ -135,12 +130,12 @@ def test_solve_imf_semi_continuous_8_mm(tmp_path: Path, caplog, monkeypatch):
             velocity=2,
             gap=5.4e-3,
             coulomb_friction_coefficient=0.4,
-            disk_element_count=30,
+            disk_element_count=disk_element_count,
         ),
         Transport(
             label="V -> VI",
             duration=4.4,
-            disk_element_count=30,
+            disk_element_count=disk_element_count,
         ),
         RollPass(
             label="K 05/003 - 6",
@@ -156,12 +151,12 @@ def test_solve_imf_semi_continuous_8_mm(tmp_path: Path, caplog, monkeypatch):
             velocity=2,
             gap=1.8e-3,
             coulomb_friction_coefficient=0.4,
-            disk_element_count=30,
+            disk_element_count=disk_element_count,
         ),
         Transport(
             label="VI -> VII",
             duration=3.8,
-            disk_element_count=30,
+            disk_element_count=disk_element_count,
         ),
         RollPass(
             label="K 03/001 - 7",
@@ -177,12 +172,12 @@ def test_solve_imf_semi_continuous_8_mm(tmp_path: Path, caplog, monkeypatch):
             velocity=2,
             gap=0.8e-3,
             coulomb_friction_coefficient=0.4,
-            disk_element_count=30,
+            disk_element_count=disk_element_count,
         ),
         Transport(
             label="VII -> IIX",
             duration=7.2,
-            disk_element_count=30,
+            disk_element_count=disk_element_count,
         ),
         RollPass(
             label="K 05/004 - 8",
@@ -198,12 +193,12 @@ def test_solve_imf_semi_continuous_8_mm(tmp_path: Path, caplog, monkeypatch):
             velocity=2,
             gap=3.8e-3,
             coulomb_friction_coefficient=0.4,
-            disk_element_count=30,
+            disk_element_count=disk_element_count,
         ),
         Transport(
             label="IIX -> IX",
             duration=6.2,
-            disk_element_count=30,
+            disk_element_count=disk_element_count,
         ),
         RollPass(
             label="K 03/002 - 9",
@@ -219,12 +214,12 @@ def test_solve_imf_semi_continuous_8_mm(tmp_path: Path, caplog, monkeypatch):
             velocity=2,
             gap=3.5e-3,
             coulomb_friction_coefficient=0.4,
-            disk_element_count=30,
+            disk_element_count=disk_element_count,
         ),
         Transport(
             label="IX -> X",
             duration=4.5,
-            disk_element_count=30,
+            disk_element_count=disk_element_count,
 
         ), RollPass(
             label="K 05/005 - 10",
@@ -240,12 +235,12 @@ def test_solve_imf_semi_continuous_8_mm(tmp_path: Path, caplog, monkeypatch):
             velocity=2,
             gap=4e-3,
             coulomb_friction_coefficient=0.4,
-            disk_element_count=30,
+            disk_element_count=disk_element_count,
         ),
         Transport(
             label="X -> XI",
             duration=9,
-            disk_element_count=30,
+            disk_element_count=disk_element_count,
         ),
         RollPass(
             label="F1 - K 3/50",
@@ -262,12 +257,12 @@ def test_solve_imf_semi_continuous_8_mm(tmp_path: Path, caplog, monkeypatch):
             velocity=4.89,
             gap=1.2e-3,
             coulomb_friction_coefficient=0.4,
-            disk_element_count=30,
+            disk_element_count=disk_element_count,
         ),
         Transport(
             label="XI -> XII",
             duration=1.5 / 4.89,
-            disk_element_count=30,
+            disk_element_count=disk_element_count,
         ),
         RollPass(
             label="F2 - K 9/24",
@@ -284,12 +279,12 @@ def test_solve_imf_semi_continuous_8_mm(tmp_path: Path, caplog, monkeypatch):
             velocity=6.1,
             gap=0.9e-3,
             coulomb_friction_coefficient=0.4,
-            disk_element_count=30,
+            disk_element_count=disk_element_count,
         ),
         Transport(
             label="XII -> XIII",
             duration=1.5 / 6.1,
-            disk_element_count=30,
+            disk_element_count=disk_element_count,
         ),
         RollPass(
             label="F3 - K3/51",
@@ -306,12 +301,12 @@ def test_solve_imf_semi_continuous_8_mm(tmp_path: Path, caplog, monkeypatch):
             velocity=7.91,
             gap=1.75e-3,
             coulomb_friction_coefficient=0.4,
-            disk_element_count=30,
+            disk_element_count=disk_element_count,
         ),
         Transport(
             label="XIII -> XIV",
             duration=1.5 / 7.91,
-            disk_element_count=30,
+            disk_element_count=disk_element_count,
         ),
         RollPass(
             label="F4 - K 9/23",
@@ -328,10 +323,22 @@ def test_solve_imf_semi_continuous_8_mm(tmp_path: Path, caplog, monkeypatch):
             velocity=10,
             gap=1.5e-3,
             coulomb_friction_coefficient=0.4,
-            disk_element_count=30,
+            disk_element_count=disk_element_count,
         ),
     ])
 
+
+def test_solve_imf_semi_continuous_8_mm(tmp_path: Path, caplog, monkeypatch):
+    caplog.set_level(logging.INFO, logger="pyroll")
+
+    import pyroll.ring_model_thermal
+    from pyroll.ring_model import Config
+
+    monkeypatch.setattr(Config, "RING_COUNT", 20)
+
+    in_profile = create_in_profile()
+    sequence = create_sequence()
+
     try:
         sequence.solve(in_profile)
     finally:
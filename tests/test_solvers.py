@@ -0,0 +1,377 @@
+import numpy as np
+import pytest
+import scipy.linalg
+
+from pyroll.ring_model_thermal import Config
+from pyroll.ring_model_thermal.kernel import ring_increments, ring_increments_jacobian, RingSystem
+from pyroll.ring_model_thermal.profile import RingGeometry
+from pyroll.ring_model_thermal.solvers import SOLVERS, StepProblem, phi1_propagator, solve_step
+
+from conftest import create_round_profile
+
+rings = np.linspace(0, 10e-3, 21)
+boundaries = np.append(np.append(0, (rings[1:] + rings[:-1]) / 2), 10.25e-3)
+areas = np.pi * np.diff(boundaries ** 2)
+contour_lengths = 2 * np.pi * boundaries
+in_ring_temperatures = 1000 + 200 * np.linspace(0, 1, len(rings)) ** 2
+
+material = dict(
+    duration=0.5,
+    density=7.5e3,
+    specific_heat_capacity=690,
+    thermal_conductivity=28,
+    areas=areas,
+    contour_lengths=contour_lengths,
+    spacings=np.diff(rings),
+)
+
+
+def surface_heat_flux(t):
+    return 1e3 * (300 - t[-1]) + 5.67e-8 * 0.8 * (300 ** 4 - t[-1] ** 4)
+
+
+def surface_heat_flux_derivative(t):
+    return -1e3 - 4 * 5.67e-8 * 0.8 * t[-1] ** 3
+
+
+def increments(t):
+    return ring_increments(t, surface_heat_flux=surface_heat_flux(t), **material)
+
+
+def jacobian(t):
+    return ring_increments_jacobian(surface_heat_flux_derivative=surface_heat_flux_derivative(t), **material)
+
+
+def test_jacobian_matches_finite_differences():
+    banded = jacobian(in_ring_temperatures)
+    dense = np.diag(banded[1]) + np.diag(banded[0, 1:], 1) + np.diag(banded[2, :-1], -1)
+
+    h = 1e-3
+    fd = np.column_stack([
+        (increments(in_ring_temperatures + h * e) - increments(in_ring_temperatures - h * e)) / (2 * h)
+        for e in np.eye(len(rings))
+    ])
+
+    assert np.allclose(dense, fd, rtol=1e-5, atol=1e-9)
+
+
+def solve(name, scale=1, **kwargs):
+    problem = StepProblem(in_ring_temperatures, lambda t: scale * increments(t), lambda t: scale * jacobian(t))
+    options = dict(absolute_tolerance=1e-6, relative_tolerance=1.49012e-08, max_iterations=200) | kwargs
+    return SOLVERS[name](problem, x0=problem.increments(in_ring_temperatures), **options)
+
+
+def test_banded_newton_matches_hybr():
+    hybr = solve("hybr")
+    newton = solve("banded_newton")
+
+    assert hybr.success and newton.success
+    assert newton.nfev < hybr.nfev
+    assert np.allclose(newton.x, hybr.x, atol=1e-5)
+
+
+@pytest.mark.parametrize("name", ["crank_nicolson", "explicit", "exponential"])
+def test_other_backends_close_to_implicit(name):
+    implicit = solve("banded_newton", scale=0.001)
+    sol = solve(name, scale=0.001)
+
+    assert sol.success
+    assert np.allclose(sol.x, implicit.x, atol=0.02 * np.max(np.abs(implicit.x)))
+
+
+def test_explicit_iteration_limit():
+    assert not solve("explicit", max_iterations=1).success
+
+
+def test_failure_recorded_in_stats():
+    from pyroll.core import Transport
+
+    transport = Transport(duration=10, thermal_solver="explicit", thermal_solver_max_iterations=1)
+    with pytest.raises(RuntimeError):
+        solve_step(transport, in_ring_temperatures, increments, jacobian)
+
+    assert transport.thermal_solver_stats.failures == 1
+    assert transport.thermal_solver_stats.solves == 1
+
+
+def test_exponential_exact_for_linear_conduction():
+    problem = StepProblem(
+        in_ring_temperatures,
+        lambda t: ring_increments(t, surface_heat_flux=-1e5, **material),
+        lambda t: ring_increments_jacobian(**material),
+    )
+    sol = SOLVERS["exponential"](problem)
+
+    banded = problem.jacobian(in_ring_temperatures)
+    augmented = np.zeros((len(rings) + 1, len(rings) + 1))
+    augmented[:-1, :-1] = np.diag(banded[1]) + np.diag(banded[0, 1:], 1) + np.diag(banded[2, :-1], -1)
+    augmented[:-1, -1] = problem.increments(in_ring_temperatures)
+    exact = scipy.linalg.expm(augmented)[:-1, -1]
+
+    assert sol.success
+    assert np.allclose(sol.x, exact, rtol=1e-8, atol=1e-8)
+    assert phi1_propagator(banded) is phi1_propagator(banded.copy())
+
+
+def ring_system():
+    geometry = RingGeometry(areas, contour_lengths, np.diff(rings), 0.25e-3)
+    return RingSystem(
+        geometry=geometry,
+        surface_heat_flux=lambda ts: surface_heat_flux([ts]),
+        surface_heat_flux_derivative=lambda ts: surface_heat_flux_derivative([ts]),
+        **{k: v for k, v in material.items() if k not in ["areas", "contour_lengths", "spacings"]}
+    )
+
+
+def test_coupled_jacobian_matches_finite_differences():
+    system = ring_system()
+    state = np.append(in_ring_temperatures, 1150)
+    banded = system.coupled_jacobian(state)
+    dense = np.diag(banded[1]) + np.diag(banded[0, 1:], 1) + np.diag(banded[2, :-1], -1)
+
+    h = 1e-3
+    fd = np.column_stack([
+        (system.coupled_increments(state + h * e) - system.coupled_increments(state - h * e)) / (2 * h)
+        for e in np.eye(len(state))
+    ])
+
+    assert np.allclose(dense, fd, rtol=1e-5, atol=1e-9)
+
+
+@pytest.mark.parametrize("buffered", [False, True])
+@pytest.mark.parametrize("name", ["hybr", "banded_newton", "crank_nicolson", "explicit", "exponential"])
+def test_coupled_surface_balance_solved(name, buffered):
+    system = ring_system().rescaled(0.005)
+    problem = StepProblem(
+        np.append(in_ring_temperatures, in_ring_temperatures[-1]),
+        system.coupled_increments, system.coupled_jacobian, algebraic=1, buffered=buffered
+    )
+    sol = SOLVERS[name](
+        problem, x0=np.zeros(len(rings) + 1), absolute_tolerance=1e-6, relative_tolerance=1.49012e-08,
+        max_iterations=200
+    )
+    out = problem.in_state + sol.x
+
+    assert sol.success
+    assert np.isclose(system.surface_balance(out[-2], out[-1]), 0, atol=1e-3)
+    assert np.isclose(out[-1], system.surface_temperature(out[-2]))
+
+
+def test_buffered_residual():
+    system = ring_system()
+    in_state = np.append(in_ring_temperatures, 1150)
+    problem = StepProblem(in_state, system.coupled_increments, system.coupled_jacobian, algebraic=1)
+    buffered = StepProblem(in_state, system.coupled_increments, system.coupled_jacobian, algebraic=1, buffered=True)
+    x = np.linspace(-1, 1, len(in_state))
+
+    r = buffered.residual(x)
+    assert np.array_equal(r, problem.residual(x))
+    assert buffered.residual(2 * x) is r
+    assert np.array_equal(r, problem.residual(2 * x))
+    assert np.array_equal(buffered.residual_jacobian(x), problem.residual_jacobian(x))
+
+
+def test_warm_start_saves_iterations(solve_transport, monkeypatch):
+    warm = solve_transport()
+
+    monkeypatch.setattr(Config, "THERMAL_SOLVER_WARM_START", False)
+    cold = solve_transport()
+
+    assert np.allclose(warm.out_profile.ring_temperatures, cold.out_profile.ring_temperatures, atol=1e-3)
+    assert warm.thermal_solver_iterations < cold.thermal_solver_iterations
+
+
+def test_warm_start_scaled_to_step_duration(solve_transport):
+    import scipy.optimize as scopt
+    from pyroll.ring_model_thermal.solvers import StepProblem, _initial_guess
+
+    transport = solve_transport()
+    problem = StepProblem(np.zeros(3), lambda t: np.zeros(3), lambda t: np.zeros((3, 3)))
+
+    transport._thermal_solution = scopt.OptimizeResult(x=np.ones(3), duration=2.0)
+    assert np.allclose(_initial_guess(transport, problem, 0.5), 0.25)
+    assert np.allclose(_initial_guess(transport, problem), 1)
+
+
+def test_thermal_solver_stats(solve_transport):
+    transport = solve_transport()
+    stats = transport.thermal_solver_stats
+
+    assert stats.solves >= len(transport.disk_elements)
+    assert stats.failures == 0
+    assert stats.iterations == transport.thermal_solver_iterations
+    assert stats.function_evaluations >= stats.iterations
+    assert stats.surface_iterations > 0
+    assert stats.wall_time > 0
+    assert stats.residual_norm < 1e-6
+
+    assert stats.solves == sum(d.thermal_solver_stats.solves for d in transport.disk_elements)
+
+
+def test_fused_disk_marching(solve_transport, monkeypatch):
+    separate = solve_transport()
+
+    monkeypatch.setattr(Config, "FUSED_DISK_MARCHING", True)
+    fused = solve_transport()
+
+    for s, f in zip(separate.disk_elements, fused.disk_elements):
+        assert np.allclose(s.out_profile.ring_temperatures, f.out_profile.ring_temperatures, atol=0.5)
+        assert np.isclose(s.out_profile.surface_temperature, f.out_profile.surface_temperature, atol=0.5)
+        assert np.isclose(s.out_profile.t, f.out_profile.t)
+        assert f.out_profile.cross_section is fused.in_profile.cross_section
+
+        # the profiles are filled from the march without running the solution loops of the disk elements
+        assert s.convergence_history
+        assert not f.convergence_history
+
+    assert np.isclose(fused.out_profile.surface_temperature, separate.out_profile.surface_temperature, atol=0.5)
+
+    from pyroll.ring_model_thermal.transport import _fused_march
+
+    result = _fused_march(fused)
+    assert _fused_march(fused) is result
+
+    # the march is repeated for changed material properties or solver settings
+    fused.in_profile.thermal_conductivity = 40
+    conductive = _fused_march(fused)
+    assert conductive is not result
+    assert conductive[-1, 0] < result[-1, 0]
+
+    fused.thermal_solver = "banded_newton"
+    assert _fused_march(fused) is not conductive
+
+
+def test_surface_temperature_coupling(solve_transport, monkeypatch):
+    lagged = solve_transport()
+
+    monkeypatch.setattr(Config, "SURFACE_TEMPERATURE_COUPLING", True)
+    coupled = solve_transport()
+
+    assert np.allclose(lagged.out_profile.ring_temperatures, coupled.out_profile.ring_temperatures, atol=0.5)
+    assert np.isclose(lagged.out_profile.surface_temperature, coupled.out_profile.surface_temperature, atol=0.5)
+
+
+def test_surface_temperature_coupling_keeps_roll_pass_model(monkeypatch):
+    from pyroll.core import RollPass, Roll, CircularOvalGroove
+
+    def solve_roll_pass():
+        roll_pass = RollPass(
+            roll=Roll(
+                groove=CircularOvalGroove(depth=8e-3, r1=6e-3, r2=40e-3),
+                nominal_radius=160e-3,
+                rotational_frequency=1,
+                temperature=293,
+            ),
+            gap=2e-3,
+            disk_element_count=3,
+        )
+        roll_pass.solve(create_round_profile(strain=0, material=["C45", "steel"], flow_stress=100e6))
+        return roll_pass
+
+    lagged = solve_roll_pass()
+
+    # roll passes take the surface temperature of the in profile as boundary condition in both cases
+    monkeypatch.setattr(Config, "SURFACE_TEMPERATURE_COUPLING", True)
+    coupled = solve_roll_pass()
+
+    assert np.allclose(lagged.out_profile.ring_temperatures, coupled.out_profile.ring_temperatures, atol=1e-3)
+    assert np.isclose(lagged.out_profile.surface_temperature, coupled.out_profile.surface_temperature, atol=1e-3)
+
+
+def test_adaptive_time_stepping(solve_transport, monkeypatch):
+    monkeypatch.setattr(Config, "FUSED_DISK_MARCHING", True)
+    fine = solve_transport(duration=65, disk_element_count=200)
+    coarse = solve_transport(duration=65, disk_element_count=5)
+
+    monkeypatch.setattr(Config, "ADAPTIVE_TIME_STEPPING", True)
+    adaptive = solve_transport(duration=65, disk_element_count=5)
+
+    error = np.max(np.abs(adaptive.out_profile.ring_temperatures - fine.out_profile.ring_temperatures))
+    coarse_error = np.max(np.abs(coarse.out_profile.ring_temperatures - fine.out_profile.ring_temperatures))
+    assert error < 0.5
+    assert error < coarse_error / 10
+
+
+def test_step_cache(solve_transport, monkeypatch):
+    from pyroll.ring_model_thermal.step_cache import step_cache_info, clear_step_cache
+
+    expected = solve_transport()
+
+    monkeypatch.setattr(Config, "STEP_CACHE", True)
+    clear_step_cache()
+    first = solve_transport()
+    misses = step_cache_info().misses
+
+    second = solve_transport()
+    info = step_cache_info()
+
+    assert info.hits >= len(second.disk_elements)
+    assert info.misses == misses
+    assert second.thermal_solver_stats.solves == 0
+    assert np.allclose(first.out_profile.ring_temperatures, expected.out_profile.ring_temperatures)
+    assert np.array_equal(second.out_profile.ring_temperatures, first.out_profile.ring_temperatures)
+
+    monkeypatch.setattr(Config, "STEP_CACHE_SIZE", 2)
+    solve_transport(duration=3)
+    assert step_cache_info().size == 2
+    assert step_cache_info().evictions > 0
+
+    clear_step_cache()
+
+
+def test_persistent_step_cache(solve_transport, monkeypatch, tmp_path):
+    from pyroll.ring_model_thermal.step_cache import step_cache_info, clear_step_cache
+
+    monkeypatch.setattr(Config, "STEP_CACHE", True)
+    monkeypatch.setattr(Config, "STEP_CACHE_PATH", str(tmp_path / "steps.sqlite"))
+    monkeypatch.setattr(Config, "STEP_CACHE_PERSISTENT_SIZE", 1000)
+    clear_step_cache()
+    first = solve_transport()
+
+    # a new run starts with an empty memory
+    clear_step_cache()
+    second = solve_transport()
+    info = step_cache_info()
+
+    assert info.misses == 0
+    assert info.persistent_hits == info.size > 0
+    assert second.thermal_solver_stats.solves == 0
+    assert np.array_equal(second.out_profile.ring_temperatures, first.out_profile.ring_temperatures)
+
+    clear_step_cache(persistent=True)
+    solve_transport()
+    assert step_cache_info().persistent_hits == 0
+
+    clear_step_cache()
+
+
+def test_persistent_step_cache_eviction(solve_transport, monkeypatch, tmp_path):
+    from pyroll.ring_model_thermal import step_cache
+    from pyroll.ring_model_thermal.step_cache import step_cache_info, clear_step_cache
+
+    monkeypatch.setattr(Config, "STEP_CACHE", True)
+    monkeypatch.setattr(Config, "STEP_CACHE_PATH", str(tmp_path / "steps.sqlite"))
+    monkeypatch.setattr(Config, "STEP_CACHE_PERSISTENT_SIZE", 4)
+    monkeypatch.setattr(step_cache, "EVICTION_INTERVAL", 3)
+    clear_step_cache(persistent=True)
+
+    solve_transport(disk_element_count=10)
+    database = step_cache._database()
+    count = database.connection.execute("SELECT COUNT(*) FROM steps").fetchone()[0]
+
+    assert 4 <= count < 4 + 3
+    assert step_cache_info().evictions > 0
+
+    # usage times of hits are written back in batches
+    monkeypatch.setattr(step_cache, "EVICTION_INTERVAL", 1000)
+    clear_step_cache(persistent=True)
+    solve_transport(disk_element_count=10)
+    clear_step_cache()
+    solve_transport(disk_element_count=10)
+    assert step_cache_info().misses == 0
+    assert database.used
+
+    database.close()
+    assert not database.used
+
+    clear_step_cache(persistent=True)
@@ -0,0 +1,36 @@
+import numpy as np
+
+
+def test_surface_temperature_memoized(solve_transport, monkeypatch):
+    from pyroll.ring_model_thermal import surface
+
+    transport = solve_transport()
+    p = transport.out_profile
+    expected = surface.memoized_surface_temperature(p)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("Newton's method should not run again.")
+
+    monkeypatch.setattr(surface, "solve_surface_temperature", fail)
+    assert surface.memoized_surface_temperature(p) == expected
+
+    monkeypatch.undo()
+    transport.environment_temperature = 600
+    assert surface.memoized_surface_temperature(p) > expected
+
+
+def test_surface_temperatures_batched(solve_transport):
+    from pyroll.ring_model_thermal import surface
+
+    transport = solve_transport()
+    profiles = [d.out_profile for d in transport.disk_elements]
+    expected = [surface.memoized_surface_temperature(p) for p in profiles]
+
+    assert np.allclose(surface.surface_temperatures(profiles), [p.surface_temperature for p in profiles])
+
+    for p in profiles:
+        del p.__dict__["surface_temperature"]
+        del p.__dict__["_surface_temperature_memo"]
+
+    assert np.allclose(surface.surface_temperatures(profiles), expected, rtol=1e-10)
+    assert np.allclose(surface.surface_temperatures(profiles), expected, rtol=1e-10)